@@ -0,0 +1,92 @@
+"""Benchmark of the committee classification of acts.
+
+Segments the acts of the DODFs in a folder, repeats them up to the
+requested number of acts, and times the committee steps: the embedding,
+with a cold and a warm stemming cache, the predictions of the
+classifiers, one after the other and in parallel, and the majority
+vote, row by row and vectorized.
+
+Usage example::
+
+    python benchmarks/committee.py dodfs/2021 -n 5000 -j 3
+
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from dodfminer.extract.polished.core import _acts_ids
+from dodfminer.extract.polished.helper import extract_multiple, get_files_path
+from dodfminer.extract.polished.acts.type_classification.committee import Committee, majority_vote
+
+MODELS_PATH = os.path.join(os.path.dirname(__file__), '..', 'dodfminer', 'extract',
+                           'polished', 'acts', 'type_classification', 'models', 'models.pkl')
+
+
+def _row_vote(results, labels):
+    """The majority vote with np.unique on each act."""
+    new_types = []
+    for i, _ in enumerate(results):
+        results_dict = dict(zip(*np.unique(results[i], return_counts=True)))
+        res_max = max(results_dict, key=results_dict.get)
+        if results_dict[res_max] >= 0.5 and res_max != labels[i]:
+            new_types.append(res_max)
+        else:
+            new_types.append(labels[i])
+    return new_types
+
+
+def _acts(folder, size):
+    files = get_files_path(folder, 'txt') + get_files_path(folder, 'json')
+    acts = []
+    for act_type in _acts_ids:
+        dataframe = extract_multiple(files, act_type, 'regex')
+        if 'text' in dataframe:
+            acts.append(pd.DataFrame({'text': dataframe['text'], 'type': act_type}))
+    acts = pd.concat(acts, ignore_index=True)
+    if len(acts) == 0:
+        raise SystemExit(f"no act found in {folder}")
+    repeat = -(-size // len(acts))
+    return pd.concat([acts] * repeat, ignore_index=True).iloc[:size]
+
+
+def _timed(name, function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    print(f"{name:>22}: {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('input_folder', help='Folder with the DODFs texts or JSONs')
+    parser.add_argument('-n', '--acts', type=int, default=5000,
+                        help='Number of acts classified')
+    parser.add_argument('-j', '--jobs', type=int, default=3,
+                        help='Classifiers predicting in parallel')
+    args = parser.parse_args()
+
+    acts = _acts(args.input_folder, args.acts)
+    print(f"{len(acts)} acts")
+
+    committee = Committee(MODELS_PATH)
+    text = committee.remove_not_words(acts['text'])
+    _timed('embedding, cold cache', committee.embedding, text)
+    embedded = _timed('embedding, warm cache', committee.embedding, text)
+
+    results = _timed('predict, sequential', committee.predict, embedded)
+    committee.n_jobs = args.jobs
+    _timed(f'predict, {args.jobs} jobs', committee.predict, embedded)
+
+    labels = list(acts['type'])
+    expected = _timed('vote, row by row', _row_vote, results, labels)
+    voted = _timed('vote, vectorized', majority_vote, results, labels)
+    assert voted == expected
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark of the end-to-end PDF to CSV act extraction.
+
+Compares the default extraction, which writes a .txt file for each DODF
+before reading it back once per act type, with the in-memory fast path.
+
+Usage example::
+
+    python benchmarks/pdf_to_csv.py tests/support/polished -a nomeacao exoneracao
+
+"""
+
+import argparse
+import glob
+import os
+import shutil
+import tempfile
+import time
+
+from dodfminer.extract.polished.helper import extract_multiple_acts
+from dodfminer.extract.polished.helper import extract_multiple_acts_in_memory
+
+
+def _copy_pdfs(pdfs, folder):
+    for pdf in pdfs:
+        shutil.copy(pdf, folder)
+
+
+def _run(function, pdfs, types, backend, repeat):
+    times = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as folder:
+            _copy_pdfs(pdfs, folder)
+            start = time.perf_counter()
+            function(folder, types, backend)
+            times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('input_folder', help='Folder with the DODFs PDFs')
+    parser.add_argument('-a', '--act', nargs='*', default=[],
+                        help='Act types to extract, all by default')
+    parser.add_argument('-b', '--backend', default='regex',
+                        choices=['regex', 'ner'])
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='Runs of each path, the fastest is reported')
+    args = parser.parse_args()
+
+    pdfs = sorted(glob.glob(os.path.join(args.input_folder, '*.pdf')))
+    if not pdfs:
+        parser.error(f"no PDF found in {args.input_folder}")
+
+    paths = [('txt files', extract_multiple_acts),
+             ('in memory', extract_multiple_acts_in_memory)]
+    for name, function in paths:
+        elapsed = _run(function, pdfs, args.act, args.backend, args.repeat)
+        print(f"{name:>10}: {elapsed:8.3f}s  "
+              f"{len(pdfs) / elapsed:8.2f} PDFs/s")
+
+
+if __name__ == '__main__':
+    main()
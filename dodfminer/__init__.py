@@ -1,7 +1,34 @@
-try:
-    from dodfminer.extract.polished import acts
-    from dodfminer.downloader.core import Downloader
-    from dodfminer.extract.polished.core import ActsExtractor
-    from dodfminer.extract.pure.core import ContentExtractor
-except ModuleNotFoundError:
-    pass
+"""DODFMiner package.
+
+The library entry points are imported on first access, so the command
+line and the modules that do not need the extraction stack start
+without loading it.
+"""
+
+import importlib
+
+_LAZY = {
+    'acts': ('dodfminer.extract.polished', 'acts'),
+    'Downloader': ('dodfminer.downloader.core', 'Downloader'),
+    'ActsExtractor': ('dodfminer.extract.polished.core', 'ActsExtractor'),
+    'ContentExtractor': ('dodfminer.extract.pure.core', 'ContentExtractor'),
+    'ExtractionEngine': ('dodfminer.extract.polished.engine', 'ExtractionEngine'),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attr = _LAZY[name]
+    if attr == 'acts':
+        value = importlib.import_module(f"{module}.{attr}")
+    else:
+        value = getattr(importlib.import_module(module), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
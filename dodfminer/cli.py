@@ -51,6 +51,10 @@ class CLI():
         titles_with_boxes (bool): Enable extraction in titles with boxes mode.
                                   Defaults to False.
         save_path (str): Save path of the download. Defaults to './data'.
+        workers (int): Number of simultaneous downloads. Defaults to 4.
+        max_per_host (int): Simultaneous downloads from a single host.
+                            Defaults to 4.
+        retries (int): Attempts of each download request. Defaults to 5.
         input_folder (str): Path where the extractor should look to files.
                             Defaults to './data'.
 
@@ -70,7 +74,14 @@ class CLI():
         self.file_type = "pdf"
         self.download_parser = None
         self.extract_content_parser = None
+        self.sync_parser = None
+        self.prefetch_parser = None
+        self.convert_parser = None
+        self.serve_parser = None
         self.url = 'https://www.dodf.df.gov.br/index/jornal-json'
+        self.workers = 4
+        self.max_per_host = 4
+        self.retries = 5
 
     @classmethod
     def _new_group(cls, name, subparser):
@@ -115,6 +126,146 @@ class CLI():
         self.download_parser.add_argument('-url', dest='url', default=self.url,
                                           type=str, help=help_text)
 
+        help_text = 'Compression of the downloaded JSON file.'
+        self.download_parser.add_argument('-c', '--compress', dest='compress',
+                                          default=None, type=str,
+                                          choices=['gzip', 'zstd'],
+                                          help=help_text)
+
+        help_text = 'Number of PDFs downloaded at the same time.'
+        self.download_parser.add_argument('-w', '--workers', dest='workers',
+                                          default=self.workers, type=int,
+                                          help=help_text)
+
+        help_text = 'Maximum simultaneous downloads from a single host.'
+        self.download_parser.add_argument('-mh', '--max_per_host',
+                                          dest='max_per_host',
+                                          default=self.max_per_host, type=int,
+                                          help=help_text)
+
+        help_text = 'Attempts of each request before giving up.'
+        self.download_parser.add_argument('-r', '--retries', dest='retries',
+                                          default=self.retries, type=int,
+                                          help=help_text)
+
+        help_text = 'Maximum requests per second, unlimited by default.'
+        self.download_parser.add_argument('-rl', '--rate_limit',
+                                          dest='rate_limit', default=None,
+                                          type=float, help=help_text)
+
+        help_text = 'Seconds above which a download shrinks the host limit.'
+        self.download_parser.add_argument('-lt', '--latency_target',
+                                          dest='latency_target', default=None,
+                                          type=float, help=help_text)
+
+    def _sync_parser(self):
+        """Create parser for the download and extraction pipeline configs."""
+        self.sync_parser = self.subparsers.add_parser("sync")
+
+        group = self._new_group('Download Configs', self.sync_parser)
+
+        group.add_argument('-sp', '--save_path', dest='save_path',
+                           default=self.save_path, type=str,
+                           help='Folder to output the download DODFs')
+
+        group.add_argument('-sd', '--start_date', dest='start_date',
+                           default=self.def_start_date, type=str,
+                           help='Input the date in either mm/yyyy or mm-yyyy.')
+
+        group.add_argument('-ed', '--end_date', dest='end_date',
+                           default=self.def_end_date, type=str,
+                           help='Input the date in either mm/yyyy or mm-yyyy.')
+
+        group.add_argument('-w', '--workers', dest='workers',
+                           default=self.workers, type=int,
+                           help='Number of PDFs downloaded at the same time.')
+
+        group.add_argument('-mh', '--max_per_host', dest='max_per_host',
+                           default=self.max_per_host, type=int,
+                           help='Maximum simultaneous downloads from a single host.')
+
+        group.add_argument('-r', '--retries', dest='retries',
+                           default=self.retries, type=int,
+                           help='Attempts of each request before giving up.')
+
+        group.add_argument('-rl', '--rate_limit', dest='rate_limit',
+                           default=None, type=float,
+                           help='Maximum requests per second, unlimited by default.')
+
+        group.add_argument('-lt', '--latency_target', dest='latency_target',
+                           default=None, type=float,
+                           help='Seconds above which a download shrinks the host limit.')
+
+        group = self._new_group('Extraction Configs', self.sync_parser)
+
+        group.add_argument('-a', '--act', dest='act', default=[], type=str,
+                           choices=act_choices, nargs='*',
+                           help='Which acts to extract to CSV, all by default')
+
+        group.add_argument('-b', '--backend', dest='backend', default='regex',
+                           type=str, choices=['regex', 'ner'],
+                           help="The backend to be used in CSV extraction")
+
+        group.add_argument('-ew', '--extract-workers', dest='extract_workers',
+                           default=2, type=int,
+                           help='Number of PDFs extracted at the same time')
+
+        group.add_argument('-q', '--queue-size', dest='queue_size',
+                           default=8, type=int,
+                           help='Maximum number of PDFs waiting for extraction')
+
+        group.add_argument('--processes', dest='processes', action='store_true',
+                           help='Extract in worker processes instead of threads')
+
+    def _prefetch_parser(self):
+        """Create parser for the NLTK resources download configs."""
+        self.prefetch_parser = self.subparsers.add_parser("prefetch")
+
+        help_text = 'Folder to save the NLTK resources used by the extraction.'
+        self.prefetch_parser.add_argument('-d', '--data_path', dest='data_path',
+                                          default='./nltk_data', type=str,
+                                          help=help_text)
+
+    def _convert_parser(self):
+        """Create parser for the CRF models conversion configs."""
+        self.convert_parser = self.subparsers.add_parser("convert")
+
+        help_text = 'Folder with the models and seg_models folders of the acts.'
+        self.convert_parser.add_argument('-p', '--models_path', dest='models_path',
+                                         default=None, type=str,
+                                         help=help_text)
+
+    def _serve_parser(self):
+        """Create parser for the local extraction service configs."""
+        self.serve_parser = self.subparsers.add_parser("serve")
+
+        group = self._new_group('Service Configs', self.serve_parser)
+
+        group.add_argument('-H', '--host', dest='host', default='127.0.0.1',
+                           type=str, help='Address the service listens on')
+
+        group.add_argument('-p', '--port', dest='port', default=8000, type=int,
+                           help='TCP port the service listens on')
+
+        group.add_argument('-u', '--unix-socket', dest='unix_socket', default=None,
+                           type=str, help='Unix socket to listen on, instead of the port')
+
+        group.add_argument('-mb', '--max-batch', dest='max_batch', default=16, type=int,
+                           help='Maximum number of documents extracted in a batch')
+
+        group.add_argument('-mw', '--max-wait', dest='max_wait', default=5.0, type=float,
+                           help='Milliseconds a batch waits for more documents')
+
+        group = self._new_group('Extraction Configs', self.serve_parser)
+
+        group.add_argument('-a', '--act', dest='act', default=[], type=str,
+                           choices=act_choices, nargs='*',
+                           help='Acts extracted by default, all by default')
+
+        group.add_argument('-b', '--backend', dest='backend', default='regex',
+                           type=str, choices=['regex', 'ner'],
+                           help="The backend to be used in the extraction")
+
     def _extract_content_parser(self):
         """Create parser for extraction configs."""
         self.extract_content_parser = self.subparsers.add_parser("extract")
@@ -132,7 +283,8 @@ class CLI():
 
         group.add_argument('-t', '--type-of-extraction', dest='type_of_extr',
                            default=None, type=str, nargs='?',
-                           choices=['pure-text', 'blocks', 'with-titles'],
+                           choices=['pure-text', 'blocks', 'with-titles',
+                                    'compact-blocks'],
                            help="Type of text extraction")
 
         group.add_argument('-a', '--act', dest='act', default='all', type=str,
@@ -146,6 +298,9 @@ class CLI():
         group.add_argument('-c', '--committee', dest='committee', action='store_true',
                            help="Use committee classification for acts")
 
+        group.add_argument('--in-memory', dest='in_memory', action='store_true',
+                           help="Extract acts from PDFs in memory, without writing .txt files")
+
         group.add_argument('-x', '--xml', dest='xml', default=False, nargs='*',
                            type=bool, help="Generate TeamTat XML Annotations")
 
@@ -164,4 +319,8 @@ class CLI():
         """
         self._download_parser()
         self._extract_content_parser()
+        self._sync_parser()
+        self._prefetch_parser()
+        self._convert_parser()
+        self._serve_parser()
         return self.parser.parse_args()
@@ -0,0 +1,289 @@
+# coding=utf-8
+
+"""Local catalog of the downloaded DODFs.
+
+Every PDF saved by the :class:`~dodfminer.downloader.core.Downloader` is
+recorded in a SQLite database kept in the download folder, with its
+edition date, number and type, url, size, SHA-256 and download time.
+Questions as "what do I already have" or "what changed since the last
+run" are then answered by an indexed query, instead of walking and
+reading the download folder.
+
+Paths are stored relative to the folder of the catalog, so the download
+folder can be moved. A new catalog records the PDFs already in its
+folder, and :meth:`Catalog.rescan` records the ones added by hand later.
+
+Usage example::
+
+    with Catalog('dodfs/catalog.sqlite') as catalog:
+        pdfs = catalog.paths(start='2021-05-01', end='2021-05-31')
+
+"""
+
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+
+CATALOG_FILE = 'catalog.sqlite'
+"""str: File, inside the download folder, with the catalog database."""
+
+_HASH_CHUNK = 1024 * 1024
+
+_EDITION_NAME = re.compile(r'DODF\s+(\d+)\s+(\d{2})-(\d{2})-(\d{4})\s*(.*)')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dodfs (
+    path TEXT PRIMARY KEY,
+    date TEXT,
+    number INTEGER,
+    edition TEXT,
+    url TEXT,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    downloaded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS dodfs_date ON dodfs (date);
+CREATE INDEX IF NOT EXISTS dodfs_sha256 ON dodfs (sha256);
+"""
+
+
+def parse_edition(name):
+    """Parse the date, number and type of a DODF edition name.
+
+    Args:
+        name (str): The edition name, as 'DODF 003 30-01-2017 EDICAO EXTRA'.
+
+    Returns:
+        A tuple (date, number, edition) with the ISO date, the edition
+        number and the edition type, 'NORMAL' when the name has none.
+        Every value is None when the name can not be parsed.
+
+    """
+    match = _EDITION_NAME.match(name.strip())
+    if match is None:
+        return None, None, None
+    number, day, month, year, edition = match.groups()
+    return f'{year}-{month}-{day}', int(number), edition.strip() or 'NORMAL'
+
+
+def file_sha256(path):
+    """Compute the SHA-256 of a file, reading it in chunks.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        The hexadecimal digest.
+
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(_HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Catalog:
+    """SQLite catalog of the downloaded DODFs.
+
+    The catalog can be shared by the download threads, writes are
+    serialized by a lock.
+
+    Args:
+        db_path (str): Path of the database, created when missing, with
+            the PDFs already in its folder.
+
+    """
+
+    def __init__(self, db_path):
+        self._db_path = db_path
+        self._root = os.path.dirname(os.path.abspath(db_path))
+        self._lock = threading.Lock()
+        created = not os.path.exists(db_path)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.executescript(_SCHEMA)
+        if created:
+            self.rescan()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self):
+        return self._query('SELECT COUNT(*) FROM dodfs')[0][0]
+
+    def _key(self, path):
+        """Path stored in the catalog, relative to the catalog folder."""
+        return os.path.relpath(os.path.abspath(path), self._root)
+
+    def _path(self, key):
+        """Path of a catalog entry, as seen from the working directory."""
+        return os.path.normpath(os.path.join(self._root, key))
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def add(self, path, url=None, name=None, sha256=None):
+        """Record a downloaded PDF, replacing a previous entry.
+
+        Args:
+            path (str): The path of the PDF.
+            url (str): The url it was downloaded from.
+            name (str): The edition name, defaults to the file name.
+            sha256 (str): The PDF SHA-256, computed when not informed.
+
+        """
+        if name is None:
+            name = os.path.splitext(os.path.basename(path))[0]
+        date, number, edition = parse_edition(name)
+        size = os.path.getsize(path)
+        sha256 = sha256 or file_sha256(path)
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO dodfs VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    (self._key(path), date, number, edition, url, size,
+                     sha256, time.time()))
+
+    def remove(self, path):
+        """Remove the entry of a PDF.
+
+        Args:
+            path (str): The path of the PDF.
+
+        """
+        with self._lock:
+            with self._conn:
+                self._conn.execute('DELETE FROM dodfs WHERE path = ?',
+                                   (self._key(path),))
+
+    def get(self, path):
+        """Get the entry of a PDF.
+
+        Args:
+            path (str): The path of the PDF.
+
+        Returns:
+            A dict with the columns of the entry, or None when the PDF is
+            not in the catalog.
+
+        """
+        rows = self._query('SELECT * FROM dodfs WHERE path = ?',
+                           (self._key(path),))
+        if not rows:
+            return None
+        entry = dict(rows[0])
+        entry['path'] = self._path(entry['path'])
+        return entry
+
+    def has(self, path):
+        """Check if a PDF is in the catalog and still on disc.
+
+        Args:
+            path (str): The path of the PDF.
+
+        Returns:
+            Boolean indicating if the PDF was downloaded.
+
+        """
+        rows = self._query('SELECT size FROM dodfs WHERE path = ?',
+                           (self._key(path),))
+        return (bool(rows) and os.path.exists(path)
+                and os.path.getsize(path) == rows[0]['size'])
+
+    def find_hash(self, sha256):
+        """Paths of the PDFs with a given SHA-256.
+
+        Args:
+            sha256 (str): The hexadecimal digest.
+
+        Returns:
+            A list with the paths, empty when there is none.
+
+        """
+        rows = self._query('SELECT path FROM dodfs WHERE sha256 = ? ORDER BY path',
+                           (sha256,))
+        return [self._path(row['path']) for row in rows]
+
+    def paths(self, start=None, end=None, since=None):
+        """Paths of the PDFs in the catalog.
+
+        Args:
+            start (str): First ISO date, inclusive.
+            end (str): Last ISO date, inclusive.
+            since (float): Only PDFs downloaded after this timestamp.
+
+        Returns:
+            A list with the paths of the PDFs still on disc, sorted.
+
+        """
+        conditions, params = [], []
+        if start is not None:
+            conditions.append('date >= ?')
+            params.append(start)
+        if end is not None:
+            conditions.append('date <= ?')
+            params.append(end)
+        if since is not None:
+            conditions.append('downloaded_at > ?')
+            params.append(since)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+        rows = self._query(f'SELECT path FROM dodfs{where} ORDER BY path', params)
+
+        paths = [self._path(row['path']) for row in rows]
+        return [path for path in paths if os.path.exists(path)]
+
+    def rescan(self):
+        """Record the PDFs of the catalog folder missing from the catalog.
+
+        Backfills the PDFs of runs before the catalog existed or copied in
+        by hand, without their urls.
+
+        Returns:
+            A sorted list with the paths of the PDFs recorded.
+
+        """
+        cataloged = {row['path'] for row in self._query('SELECT path FROM dodfs')}
+        added = []
+        for root, _, files in os.walk(self._root):
+            for file in files:
+                path = os.path.join(root, file)
+                if file.endswith('.pdf') and self._key(path) not in cataloged:
+                    self.add(path)
+                    added.append(path)
+        return sorted(added)
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def catalog_pdfs(folder, rescan=False):
+    """PDFs listed by the catalog of a download folder.
+
+    Args:
+        folder (str): A folder that might contain a catalog.
+        rescan (bool): Record the PDFs of the folder missing from the
+            catalog before listing.
+
+    Returns:
+        A list with the paths of the cataloged PDFs inside the folder, or
+        None when the folder has no catalog.
+
+    """
+    db_path = os.path.join(os.path.expanduser(folder), CATALOG_FILE)
+    if not os.path.isfile(db_path):
+        return None
+    with Catalog(db_path) as catalog:
+        if rescan:
+            catalog.rescan()
+        return catalog.paths()
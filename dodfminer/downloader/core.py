@@ -12,16 +12,56 @@ Usage example::
 """
 
 import os
+import re
+import gzip
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from urllib.parse import urlsplit
 import tqdm
 import requests
 import json
 
 from dateutil.relativedelta import relativedelta
-from dodfminer.downloader.helper import check_date, get_downloads
+from dodfminer.downloader.helper import get_session, MAX_CONNECTIONS_PER_HOST
+from dodfminer.downloader.listing import ListingCrawler
+from dodfminer.downloader.catalog import Catalog, CATALOG_FILE
+from dodfminer.downloader.retry import AdaptiveLimiter, IncompleteDownload
+from dodfminer.downloader.retry import RetryPolicy, TokenBucket
+from dodfminer.downloader.metrics import DownloadMetrics
 
 
+CHUNK_SIZE = 64 * 1024
+"""int: Size of the chunks written while a PDF is downloaded."""
+
+PARTIAL_SUFFIX = '.part'
+"""str: Suffix of the temporary file of a download in progress."""
+
+VALIDATOR_SUFFIX = '.validator'
+"""str: Suffix, after PARTIAL_SUFFIX, of the file with the ETag or
+Last-Modified of a download in progress."""
+
+PDF_TRAILER = b'%%EOF'
+"""bytes: Marker expected at the end of every PDF."""
+
+LISTING_CACHE = 'listing.json'
+"""str: File, inside the download folder, caching the DODF listings."""
+
+PULL_SUMMARY = 'pull_summary.json'
+"""str: File, inside the download folder, with the metrics of the last pull."""
+
+JSON_VALIDATORS = 'json_validators.json'
+"""str: File, inside the download folder, with the ETag and Last-Modified
+of each downloaded JSON url."""
+
+_TRAILER_WINDOW = 1024
+
+_CONTENT_RANGE = re.compile(r'bytes\s+(\d+)-')
+
+_JSON_TITLE = re.compile(rb'"lstJornalDia"\s*:\s*\[\s*("(?:[^"\\]|\\.)*")')
+
 MONTHS_STRING = ["", "01_Janeiro", "02_Fevereiro", "03_Março", "04_Abril",
                  "05_Maio", "06_Junho", "07_Julho", "08_Agosto",
                  "09_Setembro", "10_Outubro", "11_Novembro", "12_Dezembro"]
@@ -32,17 +72,49 @@ class Downloader:
 
     Args:
         save_path (str): Path to save the downloads.
+        max_workers (int): Number of PDFs downloaded at the same time.
+        max_per_host (int): Maximum number of simultaneous downloads
+            from a single host. The limit shrinks while the host fails.
+        retry (:obj:`RetryPolicy`): Retry policy of the requests.
+        rate_limit (float): Maximum requests per second, unlimited when
+            None.
+        latency_target (float): Seconds above which a download slows the
+            host down, shrinking its limit. Latency is ignored when None.
 
     Attributes:
         _download_path: Folder in which the downloads will be stored.
         _prog_bar: Indicate if download should contain a progress bar.
+        _session: Pooled HTTP session shared by all downloads.
+        _retry: Retry policy of the downloads and listings.
+        _rate_limiter: Token bucket limiting the request rate, if any.
+        _crawler: Crawler resolving, and caching, the DODFs of each month.
+        _catalog: Catalog of the PDFs already downloaded.
+        _on_pdf: Callback receiving the path of each PDF of a pull.
+        _metrics: Metrics of the current pull.
 
     """
 
-    def __init__(self, save_path='./'):
+    def __init__(self, save_path='./', max_workers=4,
+                 max_per_host=MAX_CONNECTIONS_PER_HOST, retry=None,
+                 rate_limit=None, latency_target=None):
         self._prog_bar = tqdm.tqdm()
         self._create_single_folder(os.path.join(save_path, 'dodfs'))
         self._download_path = os.path.join(save_path, 'dodfs')
+        self._max_workers = max(1, max_workers)
+        self._max_per_host = max(1, max_per_host)
+        self._latency_target = latency_target
+        self._host_slots = {}
+        self._host_lock = threading.Lock()
+        self._session = get_session(max(self._max_workers, self._max_per_host))
+        self._retry = retry or RetryPolicy()
+        self._rate_limiter = TokenBucket(rate_limit) if rate_limit else None
+        self._crawler = ListingCrawler(
+            os.path.join(self._download_path, LISTING_CACHE),
+            max_workers=self._max_workers, retry=self._retry,
+            rate_limiter=self._rate_limiter)
+        self._catalog = Catalog(os.path.join(self._download_path, CATALOG_FILE))
+        self._on_pdf = None
+        self._metrics = DownloadMetrics()
 
     @classmethod
     def _string_to_date(cls, date):
@@ -115,7 +187,9 @@ class Downloader:
     def _file_exist(self, path):
         """Check if a file exists.
 
-        Prevents redownloads.
+        Prevents redownloads. PDFs in the catalog are trusted without
+        being read. Other PDFs without the end of file marker, left by an
+        interrupted download, are not considered existing.
 
         Args:
             path (str): The path where the file might be
@@ -124,14 +198,87 @@ class Downloader:
             Boolean indicating if file does really exists.
 
         """
+        if self._catalog.has(path):
+            self._log(os.path.basename(path) + " file already exist")
+            return True
         if os.path.exists(path):
+            if path.endswith('.pdf') and not self._is_complete_pdf(path):
+                self._log(os.path.basename(path) + " file is incomplete")
+                return False
             self._log(os.path.basename(path) + " file already exist")
             return True
 
         return False
 
-    def _download_pdf(self, url, path):
-        """Download the DODF PDF.
+    @classmethod
+    def _is_complete_pdf(cls, path):
+        """Check if a PDF ends with the end of file marker.
+
+        Args:
+            path (str): The path of the pdf.
+
+        Returns:
+            Boolean indicating if the pdf trailer is present.
+
+        """
+        with open(path, 'rb') as pdf_file:
+            pdf_file.seek(0, os.SEEK_END)
+            pdf_file.seek(max(0, pdf_file.tell() - _TRAILER_WINDOW))
+            return PDF_TRAILER in pdf_file.read()
+
+    @classmethod
+    def _expected_size(cls, response, offset):
+        """Size the complete file must have, from the response headers.
+
+        Args:
+            response (:obj:`Response`): The download response.
+            offset (int): Bytes already downloaded before the response.
+
+        Returns:
+            The expected size, or None when the server does not inform it.
+
+        """
+        if response.status_code == 206:
+            total = response.headers.get('Content-Range', '').rpartition('/')[2]
+            return int(total) if total.isdigit() else None
+        length = response.headers.get('Content-Length')
+        return offset + int(length) if length and length.isdigit() else None
+
+    @classmethod
+    def _range_start(cls, response):
+        """First byte of a partial response, from its Content-Range.
+
+        Args:
+            response (:obj:`Response`): The download response.
+
+        Returns:
+            The offset of the first byte sent, or None when not informed.
+
+        """
+        match = _CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+        return int(match.group(1)) if match else None
+
+    @classmethod
+    def _validator(cls, response):
+        """Validator of a download, for the If-Range of its resume.
+
+        Args:
+            response (:obj:`Response`): The download response.
+
+        Returns:
+            The strong ETag or the Last-Modified, None when there is none.
+
+        """
+        etag = response.headers.get('ETag')
+        if etag and not etag.startswith('W/'):
+            return etag
+        return response.headers.get('Last-Modified')
+
+    def _download_pdf(self, url, path, name=None):
+        """Download the DODF PDF, in a single attempt.
+
+        Failures are logged, and an interrupted download is resumed by the
+        next call.
 
         Note:
             Might be time consuming depending on bandwidth.
@@ -139,22 +286,190 @@ class Downloader:
         Args:
             url (str): The pdf url.
             path (str): The path to save the pdf.
+            name (str): The DODF edition name, defaults to the file name.
+
+        Returns:
+            The path of the downloaded pdf, or None when the download failed.
+
+        """
+        try:
+            return self._fetch_pdf(url, path, name)
+        except IncompleteDownload as error:
+            self._log(f"{error}, it will be resumed")
+        except requests.exceptions.RequestException as error:
+            self._fail_request_message(url, error)
+        return None
+
+    def _fetch_pdf(self, url, path, name=None):
+        """Make an attempt to download the DODF PDF.
+
+        The pdf is streamed to a temporary ``.part`` file, which is renamed
+        when the download is complete and recorded in the catalog. An
+        existing ``.part`` file is resumed with an HTTP Range request,
+        conditioned by If-Range on the ETag or Last-Modified of the
+        response that started it. The download starts over when the pdf
+        changed, or the server does not resume where the file ends.
+
+        Args:
+            url (str): The pdf url.
+            path (str): The path to save the pdf.
+            name (str): The DODF edition name, defaults to the file name.
+
+        Returns:
+            The path of the downloaded pdf, or None when it is not a PDF.
 
         Raises:
             RequestException: Error in case the request to download fails.
+            IncompleteDownload: The connection ended before the whole pdf
+                was received.
 
         """
-        try:
-            response = requests.get(url)
+        pdf_file = Path(f"{path}.pdf")
+        partial_file = Path(f"{path}.pdf{PARTIAL_SUFFIX}")
+        validator_file = Path(f"{partial_file}{VALIDATOR_SUFFIX}")
+        offset = partial_file.stat().st_size if partial_file.exists() else 0
+        headers = {}
+        if offset:
+            headers['Range'] = f'bytes={offset}-'
+            if validator_file.exists():
+                headers['If-Range'] = validator_file.read_text(encoding='utf-8')
+
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        with self._session.get(url, headers=headers, stream=True) as response:
+            if offset and (response.status_code == 416 or (
+                    response.status_code == 206
+                    and self._range_start(response) != offset)):
+                # The partial file does not match the remote one
+                partial_file.unlink()
+                return self._fetch_pdf(url, path, name)
             response.raise_for_status()
-        except requests.exceptions.HTTPError as error:
-            self._fail_request_message(url, error)
+            if response.status_code != 206:
+                offset = 0
+                validator = self._validator(response)
+                if validator is not None:
+                    validator_file.write_text(validator, encoding='utf-8')
+                elif validator_file.exists():
+                    validator_file.unlink()
+            expected = self._expected_size(response, offset)
+
+            with open(partial_file, 'ab' if offset else 'wb') as out:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    out.write(chunk)
+                    self._metrics.add_bytes(len(chunk))
+
+        size = partial_file.stat().st_size
+        if expected is not None and size != expected:
+            raise IncompleteDownload(f"Incomplete {os.path.basename(path)}: "
+                                     f"{size} of {expected} bytes")
+        if validator_file.exists():
+            validator_file.unlink()
+        if not self._is_complete_pdf(partial_file):
+            partial_file.unlink()
+            self._log(f"Invalid {os.path.basename(path)}: missing PDF trailer")
+            return None
+
+        os.replace(partial_file, pdf_file)
+        self._catalog.add(str(pdf_file), url, name)
+        self._log("Finished " + os.path.basename(path))
+        return str(pdf_file)
+
+    def _host_slot(self, url):
+        """Adaptive limit of the simultaneous downloads from a host.
+
+        Args:
+            url (str): The url to be downloaded.
+
+        Returns:
+            The :obj:`AdaptiveLimiter` of the url host.
+
+        """
+        host = urlsplit(url).netloc
+        with self._host_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = AdaptiveLimiter(
+                    self._max_per_host, latency_target=self._latency_target)
+            return self._host_slots[host]
+
+    def _attempt_job(self, url, path, name):
+        """Make a download attempt inside a host slot, reporting its outcome.
+
+        Transient failures, and downloads slower than the latency target,
+        shrink the concurrency of the host, and successes grow it back.
+
+        """
+        slot = self._host_slot(url)
+        with slot:
+            start = time.perf_counter()
+            try:
+                pdf_path = self._fetch_pdf(url, path, name)
+            except requests.exceptions.RequestException as error:
+                if RetryPolicy.is_retryable(error):
+                    slot.feedback(False)
+                raise
+            latency = time.perf_counter() - start
+            slot.feedback(True, latency)
+        if pdf_path is not None:
+            self._metrics.file_done(latency)
+        return pdf_path
+
+    def _download_job(self, job):
+        """Download a single PDF, retrying transient failures.
+
+        Args:
+            job (tuple): The pdf url, the path to save it and the DODF name.
+
+        """
+        url, path, name = job
+
+        def log_retry(error, delay):
+            self._metrics.retried()
+            self._log(f"Retrying {os.path.basename(path)} in {delay:.1f}s: {error}")
+
+        try:
+            pdf_path = self._retry.call(self._attempt_job, url, path, name,
+                                        on_retry=log_retry)
         except requests.exceptions.RequestException as error:
             self._fail_request_message(url, error)
-        else:
-            pdf_file = Path(f"{path}.pdf")
-            pdf_file.write_bytes(response.content)
-            self._log("Finished " + os.path.basename(path))
+            pdf_path = None
+
+        if pdf_path is None:
+            self._metrics.failed()
+        self._advance()
+        if pdf_path is not None:
+            self._notify(pdf_path)
+
+    def _advance(self):
+        """Move the progress bar a PDF forward, showing the live metrics."""
+        self._prog_bar.update(1)
+        self._prog_bar.set_postfix(self._metrics.postfix(), refresh=False)
+
+    def _notify(self, pdf_path):
+        """Hand a PDF available on disc to the pull callback, if any.
+
+        Args:
+            pdf_path (str): The path of the pdf.
+
+        """
+        if self._on_pdf is not None:
+            self._on_pdf(pdf_path)
+
+    def _download_all(self, jobs):
+        """Download a list of PDFs concurrently.
+
+        Args:
+            jobs (list): Tuples with the pdf url, the path to save it and
+                the DODF name.
+
+        """
+        if self._max_workers == 1 or len(jobs) <= 1:
+            for job in jobs:
+                self._download_job(job)
+            return
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            # list consumes the results, so worker exceptions are raised
+            list(executor.map(self._download_job, jobs))
 
     def _make_month_path(self, year, actual_date):
         """Create and return the folder for the year and month being download.
@@ -176,7 +491,7 @@ class Downloader:
 
         return month_path
 
-    def pull(self, start_date, end_date):
+    def pull(self, start_date, end_date, on_pdf=None):
         """Make the download of the DODFs pdfs.
 
         All dodfs are downloaded from start_date to end_date inclusively.
@@ -185,79 +500,226 @@ class Downloader:
         Args:
             start_date (str): The start date in format mm/yyyy.
             end_date (str): The start date in format mm/yyyy.
+            on_pdf (callable): Called with the path of each PDF of the
+                period as soon as it is on disc, either already existing or
+                just downloaded. It is called from the download threads,
+                and blocking in it holds the downloads back.
+
+        Returns:
+            A dict with the metrics of the pull, also saved as JSON in the
+            download folder.
 
         Note:
             The name or the path of the save folder are hard coded and can't
             be changed due to some nonsense software engineer decision.
 
         """
-        # Convert string to datetime and calculate ammount to be used in
-        # progress bar
+        # Convert string to datetime and calculate ammount of months
         start_date = self._string_to_date(start_date)
         end_date = self._string_to_date(end_date)
         months_amt = ((end_date.year - start_date.year) * 12
                       + (end_date.month - start_date.month))
-        # Creates progress bar
-        self._prog_bar = tqdm.tqdm(total=months_amt)
         # # Creates the project folder structure
         self._create_download_folder()
-        year = 0
 
-        for month in range(months_amt+1):
-            actual_date = start_date + relativedelta(months=+month)
+        dates = [start_date + relativedelta(months=+month)
+                 for month in range(months_amt+1)]
+        # All listings are resolved at once, concurrently and from the cache
+        listings = self._crawler.crawl(
+            [(str(date.year), MONTHS_STRING[date.month]) for date in dates])
+
+        # Creates progress bar, advanced once for each PDF of the period
+        pdfs_amt = sum(len(links) for month_links in listings.values()
+                       for links in month_links.values())
+        self._prog_bar = tqdm.tqdm(total=pdfs_amt, unit='pdf')
+        self._metrics = DownloadMetrics()
+        self._on_pdf = on_pdf
+        try:
+            self._pull_months(dates, listings)
+        finally:
+            self._on_pdf = None
+            self._prog_bar.close()
+
+        summary = self._metrics.summary()
+        summary_path = os.path.join(self._download_path, PULL_SUMMARY)
+        with open(summary_path, 'w', encoding='utf-8') as file:
+            json.dump(summary, file, indent=2)
+        self._log(f"{summary['files']} PDFs downloaded, "
+                  f"{summary['skipped_files']} already existing, "
+                  f"{summary['failures']} failed, {summary['retries']} retries. "
+                  f"Summary saved in {summary_path}")
+        return summary
+
+    def _pull_months(self, dates, listings):
+        """Download the DODFs of each month.
+
+        Args:
+            dates (list): The first day of each month.
+            listings (dict): The PDF links of each DODF, by 'year/month'.
+
+        """
+        year = 0
+        for actual_date in dates:
             desc_bar = str(actual_date)
             self._prog_bar.set_description(f"Date {desc_bar}")
             month_path = self._make_month_path(year, actual_date)
             year = actual_date.year
             year_ = str(year)
             month_ = MONTHS_STRING[actual_date.month]
+            links = listings[f'{year_}/{month_}']
 
-            if check_date(year_, month_) is True:
+            if links:
                 self._create_single_folder(month_path)
             else:
                 print(
                     f"*** There are still no DODFs for that date: {actual_date.month}/{year_} ***")
                 continue
 
-            self._get_dodfs(get_downloads(year_, month_), month_path)
-
-        self._prog_bar.update(1)
+            self._get_dodfs(links, month_path)
 
   
-    def pull_json(self, JSON_URL):
+    def pull_json(self, JSON_URL, compress=None):
         """Download the DODF JSON file available on the current day.
 
         The file is saved either in the path provided or in the default 'dodf' directory.
+        The request is conditional on the ETag and Last-Modified of the
+        previous download of the same url, so nothing is transferred when
+        the file did not change. The response bytes are written as
+        received, without being parsed.
 
         Note:
             There is no way of downloading JSON files from
             past days because they are not provided.
+
+        Args:
+            JSON_URL (str): The url of the JSON file.
+            compress (str): Compress the file on disc, with 'gzip' or
+                'zstd'. The zstd compression needs the zstandard package.
+
+        Returns:
+            The path of the JSON file, or None when the download failed.
+
         """
+        validators = self._load_validators()
+        cached = validators.get(JSON_URL, {})
+        headers = {'Accept-Encoding': 'gzip, deflate'}
+        if cached.get('path') and os.path.exists(cached['path']):
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
 
         try:
-            response = requests.get(JSON_URL)
-            if response.status_code == 200:
-                # Creates and saves the JSON file
-                json_data = response.json()
-                json_title = json_data['lstJornalDia'][0][:-5] + '.json'
-                json_path = os.path.join(self._download_path, json_title)
-                with open(json_path, "w") as file:
-                    json.dump(json_data, file)
-                print('\nThe JSON file has been downloaded successfully from ' + JSON_URL + '.')
+            response = self._retry.call(self._session.get, JSON_URL,
+                                        headers=headers)
+            if response.status_code == 304:
+                print('\nThe JSON file from ' + JSON_URL + ' has not changed.')
+                return cached['path']
+            response.raise_for_status()
         except requests.exceptions.HTTPError as error:
             self._fail_request_message(JSON_URL, error)
+            return None
         except requests.exceptions.RequestException as error:
             self._fail_request_message(JSON_URL, error)
+            return None
+
+        # Creates and saves the JSON file
+        content = response.content
+        json_title = self._json_title(content)[:-5] + '.json'
+        json_path = os.path.join(self._download_path, json_title)
+        json_path = self._write_json(json_path, content, compress)
+
+        validators[JSON_URL] = {'etag': response.headers.get('ETag'),
+                                'last_modified': response.headers.get('Last-Modified'),
+                                'path': json_path}
+        self._save_validators(validators)
+        print('\nThe JSON file has been downloaded successfully from ' + JSON_URL + '.')
+        return json_path
+
+    @classmethod
+    def _json_title(cls, content):
+        """Name of the first DODF listed by a JSON file.
+
+        The name is searched in the raw bytes, and the whole JSON is only
+        parsed when the search fails.
+
+        Args:
+            content (bytes): The JSON file.
 
+        Returns:
+            The first item of 'lstJornalDia'.
+
+        """
+        match = _JSON_TITLE.search(content)
+        if match is not None:
+            return json.loads(match.group(1))
+        return json.loads(content)['lstJornalDia'][0]
+
+    @classmethod
+    def _write_json(cls, path, content, compress=None):
+        """Write the JSON bytes atomically, compressed if asked.
+
+        Args:
+            path (str): The path of the JSON file.
+            content (bytes): The JSON file.
+            compress (str): None, 'gzip' or 'zstd'.
+
+        Returns:
+            The path written, with the extension of the compression.
+
+        Raises:
+            ValueError: Unknown compression.
+            ImportError: zstd compression without the zstandard package.
+
+        """
+        if compress == 'gzip':
+            path += '.gz'
+            content = gzip.compress(content)
+        elif compress == 'zstd':
+            try:
+                import zstandard  # pylint: disable=import-outside-toplevel
+            except ImportError as error:
+                raise ImportError("zstd compression needs the zstandard "
+                                  "package: pip install zstandard") from error
+            path += '.zst'
+            content = zstandard.ZstdCompressor().compress(content)
+        elif compress is not None:
+            raise ValueError(f"Unknown compression: {compress}")
+
+        tmp_path = path + PARTIAL_SUFFIX
+        with open(tmp_path, 'wb') as file:
+            file.write(content)
+        os.replace(tmp_path, path)
+        return path
+
+    def _load_validators(self):
+        """Load the ETag and Last-Modified of the previous JSON downloads."""
+        path = os.path.join(self._download_path, JSON_VALIDATORS)
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_validators(self, validators):
+        """Save the ETag and Last-Modified of the JSON downloads."""
+        path = os.path.join(self._download_path, JSON_VALIDATORS)
+        with open(path + PARTIAL_SUFFIX, 'w', encoding='utf-8') as file:
+            json.dump(validators, file)
+        os.replace(path + PARTIAL_SUFFIX, path)
 
     def _get_dodfs(self, _links_for_each_dodf, month_path):
         """Create folder and stores the DODFs pdfs.
 
+        Folders are created first, then the PDFs are downloaded
+        concurrently.
+
         Args:
             _links_for_each_dodf (dict): a dicts with links for each DODF.
             month_path (str): path to store DODFs pdfs.
 
         """
+        jobs = []
         for dodf_name, links in _links_for_each_dodf.items():
             dodf_path = month_path
 
@@ -275,12 +737,21 @@ class Downloader:
                     dodf_name_path = os.path.join(
                         dodf_path, f'{dodf_name} {index}')
 
-                if not self._file_exist(dodf_name_path):
+                pdf_path = f'{dodf_name_path}.pdf'
+                if not self._file_exist(pdf_path):
                     self._log("Downloding " +
                                 os.path.basename(dodf_name_path))
-                    self._download_pdf(download_link, dodf_name_path)
+                    jobs.append((download_link, dodf_name_path, dodf_name))
                 else:
+                    if self._catalog.get(pdf_path) is None:
+                        # PDFs downloaded before the catalog existed
+                        self._catalog.add(pdf_path, download_link, dodf_name)
                     self._log("Jumping to the next")
+                    self._metrics.skipped(os.path.getsize(pdf_path))
+                    self._advance()
+                    self._notify(pdf_path)
+
+        self._download_all(jobs)
 
     def get_download_path(self):
         return self._download_path
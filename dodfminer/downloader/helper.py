@@ -1,10 +1,40 @@
 import json
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 
 
 LISTAR_URL = 'https://dodf.df.gov.br/listar?'
 DOWNLOAD_URL = 'https://dodf.df.gov.br/index/visualizar-arquivo/?pasta='
 
+# Connections kept open to each host by the shared session
+MAX_CONNECTIONS_PER_HOST = 4
+
+_session = None
+_session_pool_size = 0
+_session_lock = threading.Lock()
+
+
+# get_session returns the HTTP session shared by all requests, so
+# connections are kept alive and reused between listings and downloads.
+# A larger pool is mounted on the same session, which the downloaders
+# created before keep using, and the smaller one is closed
+def get_session(pool_size=MAX_CONNECTIONS_PER_HOST):
+    global _session, _session_pool_size  # pylint: disable=global-statement
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+        if _session_pool_size < pool_size:
+            old_adapter = _session.get_adapter('https://') if _session_pool_size else None
+            adapter = HTTPAdapter(pool_connections=pool_size,
+                                  pool_maxsize=pool_size)
+            _session.mount('https://', adapter)
+            _session.mount('http://', adapter)
+            _session_pool_size = pool_size
+            if old_adapter is not None:
+                old_adapter.close()
+        return _session
+
 
 # req1 returns list with available months for the given year
 def req1(year):
@@ -16,7 +46,7 @@ def req1(year):
 def req2(url1, month):
     if "_" in month:
         url2 = url1 + '/' + month
-        request2 = requests.get(url2)
+        request2 = get_session().get(url2)
         content2 = json.loads(request2.content)
         dodfs = list(content2['data'].items())
         return(url2, dodfs)
@@ -27,7 +57,7 @@ def req2(url1, month):
 # req3 returns all pdfs from the selected DODF
 def req3(url2, dodf):
     url3 = url2+"/"+dodf.replace(" ", "%20")
-    request3 = requests.get(url3)
+    request3 = get_session().get(url3)
     content3 = json.loads(request3.content)
     pdfs = content3['data']
     return(url3, pdfs)
@@ -38,7 +68,7 @@ def check_date(year, month):
     if "_" in month:
         url1 = LISTAR_URL+f'dir={year}/{month}'
         print(url1)
-        req = requests.get(url1)
+        req = get_session().get(url1)
         content = json.loads(req.content)
         if 'data' in content.keys():
             return len(content["data"]) > 0
@@ -46,6 +76,16 @@ def check_date(year, month):
 
     raise ValueError("month parameter format is wrong")
 
+# pdf_links returns the download url of each pdf listed for a DODF
+def pdf_links(year, url3, pdfs):
+    _pdfs = []
+    for pdf in pdfs:
+        dir_ = (url3[url3.find(year):]).replace("/", "|")+'|'+'&arquivo='
+        index2 = pdf.rfind("/")
+        arq_ = pdf[index2+1:].replace(" ", "%20")
+        _pdfs.append(DOWNLOAD_URL+dir_+arq_)
+    return _pdfs
+
 # Generates download url
 
 
@@ -58,13 +98,8 @@ def get_downloads(year, month):
         for dodf in dodfs:
             url3, pdfs = req3(url2, dodf[1])
             dodf_name = dodf[1]
-            _pdfs = []
-            for pdf in pdfs:
-                dir_ = (url3[url3.find(year):]).replace("/", "|")+'|'+'&arquivo='
-                index2 = pdf.rfind("/")
-                arq_ = pdf[index2+1:].replace(" ", "%20")
-                link_download = DOWNLOAD_URL+dir_+arq_
-                _pdfs.append(link_download)
+            _pdfs = pdf_links(year, url3, pdfs)
+            if _pdfs:
                 _links[dodf_name] = _pdfs
 
         return _links
@@ -0,0 +1,196 @@
+# coding=utf-8
+
+"""Crawl the DODF listings and keep the resolved catalog on disc.
+
+The DODF website lists the editions of each month, and then the PDFs of
+each edition. The crawler requests every month listing once, fetches the
+edition listings of all months concurrently, and saves the result
+(edition → PDF urls) in a JSON file, so later pulls over the same months
+only revalidate entries older than their TTL.
+
+Usage example::
+
+    crawler = ListingCrawler('dodfs/listing.json')
+    links = crawler.crawl([('2021', '05_Maio'), ('2021', '06_Junho')])
+
+"""
+
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from dodfminer.downloader.helper import LISTAR_URL, get_session, pdf_links
+from dodfminer.downloader.retry import RetryPolicy
+
+LISTING_TTL = 12 * 60 * 60
+"""int: Seconds a month listing is trusted before being requested again."""
+
+CLOSED_LISTING_TTL = 30 * 24 * 60 * 60
+"""int: Seconds the listing of a month that already ended is trusted."""
+
+_MONTH_NUMBER = {'Janeiro': 1, 'Fevereiro': 2, 'Março': 3, 'Abril': 4,
+                 'Maio': 5, 'Junho': 6, 'Julho': 7, 'Agosto': 8,
+                 'Setembro': 9, 'Outubro': 10, 'Novembro': 11,
+                 'Dezembro': 12}
+
+
+class ListingCrawler:
+    """Resolve and cache the PDF links of the DODFs of each month.
+
+    Args:
+        cache_path (str): JSON file where the listings are kept. When
+            None, nothing is saved.
+        ttl (int): Seconds the listing of the current month is trusted.
+        closed_ttl (int): Seconds the listing of a past month is trusted.
+        max_workers (int): Number of listings requested at the same time.
+        retry (:obj:`RetryPolicy`): Retry policy of the listing requests.
+        rate_limiter (:obj:`TokenBucket`): Limits the request rate, if any.
+
+    Attributes:
+        requests_made: Number of listing requests made by the crawler.
+
+    """
+
+    def __init__(self, cache_path=None, ttl=LISTING_TTL,
+                 closed_ttl=CLOSED_LISTING_TTL, max_workers=4, retry=None,
+                 rate_limiter=None):
+        self._cache_path = cache_path
+        self._ttl = ttl
+        self._closed_ttl = closed_ttl
+        self._max_workers = max(1, max_workers)
+        self._session = get_session(self._max_workers)
+        self._retry = retry or RetryPolicy()
+        self._rate_limiter = rate_limiter
+        self._lock = threading.Lock()
+        self._cache = self._load()
+        self.requests_made = 0
+
+    def _load(self):
+        """Load the cached listings, ignoring unreadable files."""
+        if self._cache_path is None or not os.path.exists(self._cache_path):
+            return {}
+        try:
+            with open(self._cache_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        """Save the listings atomically."""
+        if self._cache_path is None:
+            return
+        tmp_path = self._cache_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(self._cache, file, ensure_ascii=False)
+        os.replace(tmp_path, self._cache_path)
+
+    @classmethod
+    def _is_closed(cls, year, month):
+        """Check if the month has already ended."""
+        number = _MONTH_NUMBER.get(month.partition('_')[2])
+        if number is None:
+            return False
+        return (int(year), number) < (date.today().year, date.today().month)
+
+    def _is_fresh(self, entry):
+        """Check if a cached entry is still within its TTL."""
+        ttl = self._closed_ttl if entry.get('closed') else self._ttl
+        return time.time() - entry['fetched'] < ttl
+
+    def _request(self, url):
+        """Make an attempt to request a listing."""
+        with self._lock:
+            self.requests_made += 1
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        response = self._session.get(url)
+        response.raise_for_status()
+        return response
+
+    def _get_data(self, url):
+        """Request a listing and return its data, or {} when missing.
+
+        Transient failures are retried by the retry policy.
+        """
+        content = json.loads(self._retry.call(self._request, url).content)
+        return content.get('data') or {}
+
+    def _month_editions(self, key):
+        """Request the editions of a month.
+
+        Args:
+            key (str): The month, as 'year/month'.
+
+        Returns:
+            A list with the name of each edition.
+
+        """
+        return list(self._get_data(LISTAR_URL + f'dir={key}').values())
+
+    def _edition_links(self, key, edition):
+        """Request the PDF links of an edition.
+
+        Args:
+            key (str): The month, as 'year/month'.
+            edition (str): The edition name.
+
+        Returns:
+            A list with the download url of each PDF.
+
+        """
+        url3 = LISTAR_URL + f'dir={key}/' + edition.replace(" ", "%20")
+        return pdf_links(key.split('/')[0], url3, self._get_data(url3))
+
+    def _map(self, func, items):
+        """Apply func to items concurrently, keeping their order."""
+        if self._max_workers == 1 or len(items) <= 1:
+            return [func(*item) for item in items]
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            return list(executor.map(lambda item: func(*item), items))
+
+    def crawl(self, months):
+        """Resolve the PDF links of the DODFs of several months.
+
+        Only the months without a fresh cached listing are requested.
+        Months without DODFs are not cached, so they are checked again in
+        the next crawl.
+
+        Args:
+            months (list): Tuples (year, month), as ('2021', '05_Maio').
+
+        Returns:
+            A dict mapping each 'year/month' to a dict with the PDF links
+            of each DODF, empty when the month has no DODFs.
+
+        """
+        keys = [f'{year}/{month}' for year, month in months]
+        stale = [key for key in dict.fromkeys(keys)
+                 if key not in self._cache or not self._is_fresh(self._cache[key])]
+
+        if stale:
+            editions = self._map(self._month_editions, [(key,) for key in stale])
+            jobs = [(key, edition)
+                    for key, month_editions in zip(stale, editions)
+                    for edition in month_editions]
+            links = self._map(self._edition_links, jobs)
+
+            resolved = {key: {} for key in stale}
+            for (key, edition), edition_links in zip(jobs, links):
+                if edition_links:
+                    resolved[key][edition] = edition_links
+
+            now = time.time()
+            for key, month_links in resolved.items():
+                if month_links:
+                    self._cache[key] = {'fetched': now,
+                                        'closed': self._is_closed(*key.split('/')),
+                                        'links': month_links}
+                else:
+                    self._cache.pop(key, None)
+            self._save()
+
+        return {key: self._cache[key]['links'] if key in self._cache else {}
+                for key in keys}
@@ -0,0 +1,159 @@
+# coding=utf-8
+
+"""Metrics of the DODF downloads.
+
+The :class:`DownloadMetrics` of a pull counts the PDFs downloaded,
+skipped and failed, the bytes transferred, the retries, and keeps a
+histogram of the download latencies. Its summary is shown live in the
+progress bar and saved as JSON at the end of the pull.
+
+Usage example::
+
+    metrics = DownloadMetrics()
+    metrics.add_bytes(len(chunk))
+    metrics.file_done(latency=1.2)
+    print(metrics.summary())
+
+"""
+
+import bisect
+import threading
+import time
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+"""tuple: Upper bounds, in seconds, of the latency histogram buckets."""
+
+
+class DownloadMetrics:
+    """Thread safe counters of a pull.
+
+    Attributes:
+        files: Number of PDFs downloaded.
+        size: Bytes transferred, including failed attempts.
+        skipped_files: Number of PDFs already on disc.
+        skipped_size: Bytes of the PDFs already on disc.
+        failures: Number of PDFs that could not be downloaded.
+        retries: Number of retried requests.
+
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self._start = clock()
+        self._lock = threading.Lock()
+        self._latencies = []
+        self._histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.files = 0
+        self.size = 0
+        self.skipped_files = 0
+        self.skipped_size = 0
+        self.failures = 0
+        self.retries = 0
+
+    def add_bytes(self, size):
+        """Account bytes received.
+
+        Args:
+            size (int): Number of bytes.
+
+        """
+        with self._lock:
+            self.size += size
+
+    def file_done(self, latency):
+        """Account a downloaded PDF.
+
+        Args:
+            latency (float): Seconds the download took.
+
+        """
+        with self._lock:
+            self.files += 1
+            self._latencies.append(latency)
+            self._histogram[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def skipped(self, size):
+        """Account a PDF already on disc.
+
+        Args:
+            size (int): Bytes of the PDF.
+
+        """
+        with self._lock:
+            self.skipped_files += 1
+            self.skipped_size += size
+
+    def failed(self):
+        """Account a PDF that could not be downloaded."""
+        with self._lock:
+            self.failures += 1
+
+    def retried(self):
+        """Account a retried request."""
+        with self._lock:
+            self.retries += 1
+
+    def _percentile(self, latencies, fraction):
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+    def rates(self):
+        """Files and bytes per second since the metrics were created.
+
+        Returns:
+            A tuple (files per second, bytes per second).
+
+        """
+        elapsed = self._clock() - self._start
+        if elapsed <= 0:
+            return 0.0, 0.0
+        with self._lock:
+            return self.files / elapsed, self.size / elapsed
+
+    def summary(self):
+        """Summary of the metrics.
+
+        Returns:
+            A dict, ready to be saved as JSON, with the counters, the
+            throughput, the latency percentiles and the latency histogram,
+            mapping the upper bound of each bucket to its count.
+
+        """
+        elapsed = self._clock() - self._start
+        files_per_second, bytes_per_second = self.rates()
+        with self._lock:
+            latencies = sorted(self._latencies)
+            bounds = [str(bound) for bound in LATENCY_BUCKETS] + ['inf']
+            return {
+                'files': self.files,
+                'bytes': self.size,
+                'skipped_files': self.skipped_files,
+                'skipped_bytes': self.skipped_size,
+                'failures': self.failures,
+                'retries': self.retries,
+                'elapsed': elapsed,
+                'files_per_second': files_per_second,
+                'bytes_per_second': bytes_per_second,
+                'latency': {
+                    'mean': sum(latencies) / len(latencies) if latencies else None,
+                    'p50': self._percentile(latencies, 0.5),
+                    'p90': self._percentile(latencies, 0.9),
+                    'p99': self._percentile(latencies, 0.99),
+                    'max': latencies[-1] if latencies else None,
+                    'histogram': dict(zip(bounds, self._histogram)),
+                },
+            }
+
+    def postfix(self):
+        """Short summary shown by the progress bar.
+
+        Returns:
+            A dict with the formatted throughput, retries and failures.
+
+        """
+        files_per_second, bytes_per_second = self.rates()
+        return {'files': self.files, 'skipped': self.skipped_files,
+                'files/s': f'{files_per_second:.2f}',
+                'MB/s': f'{bytes_per_second / 1e6:.2f}',
+                'retries': self.retries, 'failed': self.failures}
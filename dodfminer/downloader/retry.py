@@ -0,0 +1,260 @@
+# coding=utf-8
+
+"""Retry, rate and concurrency control of the downloader requests.
+
+Three independent pieces are combined around each download:
+
+- :class:`RetryPolicy` retries transient failures (connection errors,
+  truncated bodies, 429 and 5xx responses) with exponential backoff and
+  full jitter, honouring ``Retry-After``;
+- :class:`TokenBucket` limits the rate of requests;
+- :class:`AdaptiveLimiter` limits the simultaneous requests to a host,
+  halving the limit on errors or slow responses and growing it back by
+  one slot per round of successes (AIMD).
+
+The clock, the sleep function and the random generator can be injected,
+so the schedule is deterministic in tests.
+
+Usage example::
+
+    retry = RetryPolicy(attempts=5)
+    limiter = AdaptiveLimiter(4)
+    with limiter:
+        response = retry.call(session.get, url)
+
+"""
+
+import random
+import threading
+import time
+
+import requests
+
+RETRY_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+"""frozenset: HTTP status codes considered transient."""
+
+
+class IncompleteDownload(requests.exceptions.RequestException):
+    """The connection ended before the whole file was received."""
+
+
+class RetryPolicy:
+    """Retry transient request failures with exponential backoff.
+
+    The delay before the retry ``n`` (starting at zero) is drawn
+    uniformly from ``[0, min(max_delay, base_delay * 2 ** n)]``, or is the
+    ``Retry-After`` of the response, when longer.
+
+    Args:
+        attempts (int): Maximum number of attempts, including the first.
+        base_delay (float): Seconds of the first backoff window.
+        max_delay (float): Largest backoff, in seconds.
+        rng (:obj:`random.Random`): Random generator of the jitter.
+        sleep (callable): Function used to wait.
+
+    Attributes:
+        retries: Number of retries made.
+
+    """
+
+    def __init__(self, attempts=5, base_delay=0.5, max_delay=30.0, rng=None,
+                 sleep=time.sleep):
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._rng = rng or random.Random()
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.retries = 0
+
+    @classmethod
+    def is_retryable(cls, error):
+        """Check if a request failure is transient.
+
+        Args:
+            error (Exception): The failure.
+
+        Returns:
+            Boolean indicating if the request should be retried.
+
+        """
+        if isinstance(error, requests.exceptions.HTTPError):
+            response = error.response
+            return response is not None and response.status_code in RETRY_STATUS
+        return isinstance(error, (requests.exceptions.ConnectionError,
+                                  requests.exceptions.Timeout,
+                                  requests.exceptions.ChunkedEncodingError,
+                                  IncompleteDownload))
+
+    def backoff(self, attempt):
+        """Seconds to wait before a retry.
+
+        Args:
+            attempt (int): Number of the failed attempt, starting at zero.
+
+        Returns:
+            The jittered delay.
+
+        """
+        with self._lock:
+            return self._rng.uniform(
+                0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def _retry_after(self, error):
+        """Seconds asked by the server in the Retry-After header, or 0."""
+        response = getattr(error, 'response', None)
+        value = response.headers.get('Retry-After', '') if response is not None else ''
+        return min(self.max_delay, float(value)) if value.isdigit() else 0.0
+
+    def call(self, func, *args, on_retry=None, **kwargs):
+        """Call a function, retrying it on transient failures.
+
+        Args:
+            func (callable): The function making the request.
+            *args: Positional arguments of func.
+            on_retry (callable): Called with the failure and the delay
+                before each retry.
+            **kwargs: Keyword arguments of func.
+
+        Returns:
+            The value returned by func.
+
+        Raises:
+            RequestException: The last failure, when it is not transient or
+                the attempts are over.
+
+        """
+        for attempt in range(self.attempts):
+            try:
+                return func(*args, **kwargs)
+            except requests.exceptions.RequestException as error:
+                if attempt + 1 == self.attempts or not self.is_retryable(error):
+                    raise
+                delay = max(self.backoff(attempt), self._retry_after(error))
+                with self._lock:
+                    self.retries += 1
+                if on_retry is not None:
+                    on_retry(error, delay)
+                self._sleep(delay)
+
+
+class TokenBucket:
+    """Token bucket limiting the rate of requests.
+
+    Args:
+        rate (float): Tokens added per second.
+        capacity (float): Largest burst of requests, defaults to the rate.
+        clock (callable): Function returning the current time in seconds.
+        sleep (callable): Function used to wait.
+
+    """
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic,
+                 sleep=time.sleep):
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1.0, rate))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """Take tokens from the bucket, waiting until they are available.
+
+        Args:
+            tokens (float): Number of tokens taken.
+
+        Returns:
+            Seconds waited.
+
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+
+class AdaptiveLimiter:
+    """Concurrency limit adjusted by additive increase, multiplicative decrease.
+
+    Used as a context manager around each request. The outcome of the
+    requests is reported with :meth:`feedback`: a failure, or a response
+    slower than the latency target, multiplies the limit by `decrease`,
+    and each success adds ``increase / limit``, i.e. `increase` slots
+    per round of successful requests.
+
+    Args:
+        limit (int): Initial limit, also the largest one when `maximum` is
+            not informed.
+        minimum (int): Smallest limit.
+        maximum (int): Largest limit.
+        increase (float): Slots added per round of successes.
+        decrease (float): Factor applied to the limit on failures.
+        latency_target (float): Seconds above which a response counts as
+            a congestion signal. Latency is ignored when None.
+
+    """
+
+    def __init__(self, limit, minimum=1, maximum=None, increase=1.0,
+                 decrease=0.5, latency_target=None):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum or limit)
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self._limit = float(min(max(limit, self.minimum), self.maximum))
+        self._active = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self):
+        """int: Current number of simultaneous requests allowed."""
+        return max(self.minimum, int(self._limit))
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *_):
+        self.release()
+
+    def acquire(self):
+        """Wait for a free slot and take it."""
+        with self._condition:
+            while self._active >= self.limit:
+                self._condition.wait()
+            self._active += 1
+
+    def release(self):
+        """Give a slot back."""
+        with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    def feedback(self, success, latency=None):
+        """Adjust the limit with the outcome of a request.
+
+        Args:
+            success (bool): Whether the request succeeded.
+            latency (float): Seconds the request took.
+
+        """
+        slow = (self.latency_target is not None and latency is not None
+                and latency > self.latency_target)
+        with self._condition:
+            if not success or slow:
+                self._limit = max(self.minimum, self._limit * self.decrease)
+            else:
+                self._limit = min(self.maximum,
+                                  self._limit + self.increase / self._limit)
+            self._condition.notify_all()
@@ -2,7 +2,7 @@
 
 import re
 import os
-import joblib
+from dodfminer.extract.polished.backend import model_store
 from dodfminer.extract.polished.acts.base import Atos
 
 
@@ -20,12 +20,12 @@ class Retirements(Atos):
     def _load_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/models/aposentadoria.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _load_seg_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/seg_models/aposentadoria.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _act_name(self):
         return "Aposentadoria"
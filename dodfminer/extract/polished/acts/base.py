@@ -12,6 +12,9 @@ import pandas as pd
 from dodfminer.extract.polished.backend.regex import ActRegex
 from dodfminer.extract.polished.backend.ner import ActNER
 from dodfminer.extract.polished.backend.seg import ActSeg
+from dodfminer.extract.polished.backend import spans
+from dodfminer.extract.pure.utils import block_store
+from dodfminer.extract.pure.core import DODFText
 
 
 class Atos(ActRegex, ActNER, ActSeg):  # pylint: disable=too-many-instance-attributes
@@ -40,6 +43,19 @@ class Atos(ActRegex, ActNER, ActSeg):  # pylint: disable=too-many-instance-attri
 
     """
 
+    # Proprieties searched in the matches of the act rule, after the
+    # regular ones
+    _special_acts = []
+
+    # Whether the proprieties of the ner backend are predicted by the
+    # model, so the acts of a batch of DODFs are predicted together
+    _batch_props = True
+
+    # Set on the acts of a batch, which are segmented on init and have
+    # their proprieties extracted by extract_batch
+    _deferred = False
+    _batch_preds = None
+
     def __init__(self, file_name, backend='regex', pipeline=None):
         if pipeline is not None:
             print("Personal acts does not support pipeline")
@@ -48,8 +64,13 @@ class Atos(ActRegex, ActNER, ActSeg):  # pylint: disable=too-many-instance-attri
         self._pred = None
         super().__init__()
 
-        if file_name[-5:] == '.json':
+        if isinstance(file_name, DODFText):
+            self._text = str(file_name)
+            self._file_name = file_name.file_name
+        elif file_name[-5:] == '.json':
             self.read_json(file_name)
+        elif file_name.endswith(block_store.BLOCKS_EXTENSION):
+            self.read_blocks(file_name)
         else:
             self.read_txt(file_name)
 
@@ -57,6 +78,47 @@ class Atos(ActRegex, ActNER, ActSeg):  # pylint: disable=too-many-instance-attri
         self._columns = self._props_names() + self._standard_props_names()
 
         self._raw_acts = self._seg_function()
+        if not self._deferred:
+            self._extract()
+
+    @classmethod
+    def extract_batch(cls, files, backend='regex'):
+        """Extract the acts of many DODFs, predicting them together.
+
+        Each DODF is segmented by its own act object. With the ner
+        backend, the acts of all the DODFs are then predicted by a single
+        call of the model, instead of a call for each act.
+
+        Args:
+            files (list): The DODFs, as DODFText or file paths.
+            backend (str): The mechanism to use in extraction.
+
+        Returns:
+            A list with the act object of each DODF.
+
+        """
+        acts = []
+        for file_name in files:
+            act = cls.__new__(cls)
+            act._deferred = True
+            act.__init__(file_name, backend)
+            acts.append(act)
+
+        # The backend falls back to regex when the act has no model
+        batch = [act for act in acts if act._backend == 'ner' and act._batch_props]
+        sequences = [act._sequences(act._raw_acts) for act in batch]
+        preds = [seq for seqs in sequences for seq in seqs]
+        if preds:
+            preds = batch[0]._model.predict(preds)
+        for act, seqs in zip(batch, sequences):
+            act._batch_preds, preds = preds[:len(seqs)], preds[len(seqs):]
+
+        for act in acts:
+            act._extract()
+        return acts
+
+    def _extract(self):
+        """Extract the proprieties of the acts segmented, to the dataframe."""
         self._acts = self._extract_props()
         self._data_frame = self._build_dataframe()
 
@@ -145,7 +207,8 @@ class Atos(ActRegex, ActNER, ActSeg):  # pylint: disable=too-many-instance-attri
         match = re.search(r'(\d+\-\d+\-\d+)',file) if file else None
         file_split = file.split() if file else None
 
-        act['DODF_Fonte_Arquivo'] = file.replace('.txt', '.pdf') if file else None
+        act['DODF_Fonte_Arquivo'] = file.replace('.txt', '.pdf').replace(
+            block_store.BLOCKS_EXTENSION, '.pdf') if file else None
         act['DODF_Fonte_Data'] = match.group(1).replace('-', '/') if match else None
         act['DODF_Fonte_Numero'] = file_split[1] if file_split and len(file_split)>=2 else None
 
@@ -182,17 +245,25 @@ class Atos(ActRegex, ActNER, ActSeg):  # pylint: disable=too-many-instance-attri
     def _extract_props(self):
         """Extract proprieties of all the acts.
 
+        With the ner backend, the acts are predicted by a single call of
+        the model, or come predicted by a batch.
+
         Returns:
             A vector of extracted acts dictionaries.
         """
 
         acts = []
-        for value in self._raw_acts:
+        self._prop_spans = []
+        predictions = []
+        if self._backend == 'ner':
+            preds, self._batch_preds = self._batch_preds, None
+            predictions = self._predictions(self._raw_acts, preds)
+        for index, (value, start) in enumerate(zip(self._raw_acts, self._body_starts())):
             act = {}
             if self._backend == 'regex':
-                act = self._regex_props(value)
+                act = self._regex_props(value, start)
             elif self._backend == 'ner':
-                act = self._prediction(value)
+                act = predictions[index]
             else:
                 raise NotImplementedError("Non-existent backend option")
             # Merge act props with standard props
@@ -200,6 +271,51 @@ class Atos(ActRegex, ActNER, ActSeg):  # pylint: disable=too-many-instance-attri
 
         return acts
 
+    def extract_texts(self, texts):
+        """Extract proprieties of acts already segmented.
+
+        Each text is taken as a single act of this type, so the DODF is
+        not segmented again, only the body of each act is located. Acts
+        with special proprieties, which come from the matches of the act
+        rule, are matched again in the texts.
+
+        Args:
+            texts ([str]): The acts texts.
+
+        Returns:
+            The dataframe of the acts, as `data_frame`.
+        """
+        self._preds = []
+        self._inst_spans = []
+        if self._special_acts:
+            self._text = "".join(text + ".\n" for text in texts)
+            self._acts_str = []
+            self._raw_acts = self._seg_function()
+        else:
+            self._acts_str = list(texts)
+            self._raw_acts = [self._act_body(text) for text in texts]
+        self._acts = self._extract_props()
+        self._data_frame = self._build_dataframe()
+        return self._data_frame
+
+    def _act_body(self, text):
+        """Body of a single act, where the regex proprieties are searched.
+
+        Args:
+            text (str): The act text.
+
+        Returns:
+            The body matched by the act rule, or the whole text when the
+            rule does not match it or the backend is not regex.
+        """
+        if self._backend != 'regex':
+            return text
+        # The act text does not have the end of the act rule
+        match = re.search(self._inst_rule, text + ".\n", flags=self._flags)
+        if match is None or (match.lastindex or 0) < 2:
+            return text
+        return match.group(2)
+
     def highlight_dataframe(self):
         if self._preds is None:
             return
@@ -210,60 +326,8 @@ class Atos(ActRegex, ActNER, ActSeg):  # pylint: disable=too-many-instance-attri
             ent_dict['text'] = ""
 
             text_split = self._split_sentence(text) + ["O"]
-            # print(len(text_split))
-            # print(len(IOB))
-
-            ent_list = []
-
-            aux_text_token = []
-            aux_text_string = ""
-
-            i = 0
-            while i < len(IOB):
-                current_ent = {
-                    "name": [],
-                    "start": None,
-                    "end": None,
-                    "type": None
-                }
-
-                if "B-" in IOB[i]:
-                    entity_name = IOB[i].replace("B-", "")
-                    aux_text_string = " ".join(aux_text_token).strip()
-                    aux_text_token.append(text_split[i])
-
-                    current_ent["start"] = len(aux_text_string) + 1
-                    current_ent["name"].append(text_split[i])
-                    current_ent["type"] = entity_name
-
-                    i += 1
-
-                    while (i < len(IOB)) and ("I-" in IOB[i]):
-                        current_ent["name"].append(text_split[i])
-                        aux_text_token.append(text_split[i])
-
-                        i += 1
-
-                    aux_text_string = " ".join(aux_text_token)
-                    current_ent["end"] = len(aux_text_string)
-                    current_ent["name"] = " ".join(current_ent["name"]).strip()
-                    ent_list.append(current_ent)
-                    if entity_name in ent_dict:
-                
-                        new_list = [ent_dict[entity_name]]
-            
-                        new_list.append(current_ent)
-                        ent_dict[entity_name] = new_list
-                    else:
-                        ent_dict[entity_name] = current_ent
-                
-                elif IOB[i] == 'O':
-                    aux_text_token.append(text_split[i])
-                    aux_text_string = " ".join(aux_text_token).strip()
-
-                i += 1
-
-            ent_dict['text'] = aux_text_string
+            entities, ent_dict['text'] = spans.joined_entity_spans(IOB, text_split)
+            spans.add_highlights(ent_dict, entities)
             self._data_frame.append(ent_dict)
         self._data_frame = pd.DataFrame(self._data_frame)
 
@@ -298,6 +362,19 @@ class Atos(ActRegex, ActNER, ActSeg):  # pylint: disable=too-many-instance-attri
         self._text = unicodedata.normalize('NFKD', self._text).encode(
             'ascii', 'ignore').decode('utf8')
 
+    def read_blocks(self, file_name):
+        """Reads a .blocks file of a DODF.
+
+        A single string with the text of all blocks is extracted, the same
+        text as a .txt file written from those blocks.
+        """
+        try:
+            self._text = block_store.read_text(file_name)
+            self._file_name = file_name
+        except (IOError, ValueError):
+            self._text = file_name
+            self._file_name = None
+
     def read_txt(self, file_name):
         """Reads a .txt file of a DODF.
 
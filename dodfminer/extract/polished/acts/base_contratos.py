@@ -2,34 +2,43 @@ import warnings
 warnings.filterwarnings('ignore')
 
 import pandas as pd
-import joblib
 import json
-import nltk
 import os
 
 from sklearn.pipeline import Pipeline
 from dodfminer.extract.polished.backend.pipeline import feature_extractor, PipelineCRF
+from dodfminer.extract.polished.backend import spans, model_store
+from dodfminer.extract.polished.acts import section3
+from dodfminer.extract.polished import resources
 
 class AtosContrato:
-  
+
+  def __init_subclass__(cls, **kwargs):
+    super().__init_subclass__(**kwargs)
+    # Subclasses are routed together, see section3.Section3Router
+    section3.register(cls)
+
   @property
   def acts_str(self):
     if len(self.atos_encontrados) == 0: return []
     return self.atos_encontrados['texto'].tolist()
 
-  def __init__(self, file, model_path, backend = None, pipeline = None):
+  def __init__(self, file, model_path, backend = None, pipeline = None, acts = None):
     self.pipeline = pipeline
+    self._acts = acts
     self.filename = file
     self.file = None
     self.atos_encontrados = []
     self.predicted = []
+    self.tokens = []
+    self.spans = []
     self.data_frame = []
     self.enablePostProcess = True
     self.useDefault = True
     self.model_path = model_path
 
-    #download punkt 
-    nltk.download('punkt', quiet=True)
+    # punkt is resolved once per process, never downloaded here
+    resources.require('punkt')
 
     # Inicializar fluxo
     self.flow()
@@ -39,6 +48,7 @@ class AtosContrato:
     if len(self.atos_encontrados) == 0: 
       self.data_frame = pd.DataFrame()
       return 
+    self.tokenize()
     self.ner_extraction()
     if self.enablePostProcess: 
       self.post_process()
@@ -50,7 +60,7 @@ class AtosContrato:
     if self.pipeline is None:
       f_path = os.path.dirname(__file__)
       f_path += self.model_path
-      model = joblib.load(f_path)
+      model = model_store.load(f_path)
       pipeline_CRF_default = Pipeline([('feat', feature_extractor()), ('crf', PipelineCRF(model))])
       self.pipeline = pipeline_CRF_default
     else:
@@ -61,22 +71,47 @@ class AtosContrato:
         self.enablePostProcess = False
 
     # Segmentation
-    if self.filename[-5:] == '.json':
-      with open(self.filename, 'r') as f:
-        self.file = json.load(f)
-        self.atos_encontrados = self.segment(self.file)
+    if self._acts is not None:
+      self.atos_encontrados = self._acts
+    elif self.filename[-5:] == '.json':
+      # The JSON is parsed and routed once for all the contract classes
+      self.atos_encontrados = section3.route_file(self.filename)[type(self)]
     else:
       pass
 
-  def segment(self, file):
+  @classmethod
+  def _match(cls, titulo, texto):
+    """Number of times an act of the Seção III is selected, usually 0 or 1."""
     raise NotImplementedError
 
+  def segment(self, file):
+    return section3.Section3Router([type(self)]).route(file)[type(self)]
+
+  def tokenize(self):
+    # Each act is tokenized once, with the character span of each token,
+    # and the tokens are reused by the prediction and post-processing
+    texts = self.atos_encontrados['texto'].tolist()
+    if self.useDefault:
+      self.tokens = [self.pipeline['feat'].tokenize(text) for text in texts]
+    elif self.enablePostProcess:
+      self.tokens = [list(tokens) for tokens in self.pipeline['pre-processing'].transform(texts)]
+    else:
+      self.tokens = []
+    self.spans = [spans.token_spans(tokens, text) for tokens, text in zip(self.tokens, texts)]
+
   def ner_extraction(self):
-    pred = self.pipeline.predict(self.atos_encontrados['texto'])
+    if self.useDefault:
+      # feature_extractor does not tokenize the acts again
+      pred = self.pipeline.predict(self.tokens)
+    elif self.enablePostProcess and self.pipeline.steps[0][0] == 'pre-processing':
+      # The acts were already pre-processed by tokenize
+      pred = self.pipeline[1:].predict(self.tokens)
+    else:
+      pred = self.pipeline.predict(self.atos_encontrados['texto'])
     self.predicted = pred
 
   def post_process(self):
-    for IOB, text, numdodf, titulo in zip(self.predicted, self.atos_encontrados['texto'], self.atos_encontrados['numero_dodf'], self.atos_encontrados['titulo']):
+    for IOB, text, text_split, numdodf, titulo in zip(self.predicted, self.atos_encontrados['texto'], self.tokens, self.atos_encontrados['numero_dodf'], self.atos_encontrados['titulo']):
       ent_dict = {
         'numero_dodf': '',
         'titulo': '',
@@ -87,11 +122,6 @@ class AtosContrato:
       ent_dict['text'] = text
       entities = []
 
-      if self.useDefault:
-        text_split = nltk.word_tokenize(text)
-      else:
-        text_split = self.pipeline['pre-processing'].transform([text])[0]
-
       ent_concat = ('', '')
       aux = 0
       for ent, word in zip(IOB, text_split):
@@ -127,67 +157,12 @@ class AtosContrato:
     if len(self.atos_encontrados) == 0:
       return
     self.data_frame = []
-    for IOB, text, _, titulo in zip(self.predicted, self.atos_encontrados['texto'], self.atos_encontrados['numero_dodf'], self.atos_encontrados['titulo']):
+    for IOB, text, text_split, token_spans, titulo in zip(self.predicted, self.atos_encontrados['texto'], self.tokens, self.spans, self.atos_encontrados['titulo']):
       ent_dict = dict() 
-      # ent_dict['numero_dodf'] = numdodf
       ent_dict['titulo'] = titulo
-      ent_dict['text'] = ""
-
-      if self.useDefault:
-        text_split = nltk.word_tokenize(text)
-      else:
-        text_split = self.pipeline['pre-processing'].transform([text])[0]
-
-      ent_list = []
-
-      aux_text_token = []
-      aux_text_string = ""
-
-      i = 0
-      while i < len(IOB):
-          current_ent = {
-              "name": [],
-              "start": None,
-              "end": None,
-              "type": None
-          }
-
-          if "B-" in IOB[i]:
-              entity_name = IOB[i].replace("B-", "")
-              aux_text_string = " ".join(aux_text_token).strip()
-              aux_text_token.append(text_split[i])
-
-              current_ent["start"] = len(aux_text_string) + 1
-              current_ent["name"].append(text_split[i])
-              current_ent["type"] = entity_name
-
-              i += 1
-
-              while (i < len(IOB)) and ("I-" in IOB[i]):
-                  current_ent["name"].append(text_split[i])
-                  aux_text_token.append(text_split[i])
-
-                  i += 1
-
-              aux_text_string = " ".join(aux_text_token)
-              current_ent["end"] = len(aux_text_string)
-              current_ent["name"] = " ".join(current_ent["name"]).strip()
-              ent_list.append(current_ent)
-              if entity_name in ent_dict:
-          
-                new_list = [ent_dict[entity_name]]
-     
-                new_list.append(current_ent)
-                ent_dict[entity_name] = new_list
-              else:
-                ent_dict[entity_name] = current_ent
-          
-          elif IOB[i] == 'O':
-              aux_text_token.append(text_split[i])
-              aux_text_string = " ".join(aux_text_token).strip()
-
-          i += 1
-
-      ent_dict['text'] = aux_text_string
+      # The offsets are the spans of the tokens in the act text
+      ent_dict['text'] = text
+
+      spans.add_highlights(ent_dict, spans.entity_spans(IOB, text_split, token_spans))
       self.data_frame.append(ent_dict)
     self.data_frame = pd.DataFrame(self.data_frame)
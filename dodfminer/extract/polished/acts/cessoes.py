@@ -1,10 +1,10 @@
 import re
 import os
 from typing import List, Match
-import joblib
 import pandas as pd
 import numpy as np
 
+from dodfminer.extract.polished.backend import model_store
 from dodfminer.extract.polished.acts.base import Atos
 
 
@@ -48,6 +48,9 @@ class Cessoes(Atos):
 
     _special_acts = ['matricula', 'cargo']
 
+    # The proprieties are extracted by the rules, with any backend
+    _batch_props = False
+
     def __init__(self, file, backend, debug=False, extra_search=True, pipeline = None):
         self._debug = debug
         self._extra_search = extra_search
@@ -58,12 +61,12 @@ class Cessoes(Atos):
     def _load_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/models/cessao.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _load_seg_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/seg_models/cessao.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _act_name(self):
         return "Cessoes"
@@ -135,23 +138,32 @@ class Cessoes(Atos):
                 re.search(MATRICULA_ENTRE_VIRGULAS, act)
 
             nome = re.search(self._rules['nome'], act)
+            spans = []
             if matricula and nome:
                 offset = matricula.end()-1 if 0 <= (matricula.start() - nome.end()) <= 5 \
                     else nome.end() - 1
                 cargo, = self._find_prop_value(
-                    r",(?P<cargo>[^,]+)", act[offset:])
+                    r",(?P<cargo>[^,]+)", act[offset:], spans)
             else:
                 cargo = np.nan
 
             lis_matches[i]['matricula'] = matricula.group('matricula') if matricula \
                 else np.nan
             lis_matches[i]['cargo'] = cargo
-
-    def _find_prop_value(self, rule, act):
+            if matricula:
+                self._prop_spans[i]['matricula'] = (
+                    match.start() + matricula.start('matricula'),
+                    match.start() + matricula.end('matricula'))
+            if spans:
+                self._prop_spans[i]['cargo'] = (match.start() + offset + spans[0][0],
+                                                match.start() + offset + spans[0][1])
+
+    def _find_prop_value(self, rule, act, spans=None):
         """Returns named group, or the whole match if no named groups
                 are present on the match.
         Args:
             match: a re.Match object
+            spans: list where the span of the named group is appended
         Returns: content of the unique named group found at match,
             the whole match if there are no groups at all or raise
             an exception if there are more than two groups.
@@ -167,14 +179,17 @@ class Cessoes(Atos):
                     "Named regex must have AT MOST ONE NAMED GROUP.")
             if self._debug:
                 print('key: ', keys[0])
+            if spans is not None:
+                spans.append(match.span(keys[0]))
             return (match.group(keys[0]),)
         return np.nan
 
     def _extract_props(self):
         acts = []
+        self._prop_spans = []
 
-        for raw in self._raw_acts:
-            act = self._regex_props(raw)
+        for raw, start in zip(self._raw_acts, self._body_starts()):
+            act = self._regex_props(raw, start)
             # Merge act props with standard props
             acts.append(self.add_standard_props(act, capitalize=True))
         if self._extra_search:
@@ -184,6 +199,8 @@ class Cessoes(Atos):
     def _regex_instances(self) -> List[Match]:
         found = self._find_instances()
         self._acts_str = found.copy()
+        self._inst_spans = [(match.start(), match.start(), match.end())
+                            for match in self._raw_matches]
         return found
 
     def _build_dataframe(self):
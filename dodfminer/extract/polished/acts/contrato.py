@@ -2,7 +2,7 @@
 
 import re
 import os
-import joblib
+from dodfminer.extract.polished.backend import model_store
 import pandas as pd
 
 from dodfminer.extract.polished.acts.base import Atos
@@ -23,7 +23,7 @@ class Contratos(Atos):
         f_path = os.path.dirname(__file__)
         f_path += '/models/contratos_lbfgs.pkl'
         #f_path += '/models/contratos_l2sgd.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _act_name(self):
         return "Contrato"
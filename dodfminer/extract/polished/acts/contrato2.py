@@ -1,42 +1,20 @@
 import warnings
 warnings.filterwarnings('ignore')
 
-import pandas as pd
 import re
 
 from dodfminer.extract.polished.acts.base_contratos import AtosContrato
 
 class Contrato(AtosContrato):
 
-  def __init__(self, file, backend = None, pipeline = None):
-    super().__init__(file, backend=backend, pipeline=pipeline, model_path = '/models/modelo_contrato_convenio.pkl')
+  _regex_aditivo = re.compile(r'(?:ADITIVO)')
+  _regex_contrato = re.compile(r'(?:(EXTRATO\sD[OE]\sCONTRATO)|(CONTRATO\sSIMPLIFICADO)|(CONTRATO\sPARA\sAQUISIÇÃO)|(^CONTRATO)'\
+                              r'|(EXTRATO\sD[OE]\sTERMO\sD[OE]\sCONTRATO\sNº\s)|(EXTRATO\sAO\sCONTRATO)|(CONTRATO\sDE\sPRESTAÇÃO\sDE\sSERVIÇOS\sNº)'\
+                              r'|(CONTRATO\sDE\sPATROCÍNIO)|(CONTRATO\sDE\sCONCESSÃO\sDE)|(^CONTRATO\sNº)|(^EXTRATOS\sDE\sCONTRATO[S]*))')
 
-  def segment(self, file):
-    atos_contrato = {
-      'numero_dodf':[],
-      'titulo':[],
-      'texto':[]
-    }
-    df_atos_contrato = None
-    regex_contrato = r'(?:(EXTRATO\sD[OE]\sCONTRATO)|(CONTRATO\sSIMPLIFICADO)|(CONTRATO\sPARA\sAQUISIÇÃO)|(^CONTRATO)'\
-                            '|(EXTRATO\sD[OE]\sTERMO\sD[OE]\sCONTRATO\sNº\s)|(EXTRATO\sAO\sCONTRATO)|(CONTRATO\sDE\sPRESTAÇÃO\sDE\sSERVIÇOS\sNº)'\
-                            '|(CONTRATO\sDE\sPATROCÍNIO)|(CONTRATO\sDE\sCONCESSÃO\sDE)|(^CONTRATO\sNº)|(^EXTRATOS\sDE\sCONTRATO[S]*))'
-    
-    try:
-      section_3 = file['json']['INFO']['Seção III']
-      for orgao in section_3:
-        for documento in section_3[orgao]:
-          for ato in section_3[orgao][documento]:
+  def __init__(self, file, backend = None, pipeline = None, acts = None):
+    super().__init__(file, backend=backend, pipeline=pipeline, acts=acts, model_path = '/models/modelo_contrato_convenio.pkl')
 
-            titulo = section_3[orgao][documento][ato]['titulo']
-
-            if re.search(regex_contrato, titulo) is not None and re.search(r'(?:ADITIVO)', titulo) is None:
-              atos_contrato['numero_dodf'].append(file['json']['nu_numero'])
-              atos_contrato['titulo'].append(titulo)
-              atos_contrato['texto'].append(re.sub(r'<[^>]*>', '', titulo + " " + section_3[orgao][documento][ato]['texto']))
-
-      df_atos_contrato = pd.DataFrame(atos_contrato)
-    except KeyError:
-      print(f"Chave 'Seção III' não encontrada no DODF {file['lstJornalDia']}!")
-    return df_atos_contrato
-  
\ No newline at end of file
+  @classmethod
+  def _match(cls, titulo, texto):
+    return cls._regex_contrato.search(titulo) is not None and cls._regex_aditivo.search(titulo) is None
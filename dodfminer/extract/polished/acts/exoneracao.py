@@ -2,7 +2,7 @@
 
 import re
 import os
-import joblib
+from dodfminer.extract.polished.backend import model_store
 from dodfminer.extract.polished.acts.base import Atos
 
 
@@ -24,12 +24,12 @@ class Exoneracao(Atos):
     def _load_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/models/comissionados_exo.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _load_seg_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/seg_models/comissionados_exo.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def get_expected_colunms(self) -> list:
         return [
@@ -99,12 +99,12 @@ class ExoneracaoEfetivos(Atos):
     def _load_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/models/efetivos_exo.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _load_seg_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/seg_models/efetivos_exo.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _find_instances(self):
         _instances = []
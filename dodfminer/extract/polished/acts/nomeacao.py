@@ -1,7 +1,7 @@
 """Regras regex para ato de Nomeacao de Comissionados."""
 
 import os
-import joblib
+from dodfminer.extract.polished.backend import model_store
 from dodfminer.extract.polished.acts.base import Atos
 
 
@@ -23,12 +23,12 @@ class NomeacaoComissionados(Atos):
     def _load_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/models/comissionados_nome.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _load_seg_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/seg_models/comissionados_nome.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def get_expected_colunms(self) -> list:
         return [
@@ -99,12 +99,12 @@ class NomeacaoEfetivos(Atos):
     def _load_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/models/efetivos_nome.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _load_seg_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/seg_models/efetivos_nome.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def get_expected_colunms(self) -> list:
         return [
@@ -1,7 +1,7 @@
 """Regras regex para ato de retificação."""
 
 import os
-import joblib
+from dodfminer.extract.polished.backend import model_store
 from dodfminer.extract.polished.acts.base import Atos
 
 
@@ -23,12 +23,12 @@ class RetificacaoComissionados(Atos):
     def _load_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/models/comissionados_ret.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _load_seg_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/seg_models/comissionados_ret.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _rule_for_inst(self):
         return r"(No Decreto de)((.|\n)*?)(^((?!matr[ií]cula).|\n))*?((.|\n)*?)LEIA-?SE: \"?(\.\.\.)?.*(\.\.\.)?\"?\."
@@ -60,12 +60,12 @@ class RetificacaoEfetivos(Atos):
     def _load_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/models/efetivos_ret.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _load_seg_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/seg_models/efetivos_ret.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _rule_for_inst(self):
         return r"(Na Ordem de S|RETIFICAR)(((.|\n)*?)(matr[ií]cula)((.|\n)*?)LEIA-?SE: \"?(\.\.\.)?.*(\.\.\.)?\"?\.)"
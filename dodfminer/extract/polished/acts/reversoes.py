@@ -2,7 +2,7 @@
 
 import re
 import os
-import joblib
+from dodfminer.extract.polished.backend import model_store
 from dodfminer.extract.polished.acts.base import Atos
 
 
@@ -27,12 +27,12 @@ class Revertions(Atos):
     def _load_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/models/reversao.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _load_seg_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/seg_models/reversao.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def get_expected_colunms(self) -> list:
         return [
@@ -0,0 +1,175 @@
+"""Route the acts of the Seção III of a DODF JSON to the contract classes.
+
+Every contract-family class (:class:`~.base_contratos.AtosContrato`)
+selects its acts from the titles, and sometimes the texts, of the
+Seção III. Instead of each class loading the JSON and walking the whole
+section, the router parses the JSON once, walks the section once, and
+checks each act against the title patterns of every registered class,
+building the segmented acts of all of them in a single pass.
+
+Classes are registered when they are defined, and the modules of the
+contract-family acts are imported before routing with the registered
+classes, so all of them are routed together even when the acts are
+imported lazily. The result of the last routed files is kept, so
+extracting every section 3 act type from a file costs one parse and one
+traversal.
+
+Usage example::
+
+    from dodfminer.extract.polished.acts import section3
+
+    acts = section3.route_file('dodf.json')
+    licitacoes = acts[Licitacao]
+
+"""
+
+import importlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+SECTION = 'Seção III'
+"""str: Name of the section with the contract-family acts."""
+
+CACHE_SIZE = 4
+"""int: Number of routed files kept in memory."""
+
+_TAGS = re.compile(r'<[^>]*>')
+
+MODULES = ('contrato_convenio', 'aditamento', 'licitacao', 'suspensao',
+           'anulacao_revogacao', 'contrato2', 'convenio')
+"""tuple: Modules, in the acts package, of the contract-family classes."""
+
+_REGISTRY = []
+_CACHE = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def register(act_class):
+    """Register a contract-family class in the router.
+
+    Args:
+        act_class: Class with a ``_match(titulo, texto)`` classmethod.
+
+    """
+    if act_class not in _REGISTRY:
+        _REGISTRY.append(act_class)
+
+
+def _load_modules():
+    for module in MODULES:
+        importlib.import_module(f"{__package__}.{module}")
+
+
+def registered():
+    """Classes routed by default.
+
+    Returns:
+        A list with the registered classes.
+
+    """
+    _load_modules()
+    return list(_REGISTRY)
+
+
+class Section3Router:
+    """Segment the Seção III acts of several classes in a single traversal.
+
+    Args:
+        classes: Classes with a ``_match(titulo, texto)`` classmethod,
+            returning how many times an act is selected by the class,
+            usually 0 or 1. Defaults to the registered classes.
+
+    """
+
+    def __init__(self, classes=None):
+        self.classes = list(classes if classes is not None else registered())
+
+    def route(self, file):
+        """Segment the acts of every class from a parsed DODF JSON.
+
+        Args:
+            file: The DODF JSON, already parsed.
+
+        Returns:
+            A dict mapping each class to a dataframe with the columns
+            'numero_dodf', 'titulo' and 'texto' of its acts, or to None
+            when the DODF has no Seção III.
+
+        """
+        columns = {act_class: {'numero_dodf': [], 'titulo': [], 'texto': []}
+                   for act_class in self.classes}
+        try:
+            section_3 = file['json']['INFO'][SECTION]
+            for orgao in section_3.values():
+                for documento in orgao.values():
+                    for ato in documento.values():
+                        self._route_act(file, ato, columns)
+        except KeyError:
+            print(f"Chave '{SECTION}' não encontrada no DODF {file['lstJornalDia']}!")
+            return {act_class: None for act_class in self.classes}
+
+        return {act_class: pd.DataFrame(acts) for act_class, acts in columns.items()}
+
+    def _route_act(self, file, ato, columns):
+        """Append an act to the acts of every class selecting it."""
+        titulo = ato['titulo']
+        texto = None
+        for act_class, acts in columns.items():
+            times = act_class._match(titulo, ato['texto'])
+            if not times:
+                continue
+            if texto is None:
+                texto = _TAGS.sub('', titulo + " " + ato['texto'])
+            for _ in range(times):
+                acts['numero_dodf'].append(file['json']['nu_numero'])
+                acts['titulo'].append(titulo)
+                acts['texto'].append(texto)
+
+
+def _file_key(path):
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def route_file(path, classes=None):
+    """Segment the Seção III acts of a DODF JSON file, with a cache.
+
+    The file is parsed and routed once for all the classes, and the
+    result is kept for the next calls on the same, unchanged, file.
+
+    Args:
+        path (str): Path of the DODF JSON.
+        classes: Classes to be routed. Defaults to the registered classes.
+
+    Returns:
+        A dict mapping each class to a copy of its segmented acts, as
+        :meth:`Section3Router.route` returns, so a caller changing them
+        does not change the ones kept for the next calls.
+
+    """
+    classes = list(classes if classes is not None else registered())
+    key = _file_key(path)
+    with _CACHE_LOCK:
+        routed = _CACHE.get(key)
+        if routed is not None:
+            _CACHE.move_to_end(key)
+    if routed is None or any(act_class not in routed for act_class in classes):
+        with open(path, 'r') as file:
+            routed = Section3Router(classes).route(json.load(file))
+        with _CACHE_LOCK:
+            _CACHE[key] = routed
+            while len(_CACHE) > CACHE_SIZE:
+                _CACHE.popitem(last=False)
+    return {act_class: None if routed[act_class] is None else routed[act_class].copy()
+            for act_class in classes}
+
+
+def clear_cache():
+    """Forget the routed files."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
@@ -1,7 +1,7 @@
 import re
 import os
 from typing import List, Match
-import joblib
+from dodfminer.extract.polished.backend import model_store
 import pandas as pd
 import numpy as np
 from dodfminer.extract.polished.acts.base import Atos
@@ -62,6 +62,9 @@ class SemEfeitoAposentadoria(Atos):
         'matricula',
     ]
 
+    # The proprieties are extracted by the rules, with any backend
+    _batch_props = False
+
     _BAD_MATCH_WORDS = [
         "AVERBAR",
         "NOMEAR",
@@ -92,12 +95,12 @@ class SemEfeitoAposentadoria(Atos):
     def _load_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/models/sem_efeito_apo.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _load_seg_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/seg_models/sem_efeito_apo.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _act_name(self):
         return "Atos tornados sem efeito - aposentadoria"
@@ -256,16 +259,21 @@ class SemEfeitoAposentadoria(Atos):
             curr_dict['cargo_efetivo'] = cargo_efetivo
             curr_dict['tipo_edicao'] = tipo_edicao
 
-    def _find_prop_value(self, rule, act):
+    def _find_prop_value(self, rule, act, spans=None):
         """Returns named group, or the whole match if no named groups
                 are present on the match.
         Args:
             match: a re.Match object
+            spans: list where the span of the group solved is appended
         Returns: content of the unique named group found at match,
             the whole match if there are no groups at all or raise
             an exception if there are more than two groups.
         """
         match = re.search(rule, act, flags=self._flags)
+        if match and spans is not None:
+            group = list(match.groupdict())[0] if match.groupdict() else 0
+            if match.group(group) is not None:
+                spans.append(match.span(group))
         return (match,)
 
     @classmethod
@@ -289,17 +297,33 @@ class SemEfeitoAposentadoria(Atos):
 
     def _extract_props(self):
         acts = []
-        for raw in self._raw_acts:
-            act = self._regex_props(raw)
+        self._prop_spans = []
+        for raw, start in zip(self._raw_acts, self._body_starts()):
+            act = self._regex_props(raw, start)
             # Merge act props with standard props
             acts.append(self.add_standard_props(act, capitalize=True))
         if self._extra_search:
             self._get_special_acts(acts)
+            # Searched again in pieces of the acts
+            for spans in self._prop_spans:
+                for key in self._special_acts:
+                    spans.pop(key, None)
         return acts
 
     def _regex_instances(self) -> List[Match]:
         found = self._find_instances()
         self._acts_str = found.copy()
+        # The acts are matched in pieces of the text, so they are located
+        # in it again, with no span when not found
+        self._inst_spans = []
+        pos = 0
+        for act in found:
+            start = self._text.find(act, pos)
+            if start == -1:
+                self._inst_spans.append((None, None, None))
+                continue
+            pos = start + len(act)
+            self._inst_spans.append((start, start, pos))
         return found
 
     def _build_dataframe(self):
@@ -1,7 +1,7 @@
 import re
 import os
 from typing import List, Match
-import joblib
+from dodfminer.extract.polished.backend import model_store
 from dodfminer.extract.polished.acts.base import Atos
 
 class SemEfeitoExoNom(Atos):
@@ -22,12 +22,12 @@ class SemEfeitoExoNom(Atos):
     def _load_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/models/sem_efeito_exo_nom.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _load_seg_model(self):
         f_path = os.path.dirname(__file__)
         f_path += '/seg_models/sem_efeito_exo_nom.pkl'
-        return joblib.load(f_path)
+        return model_store.load(f_path)
 
     def _rule_for_inst(self):
         return r"TORNAR(\s+)SEM(\s+)EFEITO" + r"([^\n]+\n){0,10}?[^\n]*?" + r"exonerou|nomeou"
@@ -5,6 +5,8 @@ functions for preprocessing and classification with a committee
 of classifiers.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import nltk
 import numpy as np
 import joblib
@@ -12,6 +14,8 @@ import joblib
 from sklearn.pipeline import make_pipeline
 from sklearn.preprocessing import FunctionTransformer
 
+from dodfminer.extract.polished import resources
+
 
 class Committee:
     """Committee class.
@@ -20,24 +24,26 @@ class Committee:
 
     Args:
         path (str): The path to the models file.
+        n_jobs (int): Number of classifiers predicting at the same time.
+            Defaults to 1, one classifier after the other.
 
     The models file needs to contain a list of classifiers and an object
     with the transform function to be used as embedding.
     """
 
-    def __init__(self, path):
+    def __init__(self, path, n_jobs=1):
         self.var_y = []
+        self.n_jobs = n_jobs
         self.pipe = make_pipeline(FunctionTransformer(self.remove_not_words),
                                   FunctionTransformer(self.embedding),
                                   FunctionTransformer(self.predict),
                                   FunctionTransformer(self.get_new_labels))
 
-        nltk.download('punkt', quiet=True)
-        nltk.download('rslp', quiet=True)
-        nltk.download('stopwords', quiet=True)
+        resources.require('rslp', 'stopwords')
 
-        self.stopwords = nltk.corpus.stopwords.words('portuguese')
+        self.stopwords = set(nltk.corpus.stopwords.words('portuguese'))
         self.stemmer = nltk.stem.RSLPStemmer()
+        self._stems = {}
 
         self.load_models(path)
 
@@ -59,9 +65,18 @@ class Committee:
 
     def tokenize(self, text):
         """ Used by the vectorizer to tokenize text. """
+        # The vectorizer only sees texts without punctuation, so the
+        # sentence splitting of word_tokenize is skipped
         tokens = [word.lower()
-                  for word in nltk.word_tokenize(text) if len(word) > 1]
-        return [self.stemmer.stem(item) for item in tokens if item not in self.stopwords]
+                  for word in nltk.word_tokenize(text, preserve_line=True) if len(word) > 1]
+        return [self.stem(item) for item in tokens if item not in self.stopwords]
+
+    def stem(self, word):
+        """ Stems a word, remembering the stems already found. """
+        stem = self._stems.get(word)
+        if stem is None:
+            stem = self._stems[word] = self.stemmer.stem(word)
+        return stem
 
     @classmethod
     def remove_not_words(cls, text):
@@ -74,10 +89,11 @@ class Committee:
 
     def predict(self, text):
         """ Generates classifiers predictions for the data. """
-        results = []
-        for clf in self.clfs:
-            predicted = clf.predict(text)
-            results.append(predicted)
+        if self.n_jobs == 1 or len(self.clfs) < 2:
+            results = [clf.predict(text) for clf in self.clfs]
+        else:
+            with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+                results = list(executor.map(lambda clf: clf.predict(text), self.clfs))
 
         return np.array(results).T
 
@@ -87,12 +103,34 @@ class Committee:
         If the committee does not agree on any label for an act,
         the original label is maintained.
         """
-        new_types = []
-        for i,_ in enumerate(results):
-            results_dict = dict(zip(*np.unique(results[i], return_counts=True)))
-            res_max = max(results_dict, key=results_dict.get)
-            if results_dict[res_max] >= 0.5 and res_max != self.var_y[i]:
-                new_types.append(res_max)
-            else:
-                new_types.append(self.var_y[i])
-        return new_types
+        return majority_vote(results, self.var_y)
+
+
+def majority_vote(results, labels):
+    """ Decides the label of each act from the classifiers predictions.
+
+    The votes of all the acts are counted at once. Ties go to the
+    label that sorts first.
+
+    Args:
+        results: Matrix with a row for each act and a column with the
+            predictions of each classifier.
+        labels: Original label of each act.
+
+    Returns:
+        A list with the new label of each act.
+    """
+    results = np.asarray(results)
+    labels = list(labels)
+    if results.size == 0:
+        return labels
+
+    classes, codes = np.unique(results, return_inverse=True)
+    codes = codes.reshape(results.shape)
+    votes = np.zeros((results.shape[0], len(classes)), dtype=int)
+    np.add.at(votes, (np.arange(results.shape[0])[:, None], codes), 1)
+    winners = votes.argmax(axis=1)
+    agreed = votes[np.arange(len(winners)), winners] >= 0.5
+
+    return [classes[winner] if agree and classes[winner] != label else label
+            for winner, agree, label in zip(winners, agreed, labels)]
@@ -0,0 +1,220 @@
+"""Store of the CRF models of the NER backend.
+
+The CRF models ship as pickled ``sklearn_crfsuite`` objects, under the
+``models`` and ``seg_models`` folders of the acts. Unpickling one writes
+its CRFsuite model to a temporary file and opens a tagger on it, and
+every act object used to do that again.
+
+The store converts the pickles, once, to native CRFsuite model files
+next to them::
+
+    dodfminer convert
+
+and loads each model once per process, opening a tagger directly on
+its native file, or on the pickle when it was not converted. The models
+loaded before a pool of worker processes is forked, with
+:func:`preload`, are shared by the workers.
+
+Usage example::
+
+    from dodfminer.extract.polished.backend import model_store
+
+    model = model_store.load('acts/models/aposentadoria.pkl')
+    tags = model.predict_single(features)
+
+"""
+
+import glob
+import os
+import shutil
+import threading
+
+import joblib
+from sklearn_crfsuite import CRF
+
+MODELS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'acts')
+"""str: Folder with the model folders of the acts."""
+
+MODEL_FOLDERS = ('models', 'seg_models')
+"""tuple: Folders, in MODELS_PATH, of the pickled CRF models."""
+
+NATIVE_EXTENSION = '.crfsuite'
+"""str: Extension of the native CRFsuite model files."""
+
+_MODELS = {}
+_LOCK = threading.Lock()
+
+
+class NativeCRF(CRF):
+    """CRF model opened from a native CRFsuite model file.
+
+    A ``sklearn_crfsuite.CRF`` whose model file is the native one, so it
+    predicts with the same CRFsuite tagger as the pickled model. A model
+    is shared by the acts of a process, so its tagger is used by one
+    thread at a time, by the predictions and the marginals. A model of the store is pickled as its pickle
+    path, and unpickled from the store of the receiving process.
+
+    Attributes:
+        path (str): The native model file.
+        pickled (str): The pickle the model was loaded for, if any.
+
+    """
+
+    def __init__(self, path, pickled=None, source=None):
+        super().__init__(model_filename=path)
+        self.path = path
+        self.pickled = pickled
+        self.source = source
+        self._lock = threading.Lock()
+        # Opens the tagger
+        self.classes_  # pylint: disable=pointless-statement
+
+    def predict_single(self, xseq):
+        """Predict the labels of a sequence.
+
+        Args:
+            xseq (list): Feature dicts of the sequence.
+
+        Returns:
+            A list with the predicted labels.
+
+        """
+        with self._lock:
+            return self.tagger_.tag(xseq)
+
+    def predict(self, X):
+        """Predict the labels of many sequences, in a single call.
+
+        Args:
+            X (list): Feature dicts of each sequence.
+
+        Returns:
+            A list with the predicted labels of each sequence.
+
+        """
+        with self._lock:
+            return [self.tagger_.tag(xseq) for xseq in X]
+
+    def predict_marginals_single(self, xseq):
+        """Predict the probability of each label at each position.
+
+        Args:
+            xseq (list): Feature dicts of the sequence.
+
+        Returns:
+            A list with a dict of the label probabilities of each item.
+
+        """
+        with self._lock:
+            return super().predict_marginals_single(xseq)
+
+    def __reduce__(self):
+        if self.pickled is not None:
+            return load, (self.pickled,)
+        return NativeCRF, (self.path,)
+
+
+def native_path(path):
+    """Path of the native model file of a pickled model."""
+    return os.path.splitext(path)[0] + NATIVE_EXTENSION
+
+
+def _open(path):
+    native = native_path(path)
+    if os.path.exists(native) and os.path.getmtime(native) >= os.path.getmtime(path):
+        return NativeCRF(native, pickled=path)
+    crf = joblib.load(path)
+    # The unpickled CRF keeps its model in a temporary file, while it lives
+    return NativeCRF(crf.modelfile.name, pickled=path, source=crf)
+
+
+def load(path):
+    """Load a pickled CRF model, once per process.
+
+    The native model file is opened when it is not older than the
+    pickle. Otherwise the pickle is loaded.
+
+    Args:
+        path (str): Path of the pickled model.
+
+    Returns:
+        The :class:`NativeCRF` of the model.
+
+    """
+    path = os.path.abspath(path)
+    with _LOCK:
+        model = _MODELS.get(path)
+        if model is None:
+            model = _MODELS[path] = _open(path)
+    return model
+
+
+def model_files(path=MODELS_PATH):
+    """Find the pickled CRF models.
+
+    Args:
+        path (str): Folder with the model folders.
+
+    Returns:
+        A sorted list with the paths of the pickles.
+
+    """
+    files = []
+    for folder in MODEL_FOLDERS:
+        files += sorted(glob.glob(os.path.join(path, folder, '*.pkl')))
+    return files
+
+
+def convert(path=MODELS_PATH):
+    """Convert the pickled CRF models to native CRFsuite model files.
+
+    Each native file is written next to its pickle, with the
+    NATIVE_EXTENSION, and replaces the previous one at once, so a
+    process loading it never reads it half written.
+
+    Args:
+        path (str): Folder with the model folders.
+
+    Returns:
+        A list with the paths of the native files.
+
+    """
+    written = []
+    for pickled in model_files(path):
+        crf = joblib.load(pickled)
+        native = native_path(pickled)
+        shutil.copyfile(crf.modelfile.name, native + '.tmp')
+        os.replace(native + '.tmp', native)
+        written.append(native)
+    clear()
+    return written
+
+
+def preload(path=MODELS_PATH, names=None):
+    """Load the CRF models in the process.
+
+    Called before forking a pool of worker processes, the workers
+    share the loaded models instead of loading their own copies.
+
+    Args:
+        path (str): Folder with the model folders.
+        names ([str]): File names of the pickles to load, from every
+            model folder. Defaults to all of them.
+
+    Returns:
+        The number of models loaded.
+
+    """
+    files = model_files(path)
+    if names is not None:
+        files = [pickled for pickled in files
+                 if os.path.basename(pickled) in names]
+    for pickled in files:
+        load(pickled)
+    return len(files)
+
+
+def clear():
+    """Forget the models loaded in the process."""
+    with _LOCK:
+        _MODELS.clear()
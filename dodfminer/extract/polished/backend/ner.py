@@ -6,7 +6,6 @@ extract an act and, its proprieties, using a trained ner model.
 """
 
 import re
-import nltk
 import numpy as np
 
 # pylint: disable=too-few-public-methods
@@ -27,7 +26,6 @@ class ActNER:
 
     def __init__(self):
         # self._backend = 'regex'
-        nltk.download('punkt', quiet=True)
         super().__init__()
 
         # pylint: disable=assignment-from-no-return
@@ -67,6 +65,35 @@ class ActNER:
         self._preds.append(pred)
         return self._predictions_dict(act, pred)
 
+    def _sequences(self, acts):
+        """Features of many acts, for the CRF model.
+
+        Args:
+            acts ([str]): Full acts.
+
+        Returns:
+            A list with the features of each act.
+        """
+        return [self._get_features(self._split_sentence(self._preprocess(act)))
+                for act in acts]
+
+    def _predictions(self, acts, preds=None):
+        """Predict classes for many acts, in a single call of the model.
+
+        Args:
+            acts ([str]): Full acts.
+            preds (list): Predictions of the acts already made, as the
+                ones of a batch of DODFs.
+
+        Returns:
+            A list with the dictionary of proprieties of each act.
+        """
+        if preds is None:
+            preds = self._model.predict(self._sequences(acts)) if acts else []
+        self._preds.extend(preds)
+        return [self._predictions_dict(self._preprocess(act), pred)
+                for act, pred in zip(acts, preds)]
+
     @classmethod
     def _preprocess(cls, text):
         """Preprocess text for CRF model."""
@@ -45,7 +45,8 @@ class feature_extractor(TransformerMixin):
     # print(">>>> transform() Transformer called.\n")
     transformed = []
     for x in X:
-      tokens = self.tokenize(x)
+      # Already tokenized acts are not tokenized again
+      tokens = x if isinstance(x, list) else self.tokenize(x)
       features = self.get_features(tokens)
       transformed.append(features)
     return transformed
@@ -21,6 +21,8 @@ class ActRegex:
         _flags: All the regex flags which will be used in extraction.
         _rules: The regex rules for proprieties extraction.
         _inst_rule: The regex rule for act extraction.
+        _prop_spans: Spans of the proprieties found by the rules, a dict
+            of (start, end) tuples in the text for each act.
 
     """
 
@@ -35,6 +37,7 @@ class ActRegex:
         self._flags = self._regex_flags()
         self._rules = self._prop_rules()
         self._inst_rule = self._rule_for_inst()
+        self._prop_spans = []
 
     def _rule_for_inst(self):
         """Rule for extraction of the act
@@ -67,12 +70,14 @@ class ActRegex:
         """Flag of the regex search"""
         return 0
 
-    def _find_prop_value(self, rule, act):
+    def _find_prop_value(self, rule, act, spans=None):
         """Find a single proprietie in an single act.
 
         Args:
             rule (str): The regex rule to search for.
             act (str): The act to apply the rule.
+            spans (list): List where the (start, end) span in the act of
+                each value found is appended.
 
         Returns:
             The found propriety, or a nan in case nothing is found.
@@ -80,27 +85,41 @@ class ActRegex:
         """
         match = re.search(rule, act, flags=self._flags)
         if match:
-            return tuple(x for x in match.groups() if x is not None)
+            groups = [group for group in range(1, match.re.groups + 1)
+                      if match.group(group) is not None]
+            if spans is not None:
+                spans.extend(match.span(group) for group in groups)
+            return tuple(match.group(group) for group in groups)
 
         return np.nan
 
-    def _regex_props(self, act_raw) -> dict:
+    def _regex_props(self, act_raw, start=None) -> dict:
         """Create an act dict with all its proprieties.
 
+        The spans of the proprieties are appended to ``_prop_spans``.
+
         Args:
             act_raw (str): The raw text of a single act.
+            start (int): Where the act is in the text, its proprieties
+                spans are not kept when None.
 
         Returns:
             The act, and its props in a dictionary format.
 
         """
         act = {}
+        spans = {}
         # pylint: disable=no-member
         act["tipo_ato"] = self._name
         for key in self._rules:
+            found = []
             try:
-                act[key], = self._find_prop_value(self._rules[key], act_raw)
+                act[key], = self._find_prop_value(self._rules[key], act_raw, found)
             except (TypeError, ValueError):
                 act[key] = np.nan
+                continue
+            if start is not None and len(found) == 1:
+                spans[key] = (start + found[0][0], start + found[0][1])
 
+        self._prop_spans.append(spans)
         return act
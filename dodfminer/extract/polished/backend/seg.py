@@ -18,10 +18,14 @@ class ActSeg: # pylint: disable=too-few-public-methods
 
     Attributes:
         _seg_function: Function for segmentation.
+        _inst_spans: Spans of the acts found by the regex segmentation,
+            as (start, body start, end) tuples in the text, of None
+            values for an act that could not be located.
 
     """
 
     def __init__(self):
+        self._inst_spans = []
         self._seg_function = self._load_seg_function()
 
     def _load_seg_function(self):
@@ -59,16 +63,19 @@ class ActSeg: # pylint: disable=too-few-public-methods
     def _regex_instances(self):
         """Search for all instances of the act using the defined rule.
 
+        The span of each act is kept in ``_inst_spans``.
+
         Returns:
             List of all act instances in the text.
         """
 
         # pylint: disable=no-member
-        found = re.findall(self._inst_rule, self._text, flags=self._flags)
         results = []
-        for instance in found:
-            head, body, *_ = instance
+        for match in re.finditer(self._inst_rule, self._text, flags=self._flags):
+            head, body, *_ = match.groups('')
             self._acts_str.append(head+body)
+            self._inst_spans.append((match.start(), max(match.start(2), match.start()),
+                                     match.end()))
             results.append(body)
 
         #if len(results) > 0:
@@ -78,6 +85,18 @@ class ActSeg: # pylint: disable=too-few-public-methods
 
         return results
 
+    def _body_starts(self):
+        """Start of the body of each act in the text.
+
+        Returns:
+            A list with the body start of each act found by the regex
+            segmentation, or None for each act when they were not.
+        """
+        # pylint: disable=no-member
+        if len(self._inst_spans) != len(self._raw_acts):
+            return [None] * len(self._raw_acts)
+        return [body for _, body, _ in self._inst_spans]
+
     def _crf_instances(self):
         """Search for all instances of the act using a CRF model.
 
@@ -0,0 +1,185 @@
+"""Character spans of the tokens of an act.
+
+The NER pipelines work on tokens, while the highlights point at the
+text of the act. This module maps each token back to its position in
+the text, so the tokens of an act can be computed once and carried
+from the featurization to the prediction, post-processing and
+highlighting.
+
+The entities predicted for the tokens are turned into highlights by a
+single walk over the IOB tags, which accumulates the offsets of the
+entities instead of rebuilding the text at each token.
+
+Usage example::
+
+    tokens = word_tokenize(text)
+    for token, (start, end) in zip(tokens, token_spans(tokens, text)):
+        assert text[start:end] == token
+
+    entities = entity_spans(tags, tokens, token_spans(tokens, text))
+    highlights = add_highlights({'text': text}, entities)
+
+"""
+
+_QUOTES = ('``', "''")
+_QUOTE_SOURCES = ('"', '``', "''")
+
+
+def _find_quote(text, pos):
+    """Find the quote a ``word_tokenize`` quote token was made from."""
+    found = (-1, 0)
+    for quote in _QUOTE_SOURCES:
+        start = text.find(quote, pos)
+        if start != -1 and (found[0] == -1 or start < found[0]):
+            found = (start, len(quote))
+    return found
+
+
+def token_spans(tokens, text):
+    """Find the character span of each token in the text.
+
+    The tokens are searched in order, from the end of the previous
+    token. The quote tokens of ``word_tokenize`` are matched against the
+    double quotes they replace. A token not found in the text, like the
+    ones changed by a custom pre-processing, gets an empty span at the
+    end of the previous token.
+
+    Args:
+        tokens (list): Tokens of the text, in order.
+        text (str): The tokenized text.
+
+    Returns:
+        A list with a (start, end) tuple for each token.
+
+    """
+    spans = []
+    pos = 0
+    for token in tokens:
+        if token in _QUOTES:
+            start, size = _find_quote(text, pos)
+        else:
+            start, size = text.find(token, pos), len(token)
+        if start == -1:
+            spans.append((pos, pos))
+            continue
+        spans.append((start, start + size))
+        pos = start + size
+    return spans
+
+
+def _walk(tags):
+    """Walk the IOB tags once.
+
+    Yields a (type, first, stop) tuple for each entity, a B tag followed
+    by its I tags, and a (None, index, index + 1) tuple for each O tag.
+    The tag right after an entity is skipped, as the highlights have
+    always done.
+    """
+    i = 0
+    while i < len(tags):
+        tag = tags[i]
+        if "B-" in tag:
+            first = i
+            i += 1
+            while i < len(tags) and "I-" in tags[i]:
+                i += 1
+            yield tag.replace("B-", ""), first, i
+        elif tag == 'O':
+            yield None, i, i + 1
+        i += 1
+
+
+def entity_spans(tags, tokens, spans):
+    """Find the entities of an act in its text.
+
+    Args:
+        tags (list): IOB tag of each token.
+        tokens (list): Tokens of the act.
+        spans (list): Character span of each token in the act text,
+            as :func:`token_spans` returns.
+
+    Returns:
+        A list with a (type, start, end, name) tuple for each entity,
+        where name is the entity tokens joined by spaces.
+
+    """
+    return [(ent_type, spans[first][0], spans[stop - 1][1],
+             " ".join(tokens[first:stop]).strip())
+            for ent_type, first, stop in _walk(tags) if ent_type is not None]
+
+
+def _blank(token):
+    return token.strip() == ''
+
+
+def joined_entity_spans(tags, tokens):
+    """Find the entities of an act in its tokens joined by spaces.
+
+    The offsets are computed arithmetically from the token lengths,
+    matching the ones of the text the highlights show: the O and entity
+    tokens joined by spaces, stripped when it does not end with an
+    entity. An entity starts one character after the stripped text
+    before it.
+
+    Args:
+        tags (list): IOB tag of each token.
+        tokens (list): Tokens of the act.
+
+    Returns:
+        A tuple (entities, text), with a (type, start, end, name) tuple
+        for each entity and the highlighted text.
+
+    """
+    entities = []
+    kept = []
+    # Length, leading and trailing whitespace of the kept tokens joined
+    length = lead = trail = 0
+    stripped = True
+    for ent_type, first, stop in _walk(tags):
+        start = max(0, length - lead - trail) + 1
+        for token in tokens[first:stop]:
+            size = len(token)
+            if not kept:
+                length = size
+                lead = size if _blank(token) else size - len(token.lstrip())
+            else:
+                if lead == length:
+                    lead = length + 1 + (size if _blank(token) else size - len(token.lstrip()))
+                length += 1 + size
+            if _blank(token):
+                trail = trail + 1 + size if kept else size
+            else:
+                trail = size - len(token.rstrip())
+            kept.append(token)
+        stripped = ent_type is None
+        if not stripped:
+            entities.append((ent_type, start, length,
+                             " ".join(tokens[first:stop]).strip()))
+
+    text = " ".join(kept)
+    return entities, text.strip() if stripped else text
+
+
+def add_highlights(ent_dict, entities):
+    """Add the highlights of the entities of an act to its dict.
+
+    The highlight of an entity is a dict with its name, start, end and
+    type, stored under the entity type. A repeated type holds a list
+    with the previous value and the new highlight.
+
+    Args:
+        ent_dict (dict): The act dict.
+        entities (list): The (type, start, end, name) tuples of
+            :func:`entity_spans` or :func:`joined_entity_spans`.
+
+    Returns:
+        The act dict.
+
+    """
+    for ent_type, start, end, name in entities:
+        current_ent = {"name": name, "start": start, "end": end, "type": ent_type}
+        if ent_type in ent_dict:
+            ent_dict[ent_type] = [ent_dict[ent_type], current_ent]
+        else:
+            ent_dict[ent_type] = current_ent
+    return ent_dict
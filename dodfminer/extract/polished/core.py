@@ -11,60 +11,107 @@ Usage Example::
 
 """
 
-import multiprocessing
+import importlib
+from collections.abc import Mapping
 from typing import List, Dict
-from dodfminer.extract.polished.create_xml import XMLFy
-
-from dodfminer.extract.polished.acts.aposentadoria import Retirements, RetAposentadoria
-from dodfminer.extract.polished.acts.base import Atos
-from dodfminer.extract.polished.acts.nomeacao import NomeacaoComissionados, NomeacaoEfetivos
-from dodfminer.extract.polished.acts.exoneracao import Exoneracao, ExoneracaoEfetivos
-from dodfminer.extract.polished.acts.reversoes import Revertions
-from dodfminer.extract.polished.acts.abono import AbonoPermanencia
-from dodfminer.extract.polished.acts.substituicao import Substituicao
-from dodfminer.extract.polished.acts.cessoes import Cessoes
-from dodfminer.extract.polished.acts.retificacao import RetificacaoEfetivos, RetificacaoComissionados
-from dodfminer.extract.polished.acts.sem_efeito_aposentadoria import SemEfeitoAposentadoria
-from dodfminer.extract.polished.acts.contrato import Contratos
-from dodfminer.extract.polished.acts.sem_efeito_exo_nom import SemEfeitoExoNom
-# Atos seção 3
-from dodfminer.extract.polished.acts.aditamento import Aditamento
-from dodfminer.extract.polished.acts.licitacao import Licitacao
-from dodfminer.extract.polished.acts.suspensao import Suspensao
-from dodfminer.extract.polished.acts.anulacao_revogacao import Anulacao_Revogacao
-from dodfminer.extract.polished.acts.contrato_convenio import Contrato_Convenio
-from dodfminer.extract.polished.acts.convenio import Convenio
-from dodfminer.extract.polished.acts.contrato2 import Contrato as Contrato2
-
-_acts_ids = {
-    "aposentadoria": Retirements,
-    "reversoes": Revertions,
-    "nomeacao": NomeacaoComissionados,
-    "exoneracao": Exoneracao,
-    "abono": AbonoPermanencia,
-    "retificacoes": RetAposentadoria,
-    "substituicao": Substituicao,
-    "efetivos_nome": NomeacaoEfetivos,
-    "efetivos_exo": ExoneracaoEfetivos,
-    "sem_efeito_aposentadoria": SemEfeitoAposentadoria,
-    "cessoes": Cessoes,    
-    "sem_efeito_exo_nom": SemEfeitoExoNom,
-    "efetivos_ret": RetificacaoEfetivos,
-    "comissionados_ret": RetificacaoComissionados,
-    # "contrato": Contratos,
+
+from dodfminer.extract.polished.workers import borrow
+
+_ACTS = "dodfminer.extract.polished.acts."
+
+
+class ActRegistry(Mapping):
+    """Act classes indexed by name, imported on first use.
+
+    Behaves as a read-only dict from the act name to its class, but the
+    act modules, and their dependencies, are only imported when a class
+    is first looked up.
+
+    Args:
+        specs (dict): Maps each act name to the path of its class, as
+            'module:Class'.
+
+    """
+
+    def __init__(self, specs):
+        self._specs = dict(specs)
+        self._classes = {}
+
+    def __getitem__(self, name):
+        act = self._classes.get(name)
+        if act is None:
+            module_name, class_name = self._specs[name].split(':')
+            act = getattr(importlib.import_module(module_name), class_name)
+            self._classes[name] = act
+        return act
+
+    def __iter__(self):
+        return iter(self._specs)
+
+    def __len__(self):
+        return len(self._specs)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self._specs)})"
+
+
+_acts_ids = ActRegistry({
+    "aposentadoria": _ACTS + "aposentadoria:Retirements",
+    "reversoes": _ACTS + "reversoes:Revertions",
+    "nomeacao": _ACTS + "nomeacao:NomeacaoComissionados",
+    "exoneracao": _ACTS + "exoneracao:Exoneracao",
+    "abono": _ACTS + "abono:AbonoPermanencia",
+    "retificacoes": _ACTS + "aposentadoria:RetAposentadoria",
+    "substituicao": _ACTS + "substituicao:Substituicao",
+    "efetivos_nome": _ACTS + "nomeacao:NomeacaoEfetivos",
+    "efetivos_exo": _ACTS + "exoneracao:ExoneracaoEfetivos",
+    "sem_efeito_aposentadoria": _ACTS + "sem_efeito_aposentadoria:SemEfeitoAposentadoria",
+    "cessoes": _ACTS + "cessoes:Cessoes",
+    "sem_efeito_exo_nom": _ACTS + "sem_efeito_exo_nom:SemEfeitoExoNom",
+    "efetivos_ret": _ACTS + "retificacao:RetificacaoEfetivos",
+    "comissionados_ret": _ACTS + "retificacao:RetificacaoComissionados",
+    # "contrato": _ACTS + "contrato:Contratos",
 
     # Atos seção 3
-    "contrato_convenio": Contrato_Convenio,
-    "aditamento": Aditamento,
-    "licitacao": Licitacao,
-    "suspensao": Suspensao,
-    "anulacao_revogacao": Anulacao_Revogacao,
-    "contrato": Contrato2,
-    "convenio": Convenio,
-}
+    "contrato_convenio": _ACTS + "contrato_convenio:Contrato_Convenio",
+    "aditamento": _ACTS + "aditamento:Aditamento",
+    "licitacao": _ACTS + "licitacao:Licitacao",
+    "suspensao": _ACTS + "suspensao:Suspensao",
+    "anulacao_revogacao": _ACTS + "anulacao_revogacao:Anulacao_Revogacao",
+    "contrato": _ACTS + "contrato2:Contrato",
+    "convenio": _ACTS + "convenio:Convenio",
+})
 
 """_acts_ids: All avaiable acts classes indexed by a given string name."""
 
+_models_ids = {
+    "aposentadoria": ("aposentadoria.pkl",),
+    "reversoes": ("reversao.pkl",),
+    "nomeacao": ("comissionados_nome.pkl",),
+    "exoneracao": ("comissionados_exo.pkl",),
+    "abono": ("abono.pkl",),
+    "retificacoes": (),
+    "substituicao": ("substituicao.pkl",),
+    "efetivos_nome": ("efetivos_nome.pkl",),
+    "efetivos_exo": ("efetivos_exo.pkl",),
+    "sem_efeito_aposentadoria": ("sem_efeito_apo.pkl",),
+    "cessoes": ("cessao.pkl",),
+    "sem_efeito_exo_nom": ("sem_efeito_exo_nom.pkl",),
+    "efetivos_ret": ("efetivos_ret.pkl",),
+    "comissionados_ret": ("comissionados_ret.pkl",),
+
+    # Atos seção 3
+    "contrato_convenio": ("modelo_contrato_convenio.pkl",),
+    "aditamento": ("modelo_aditamento_contratual.pkl",),
+    "licitacao": ("modelo_licitacao.pkl",),
+    "suspensao": ("modelo_suspensao.pkl",),
+    "anulacao_revogacao": ("modelo_anulacao_revogacao.pkl",),
+    "contrato": ("modelo_contrato_convenio.pkl",),
+    "convenio": ("modelo_contrato_convenio.pkl",),
+}
+
+"""_models_ids: Pickled CRF models of each act type, in the model folders."""
+
 
 class ExtractEntDFParallelArgs():
     """
@@ -73,9 +120,9 @@ class ExtractEntDFParallelArgs():
     act_type: str
     file: str
     backend: str
-    act: Atos
+    act: 'Atos'
 
-    def __init__(self, act_type: str, file: str, backend: str, act: Atos):
+    def __init__(self, act_type: str, file: str, backend: str, act: 'Atos'):
         self.act_type = act_type
         self.file = file
         self.act = act
@@ -117,6 +164,30 @@ class ActsExtractor:
         """
         return _acts_ids[ato_id](file, backend=backend, pipeline=pipeline)
 
+    @staticmethod
+    def get_act_objs(ato_id, files, backend = None):
+        """
+        Extract a single act type from many DODFs, together.
+
+        Acts with a batch extraction predict the acts of all the DODFs
+        in a single call of the model, the other ones extract each DODF
+        on its own.
+
+        Args:
+            ato_id (string): The name of the act to extract.
+            files (list): The DODFs, as DODFText or file paths.
+            backend (string): Backend of act extraction, either Regex or NER.
+
+        Returns:
+            A list with the object of the desired act of each DODF,
+            already with extracted information.
+
+        """
+        act_class = _acts_ids[ato_id]
+        if hasattr(act_class, 'extract_batch'):
+            return act_class.extract_batch(files, backend)
+        return [act_class(file, backend=backend) for file in files]
+
     @staticmethod
     def get_all_obj(file, backend = None, pipeline = None):
         """
@@ -164,7 +235,7 @@ class ActsExtractor:
         return res
 
     @staticmethod
-    def get_all_obj_parallel(file, backend, processes=4):
+    def get_all_obj_parallel(file, backend, processes=4, pool=None):
         '''
         Extract all act types from a single DODF object in paralel.
 
@@ -173,6 +244,8 @@ class ActsExtractor:
         Args:
             file (string): Path of the file.
             backend (string): Backend of act extraction, either Regex or NER.
+            processes (int): Number of worker processes, when no pool is given.
+            pool (WorkerPool): Pool of warmed workers, kept open.
 
         Returns:
             An vector of objects of all the acts with extracted
@@ -184,10 +257,10 @@ class ActsExtractor:
             argument = ExtractEntDFParallelArgs(key, file, backend, act)
             args.append(argument)
 
-        with multiprocessing.Pool(processes=processes) as pool:
-            response = pool.map(ActsExtractor.run_thread_wrap, args)
-            for act in response:
-                res[act['tipo']] = act['ato']
+        with borrow(pool, processes) as workers:
+            response = workers.map(ActsExtractor.run_thread_wrap, args)
+        for act in response:
+            res[act['tipo']] = act['ato']
 
         return res
 
@@ -260,7 +333,7 @@ class ActsExtractor:
         return res
 
     @staticmethod
-    def get_all_df_parallel(file, backend, processes=4) -> Dict:
+    def get_all_df_parallel(file, backend, processes=4, pool=None) -> Dict:
         """
         Extract all act types from a single DODF file in parallel.
 
@@ -269,6 +342,8 @@ class ActsExtractor:
         Args:
             file (string): Path of the file.
             backend (string): Backend of act extraction, either regex or ner.
+            processes (int): Number of worker processes, when no pool is given.
+            pool (WorkerPool): Pool of warmed workers, kept open.
 
         Returns:
             A vector of dataframes with extracted information for all acts.
@@ -280,10 +355,10 @@ class ActsExtractor:
             argument = ExtractEntDFParallelArgs(key, file, backend, act)
             args.append(argument)
 
-        with multiprocessing.Pool(processes=processes) as pool:
-            response = pool.map(ActsExtractor.run_thread_wrap_ent, args)
-            for act in response:
-                res[act['tipo']] = act['dataframe']
+        with borrow(pool, processes) as workers:
+            response = workers.map(ActsExtractor.run_thread_wrap_ent, args)
+        for act in response:
+            res[act['tipo']] = act['dataframe']
 
         return res
 
@@ -306,6 +381,7 @@ class ActsExtractor:
             A vector of dataframes with extracted information for all acts.
 
         """
+        from dodfminer.extract.polished.create_xml import XMLFy
         res = XMLFy(file, _acts_ids, i)
         return res
         
\ No newline at end of file
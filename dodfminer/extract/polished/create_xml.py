@@ -1,8 +1,10 @@
 import os
+import bisect
 import datetime
 import re
 from lxml import etree
 from dodfminer.extract.pure.core import ContentExtractor as ce
+from dodfminer.extract.pure.core import DODFText
 
 class XMLFy:
     '''Cria um xml com informações de um ato'''
@@ -85,26 +87,75 @@ class XMLFy:
         return root_doc
 
     def _text_to_passages(self, root):
-        text = ce.extract_text(self._file, single=False,
-                                  block=True, sep=' ', norm='NFKD')
-        offset = 0
-        for line in text:
+        blocks = ce.extract_text(self._file, single=False,
+                                 block=True, sep=' ', norm='NFKD')
+        texts = []
+        starts = []
+        position = 0
+        for line in blocks:
             _, _, _, _, text = line
-            annotation = self.execute_regex(text)
+            texts.append(text)
+            starts.append(position)
+            position += len(text)
+        # The acts are extracted once, from the text of all the blocks
+        document = ''.join(texts)
+        annotations = self._locate(document, starts, self.execute_regex(document))
+        offset = 0
+        for text, annotation in zip(texts, annotations):
             child = self._create_passage(offset, text, annotation)
             root.append(child)
             offset += len(text)-1
 
     # pylint: disable=protected-access
     def execute_regex(self, text):
+        """Extract the acts of a text with the regex backend.
+
+        Args:
+            text (str): The text of the DODF.
+
+        Returns:
+            A dict with the act object of each act type found.
+
+        """
         res = {}
+        document = DODFText(text, None)
         for key in self._acts_ids:
-            act = self._acts_ids[key](text, "regex")
+            act = self._acts_ids[key](document, "regex")
             if act._acts:
-                res[key] = act._acts
+                res[key] = act
         return res
 
-    def _create_passage(self, offset, text, an_dict):
+    # pylint: disable=protected-access
+    def _locate(self, document, starts, acts):
+        """Locate the proprieties of the acts in the passages.
+
+        The proprieties are located by the spans their rules matched.
+
+        Args:
+            document (str): The text of all the blocks.
+            starts ([int]): The start of each block in the document.
+            acts (dict): The act objects of each act type.
+
+        Returns:
+            A list with the (type, text, offset) of the proprieties in
+            each passage, offset in the passage text.
+
+        """
+        passages = [[] for _ in starts]
+        for act in acts.values():
+            for spans in act._prop_spans:
+                for prop_type, (found, found_end) in spans.items():
+                    if found == found_end:
+                        continue
+                    index = bisect.bisect_right(starts, found) - 1
+                    end = starts[index+1] if index+1 < len(starts) else len(document)
+                    # Proprieties across two passages are not annotated
+                    if found_end <= end:
+                        passages[index].append((prop_type, document[found:found_end],
+                                                found - starts[index]))
+        return passages
+
+    def _create_passage(self, offset, text, annotations):
         root_passage = etree.Element('passage')
 
         child_offset = etree.Element('offset')
@@ -115,28 +166,10 @@ class XMLFy:
         child_text.text = text
         root_passage.append(child_text)
 
-        # relations = []
-        # if an_dict:
-        for act_type in an_dict:
-            for act_inst in an_dict[act_type]:
-                # relations_ids = []
-                for prop_type, value in act_inst.items():
-                    if isinstance(value, str):
-                        offset_sum = text.find(value)
-                        text = text.replace(value, '_'*len(value), 1)
-                        if offset_sum != -1:
-                            offset_prop = offset + offset_sum
-                            child_annotation = self._annotate(prop_type,
-                                                                value, offset_prop)
-                            root_passage.append(child_annotation)
-                            # relations_ids.append(self._annotation_id)
-                            self._annotation_id += 1
-                # child_rel = self._create_relation("Ato_"+act_type.capitalize(), relations_ids)
-                # relations.append(child_rel)
-                # self._relations_id += 1
-
-        # for relation in relations:
-        #     root_passage.append(relation)
+        for prop_type, value, index in annotations:
+            child_annotation = self._annotate(prop_type, value, offset + index)
+            root_passage.append(child_annotation)
+            self._annotation_id += 1
 
         return root_passage
 
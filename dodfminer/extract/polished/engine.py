@@ -0,0 +1,205 @@
+"""Reusable act extraction engine.
+
+The static entry points, as ``ActsExtractor.get_all_df`` or
+``helper.extract_multiple``, set everything up again on each call. The
+engine is configured once, with the backend, the act types, the number
+of worker processes and a cache folder, and keeps what the extraction
+needs between calls: the act classes, the CRF models, the NLTK
+resources, the worker pool and the texts of the PDFs already read.
+
+Usage example::
+
+    from dodfminer.extract.polished.engine import ExtractionEngine
+
+    with ExtractionEngine(types=['nomeacao'], processes=4, cache_dir='./cache') as engine:
+        data_frames = engine.extract('dodf.pdf')
+        for path, data_frames in engine.extract_many(paths):
+            print(path, len(data_frames['nomeacao']))
+
+"""
+
+import hashlib
+import os
+
+from dodfminer.extract.polished import resources
+from dodfminer.extract.polished.core import _acts_ids
+from dodfminer.extract.polished.helper import extract_batch, extract_single
+from dodfminer.extract.polished.workers import WorkerPool, warm
+from dodfminer.extract.pure.core import ContentExtractor, DODFText
+
+# Engines of the worker processes, by configuration
+_WORKER_ENGINES = {}
+
+
+def _extract_in_worker(argument):
+    path, config = argument
+    engine = _WORKER_ENGINES.get(config)
+    if engine is None:
+        engine = _WORKER_ENGINES[config] = ExtractionEngine(*config)
+    return path, engine.extract(path)
+
+
+class ExtractionEngine:
+    """Act extraction engine, configured once and used for many documents.
+
+    Args:
+        types ([str]): Types of the act, all when empty.
+        backend (str): what backend will be used to extract Acts {regex, ner}
+        processes (int): Worker processes of :meth:`extract_many`. One
+            extracts in the calling process.
+        cache_dir (str): Folder where the text of each PDF read is kept,
+            so it is not extracted again. No cache if None.
+        nltk_data (str): Folder with the NLTK resources, see
+            :func:`~dodfminer.extract.polished.resources.configure`.
+
+    Raises:
+        ValueError: An unknown act type.
+
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, types=None, backend='regex', processes=1, cache_dir=None,
+                 nltk_data=None):
+        self.types = self._check_types(types or _acts_ids.keys())
+        self.backend = backend
+        self.processes = processes
+        self.cache_dir = cache_dir
+        self.nltk_data = nltk_data
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+        if nltk_data is not None:
+            resources.configure(nltk_data)
+        warm(self.types)
+        self._pool = None
+
+    @classmethod
+    def _check_types(cls, types):
+        types = list(types)
+        for act_type in types:
+            if act_type not in _acts_ids:
+                raise ValueError(f"unknown act type {act_type}")
+        return types
+
+    def _config(self):
+        return (tuple(self.types), self.backend, 1, self.cache_dir, self.nltk_data)
+
+    def _cached_text(self, path):
+        stat = os.stat(path)
+        key = f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+        cached = os.path.join(self.cache_dir, hashlib.sha1(key.encode()).hexdigest() + '.txt')
+        if os.path.exists(cached):
+            with open(cached, 'r', encoding='utf-8') as file:
+                return DODFText(file.read(), path)
+        text = ContentExtractor.extract_plain_text(path)
+        with open(cached + '.tmp', 'w', encoding='utf-8') as file:
+            file.write(text)
+        os.replace(cached + '.tmp', cached)
+        return text
+
+    def read(self, document):
+        """Read a document once, to be shared by all the act types.
+
+        Args:
+            document: A DODFText, or the path of a PDF, .txt, JSON or
+                .blocks DODF.
+
+        Returns:
+            A DODFText with the text of a PDF or .txt, or the path of the
+            other documents, which the acts read.
+
+        """
+        if isinstance(document, DODFText):
+            return document
+        if document.endswith('.pdf'):
+            if self.cache_dir is None:
+                return ContentExtractor.extract_plain_text(document)
+            return self._cached_text(document)
+        if document.endswith('.txt'):
+            with open(document, 'r', encoding='utf-8') as file:
+                return DODFText(file.read(), document)
+        return document
+
+    def extract(self, document, types=None):
+        """Extract the acts of a document.
+
+        Args:
+            document: A DODFText, or the path of a PDF, .txt, JSON or
+                .blocks DODF.
+            types ([str]): Types of the act, the engine ones if None.
+
+        Returns:
+            A dict with the dataframe of each act type.
+
+        Raises:
+            ValueError: An unknown act type.
+
+        """
+        types = self._check_types(types) if types else self.types
+        document = self.read(document)
+        return {act_type: extract_single(document, act_type, self.backend)[0]
+                for act_type in types}
+
+    def extract_batch(self, documents, types=None):
+        """Extract the acts of many documents together.
+
+        Each act type segments all the documents, and with the ner
+        backend predicts all their acts in a single call of its model.
+
+        Args:
+            documents (list): DODFTexts, or paths of PDF, .txt, JSON or
+                .blocks DODFs.
+            types ([str]): Types of the act, the engine ones if None.
+
+        Returns:
+            A list with the dict with the dataframe of each act type, of
+            each document.
+
+        Raises:
+            ValueError: An unknown act type.
+
+        """
+        types = self._check_types(types) if types else self.types
+        documents = [self.read(document) for document in documents]
+        results = [{} for _ in documents]
+        for act_type in types:
+            extracted = extract_batch(documents, act_type, self.backend)
+            for result, (data_frame, _) in zip(results, extracted):
+                result[act_type] = data_frame
+        return results
+
+    def extract_many(self, paths):
+        """Extract the acts of many documents, one at a time.
+
+        With more than one process, the documents are extracted by the
+        worker pool of the engine, started on the first call and kept
+        until :meth:`close`, and the results come as they are ready.
+
+        Args:
+            paths: Iterable with the paths of the documents.
+
+        Yields:
+            A tuple with the path of each document and the dict with the
+            dataframe of each act type.
+
+        """
+        if self.processes <= 1:
+            for path in paths:
+                yield path, self.extract(path)
+            return
+        if self._pool is None:
+            self._pool = WorkerPool(processes=self.processes, types=self.types)
+        config = self._config()
+        yield from self._pool.imap_unordered(_extract_in_worker,
+                                             ((path, config) for path in paths))
+
+    def close(self):
+        """Stop the worker pool of the engine."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
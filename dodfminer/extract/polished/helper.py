@@ -15,7 +15,6 @@ Functions
 """
 
 from typing import List, Tuple
-import multiprocessing
 import os
 import re
 import tqdm
@@ -23,9 +22,11 @@ import pandas as pd
 
 from dodfminer.extract.polished.core import ActsExtractor
 from dodfminer.extract.polished.core import _acts_ids
-from dodfminer.extract.pure.core import ContentExtractor
+from dodfminer.extract.polished.workers import borrow
+from dodfminer.extract.pure.core import ContentExtractor, DODFText
 
 from dodfminer.extract.polished.acts.type_classification.committee import Committee
+from dodfminer.downloader.catalog import catalog_pdfs
 
 def xml_multiple(path, backend):
     files = []
@@ -86,7 +87,49 @@ def extract_multiple_acts(path, types, backend):
             data_frame.to_csv(os.path.join(path, act_type + ".csv"))
 
 
-def extract_multiple_acts_parallel(path: str, types: List[str], backend: str, processes = 4):
+def extract_multiple_acts_in_memory(path, types, backend):
+    """Extract multiple Acts from Multiple DODFs PDFs to act named CSVs.
+
+    Fast path of `extract_multiple_acts` for PDFs: the text of each DODF is
+    extracted once, kept in memory and given to every act type, so no
+    intermediate .txt file is written or read.
+
+    Args:
+        path (str): Folder where the Dodfs are, or a single PDF.
+        types ([str]): Types of the act, see the core class to view
+                    avaiables types.
+        backend (str): what backend will be used to extract Acts {regex, ner}
+
+    Returns:
+        None
+    """
+    if len(types) == 0:
+        types = _acts_ids.keys()
+
+    if os.path.isfile(path):
+        files = [path]
+        out_path = os.path.dirname(path)
+    else:
+        files = get_files_path(path, 'pdf')
+        out_path = path
+
+    data_frames = {act_type: [] for act_type in types}
+    for file in files:
+        text = ContentExtractor.extract_plain_text(file)
+        for act_type in types:
+            data_frame, _ = extract_single(text, act_type, backend=backend)
+            if not data_frame.empty:
+                data_frames[act_type].append(data_frame)
+
+    for act_type, frames in data_frames.items():
+        if len(frames) == 0:
+            data_frame = pd.DataFrame()
+        else:
+            data_frame = pd.concat(frames, ignore_index=True)
+        data_frame.to_csv(os.path.join(out_path, act_type + '.csv'))
+
+
+def extract_multiple_acts_parallel(path: str, types: List[str], backend: str, processes = 4, pool = None):
     """Extract multple Acts from Multiple DODFs to act named CSVs in parallel.
 
     Args:
@@ -94,6 +137,8 @@ def extract_multiple_acts_parallel(path: str, types: List[str], backend: str, pr
         types ([str]): Types of the act, see the core class to view
                     avaiables types.
         backend (str): what backend will be used to extract Acts {regex, ner}
+        processes (int): Number of worker processes, when no pool is given.
+        pool (WorkerPool): Pool of warmed workers, kept open.
 
     Returns:
         None
@@ -112,8 +157,8 @@ def extract_multiple_acts_parallel(path: str, types: List[str], backend: str, pr
         for act_type in types:
             extraction_arguments.append((extract_path, act_type, backend))
 
-        with multiprocessing.Pool(processes=processes) as pool:
-            result = pool.starmap(run_extract_simple_wrap, extraction_arguments)
+        with borrow(pool, processes, types) as workers:
+            result = workers.starmap(run_extract_simple_wrap, extraction_arguments)
 
         for act_type, (data_frame, _) in result:
             data_frame.to_csv(os.path.join(os.path.dirname(path), act_type+'.csv'))
@@ -125,11 +170,11 @@ def extract_multiple_acts_parallel(path: str, types: List[str], backend: str, pr
         for act_type in types:
             extraction_arguments.append((files, act_type, backend))
 
-        with multiprocessing.Pool(processes=processes) as pool:
-            result = pool.starmap(run_thread_wrap_multiple, extraction_arguments)
+        with borrow(pool, processes, types) as workers:
+            result = workers.starmap(run_thread_wrap_multiple, extraction_arguments)
 
-            for item in result:
-                item[1].to_csv(os.path.join(path, item[0] + ".csv"))
+        for item in result:
+            item[1].to_csv(os.path.join(path, item[0] + ".csv"))
 
 
 def run_extract_simple_wrap(file: str, act_type: str, backend: str) -> Tuple[str, pd.DataFrame]:
@@ -188,77 +233,98 @@ def extract_multiple(files, act_type, backend, txt_out=False, txt_path="./result
                               ignore_index=True)
     return res_final
 
-def extract_multiple_acts_with_committee(path, types, backend):
+def extract_multiple_acts_with_committee(path, types, backend, processes=4, pool=None):
     """Extract multple Acts from Multiple DODFs to act named CSVs.
     Uses committee_classification to find act types.
 
+    Each DODF is read once and its acts are segmented and extracted
+    once for each type, in parallel across the DODFs of a folder. Only
+    the acts the committee moves to another type are extracted again,
+    by the proprieties extractor of their new type.
+
     Args:
         path (str): Folder where the Dodfs are.
         types ([str]): Types of the act, see the core class to view
                     avaiables types.
         backend (str): what backend will be used to extract Acts {regex, ner}
+        processes (int): Number of worker processes, when no pool is given.
+        pool (WorkerPool): Pool of warmed workers, kept open.
     Returns:
         None
     """
     print(types)
     if len(types) == 0:
         types = _acts_ids.keys()
-
-    all_acts = []
+    types = list(types)
 
     if os.path.isfile(path):
         if path[-4:] == '.pdf':
             ContentExtractor.extract_text(path, single=True)
-            extract_path = path.replace('.pdf', '.txt')
-        elif path[-5:] == '.json':
-            extract_path = path
-
-        ContentExtractor.extract_text(path, single=True)
-        for act_type in types:
-            dataframe, _= extract_single(extract_path, act_type, backend=backend)
-            dataframe['type'] = act_type
-            all_acts.append(dataframe.filter(['text', 'type'], axis = 1))
+            files = [path.replace('.pdf', '.txt')]
+        else:
+            files = [path]
     else:
         ContentExtractor.extract_to_txt(path)
         files = get_files_path(path, 'txt') + get_files_path(path, "json")
-        process_ref = []
-        output = multiprocessing.Queue(len(types))
-        for act_type in types:
-            process = multiprocessing.Process(target = run_thread_wrap, args = (files, act_type, backend, output))
-            process_ref.append(process)
-
-        for thread in process_ref:
-            thread.start()
 
-        all_acts = [output.get() for _ in process_ref]
+    if len(files) > 1 and (pool is not None or processes > 1):
+        with borrow(pool, processes, types) as workers:
+            results = workers.starmap(run_extract_document_wrap,
+                                      [(file, types, backend) for file in files])
+    else:
+        results = [run_extract_document_wrap(file, types, backend) for file in files]
 
-        for thread in process_ref:
-            thread.join()
+    extracted = {act_type: [] for act_type in types}
+    for data_frames in results:
+        for act_type, dataframe in data_frames.items():
+            if not dataframe.empty:
+                extracted[act_type].append(dataframe)
 
-    dataframe = pd.concat(all_acts, ignore_index = True)
+    all_acts = []
+    for act_type, frames in extracted.items():
+        extracted[act_type] = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        if frames:
+            all_acts.append(pd.DataFrame({'text': extracted[act_type]['text'], 'type': act_type}))
 
-    if len(dataframe) == 0:
+    if len(all_acts) == 0:
         dataframe = pd.DataFrame(columns = ['text', 'type'])
+    else:
+        dataframe = pd.concat(all_acts, ignore_index = True)
 
-    committee_classification(dataframe, path, types, backend)
+    committee_classification(dataframe, path, types, backend, extracted=extracted)
 
-def run_thread_wrap(files: list, act_type: str, backend: str, all_acts: multiprocessing.Queue) -> None:
+def run_extract_document_wrap(file: str, types: List[str], backend: str) -> dict:
     '''
-    Run multiple extractions
+    Run the extraction of all the types of a single DODF, read once
     '''
-    dataframe = extract_multiple(files, act_type, backend)
-    dataframe['type'] = act_type
-    all_acts.put(dataframe.filter(['text', 'type'], axis = 1))
-
-def committee_classification(all_acts, path, types, backend):
+    document = _read_document(file)
+    return {act_type: extract_single(document, act_type, backend=backend)[0]
+            for act_type in types}
+
+def _read_document(file):
+    """Read a DODF .txt once, to be shared by all the act types."""
+    if file[-4:] != '.txt':
+        return file
+    with open(file, 'r', encoding='utf-8') as txt:
+        return DODFText(txt.read(), file)
+
+def committee_classification(all_acts, path, types, backend, extracted=None):
     """Uses committee classification to find act types.
 
+    The acts are classified in a single batch. An act keeping its type
+    keeps the proprieties already extracted, when given, and the other
+    acts go straight to the proprieties extractor of their new type,
+    without segmenting the DODFs again.
+
     Args:
         all_acts (DataFrame): Dataframe with acts text and regex type.
         path (str): Folder where the Dodfs are.
         types ([str]): Types of the act, see the core class to view
                     avaiables types.
         backend (str): what backend will be used to extract Acts {regex, ner}
+        extracted (dict): Dataframe of the acts already extracted for
+                    each type, with the acts in the same order as in
+                    all_acts. Defaults to extracting every act again.
     Returns:
         None
     """
@@ -268,17 +334,32 @@ def committee_classification(all_acts, path, types, backend):
 
     committee = Committee(models_path)
 
+    old_types = all_acts['type'].reset_index(drop=True)
+    rows = old_types.groupby(old_types).cumcount()
     new_types = committee.transform(all_acts['text'], all_acts['type'])
 
     all_acts['type']  = new_types
+    new_types = all_acts['type'].reset_index(drop=True)
+    texts = all_acts['text'].reset_index(drop=True)
 
     for act_type in types:
-        df_act = all_acts.loc[all_acts.type == act_type]['text']
-        all_strings = ""
-        for act in df_act:
-            all_strings += act + ".\n"
-
-        data_frame, _ = extract_single(all_strings, act_type, backend=backend)
+        routed = new_types == act_type
+        frames = []
+        if extracted is not None and len(extracted.get(act_type, [])) > 0:
+            kept = routed & (old_types == act_type)
+            frames.append(extracted[act_type].iloc[rows[kept]])
+            routed &= ~kept
+
+        if routed.any():
+            res_obj = ActsExtractor.get_act_obj(act_type, "", backend)
+            data_frame = res_obj.extract_texts(texts[routed].tolist())
+            data_frame['text'] = res_obj.acts_str
+            frames.append(data_frame)
+
+        if frames:
+            data_frame = pd.concat(frames, ignore_index=True)
+        else:
+            data_frame = pd.DataFrame(columns = ['text'])
 
         if os.path.isfile(path):
             data_frame.to_csv(os.path.join(os.path.dirname(path), act_type+'.csv'))
@@ -311,6 +392,32 @@ def extract_single(file, act_type, backend):
     return res_df, res_txt
 
 
+def extract_batch(files, act_type, backend):
+    """Extract Act from many DODFs, to a DataFrame each.
+
+    The DODFs are extracted together, see
+    :meth:`~dodfminer.extract.polished.core.ActsExtractor.get_act_objs`.
+
+    Args:
+        files (list): The DODFs, as DODFText or file paths.
+        act_type (str): Type of the act, see the core class to view
+                    avaiables types.
+        backend (str): what backend will be used to extract Acts {regex, ner}
+
+    Returns:
+        A list with the tuple of each DODF, as returned by
+        :func:`extract_single`.
+
+    """
+    results = []
+    for res_obj in ActsExtractor.get_act_objs(act_type, files, backend):
+        res_df = res_obj.data_frame
+        res_txt = res_obj.acts_str
+        res_df['text'] = res_txt
+        results.append((res_df, res_txt))
+    return results
+
+
 def build_act_txt(acts, name, save_path="./results/"):
     """Create a text file in disc for a act type.
 
@@ -349,7 +456,8 @@ def print_dataframe(data_frame):
 def get_files_path(path, file_type):
     """Get all files path inside a folder.
 
-    Works with nested folders.
+    Works with nested folders. PDFs of a download folder with a catalog
+    are listed by :func:`~dodfminer.downloader.catalog.catalog_pdfs`.
 
     Args:
         path: Folder to look into for files
@@ -359,6 +467,11 @@ def get_files_path(path, file_type):
         A list of strings with the file path.
 
     """
+    if file_type == 'pdf':
+        cataloged = catalog_pdfs(path)
+        if cataloged is not None:
+            return cataloged
+
     files_path = []
     for root, _, files in os.walk(path):
         # sort file names to avoid unpredictable results
@@ -0,0 +1,119 @@
+"""NLTK resources used by the act extraction.
+
+The extraction needs the NLTK punkt tokenizer, the RSLP stemmer and the
+stopwords corpus. They are resolved once per process, from the local
+NLTK data paths, and are never downloaded during an extraction: a
+missing resource is reported once and the extraction fails only where
+the resource is used.
+
+The resources are downloaded beforehand, when building an image or
+setting up a machine, with::
+
+    dodfminer prefetch -d /opt/nltk_data
+
+and that folder is given to the extraction in the ``DODFMINER_NLTK_DATA``
+environment variable, or with :func:`configure`. The folders in the
+usual ``NLTK_DATA`` variable are searched as well.
+
+Usage example::
+
+    from dodfminer.extract.polished import resources
+
+    resources.require('punkt')
+
+"""
+
+import os
+import threading
+
+import nltk
+
+RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'rslp': 'stemmers/rslp',
+    'stopwords': 'corpora/stopwords',
+}
+"""dict: NLTK resources of the extraction, mapped to their data paths."""
+
+DATA_PATH_ENV = 'DODFMINER_NLTK_DATA'
+"""str: Environment variable with the local NLTK data folder."""
+
+_RESOLVED = {}
+_LOCK = threading.Lock()
+_configured = False
+
+
+def configure(data_path=None):
+    """Set the local folder of the NLTK resources.
+
+    The folder is searched before the NLTK default ones, and the
+    resources are resolved again on the next :func:`require`.
+
+    Args:
+        data_path (str): Folder with the NLTK data. Defaults to the
+            ``DODFMINER_NLTK_DATA`` environment variable, if set.
+
+    """
+    global _configured  # pylint: disable=global-statement
+    data_path = data_path or os.environ.get(DATA_PATH_ENV)
+    with _LOCK:
+        if data_path:
+            data_path = os.path.abspath(data_path)
+            if data_path in nltk.data.path:
+                nltk.data.path.remove(data_path)
+            nltk.data.path.insert(0, data_path)
+        _RESOLVED.clear()
+        _configured = True
+
+
+def _find(name):
+    try:
+        nltk.data.find(RESOURCES[name])
+        return True
+    except (LookupError, OSError):
+        return False
+
+
+def require(*names):
+    """Resolve NLTK resources, once per process, without downloading them.
+
+    Args:
+        *names (str): Names of the resources, keys of :data:`RESOURCES`.
+
+    Returns:
+        True if all the resources were found.
+
+    """
+    if not _configured:
+        configure()
+    found = True
+    for name in names:
+        with _LOCK:
+            available = _RESOLVED.get(name)
+            if available is None:
+                available = _RESOLVED[name] = _find(name)
+                if not available:
+                    print(f"NLTK resource '{name}' not found, download it with "
+                          f"'dodfminer prefetch' and set {DATA_PATH_ENV}")
+        found = found and available
+    return found
+
+
+def prefetch(data_path, names=None):
+    """Download the NLTK resources to a local folder.
+
+    Args:
+        data_path (str): Folder the resources are saved to.
+        names ([str]): Resources to download. Defaults to all of them.
+
+    Returns:
+        The absolute path of the folder.
+
+    """
+    data_path = os.path.abspath(data_path)
+    os.makedirs(data_path, exist_ok=True)
+    for name in names or RESOURCES:
+        nltk.download(name, download_dir=data_path, quiet=True,
+                      raise_on_error=True)
+    configure(data_path)
+    return data_path
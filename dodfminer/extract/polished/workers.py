@@ -0,0 +1,132 @@
+"""Pool of act extraction worker processes.
+
+Every worker of a pool starts with the act classes imported and the CRF
+models loaded, so the tasks do not load them again. With the fork start
+method they are loaded once, in the parent, before the workers are
+forked, and the workers share their pages copy-on-write. With the other
+start methods each worker loads them once, when it starts.
+
+A pool is started on its first task and kept until it is closed, so a
+long-running process can give the same pool to many extractions.
+
+Usage example::
+
+    from dodfminer.extract.polished.core import ActsExtractor
+    from dodfminer.extract.polished.workers import WorkerPool
+
+    with WorkerPool(processes=4) as pool:
+        for file in files:
+            data_frames = ActsExtractor.get_all_df_parallel(file, 'ner', pool=pool)
+
+"""
+
+import contextlib
+import multiprocessing
+
+
+def warm(types=None):
+    """Import the act classes and load their CRF models in the process.
+
+    Args:
+        types ([str]): Act types to import. Defaults to all of them.
+
+    """
+    # Imported here, as the core module imports this one
+    from dodfminer.extract.polished.core import _acts_ids, _models_ids
+    from dodfminer.extract.polished.backend import model_store
+
+    for act_type in types or _acts_ids:
+        _acts_ids[act_type]  # pylint: disable=pointless-statement
+    names = None
+    if types:
+        names = {name for act_type in types for name in _models_ids[act_type]}
+    model_store.preload(names=names)
+
+
+class WorkerPool:
+    """Reusable pool of warmed act extraction workers.
+
+    Attributes:
+        processes (int): Number of worker processes.
+        types ([str]): Act types warmed in the workers, all if None.
+
+    """
+
+    def __init__(self, processes=4, types=None, start_method=None):
+        """Init the pool, which starts on its first task.
+
+        Args:
+            processes (int): Number of worker processes.
+            types ([str]): Act types warmed in the workers, all if None.
+            start_method (str): Multiprocessing start method, the
+                default one if None.
+
+        """
+        self.processes = processes
+        self.types = list(types) if types is not None else None
+        self._context = multiprocessing.get_context(start_method)
+        self._pool = None
+
+    @property
+    def started(self):
+        """bool: Whether the worker processes are running."""
+        return self._pool is not None
+
+    def _start(self):
+        if self._pool is None:
+            if self._context.get_start_method() == 'fork':
+                warm(self.types)
+                self._pool = self._context.Pool(processes=self.processes)
+            else:
+                self._pool = self._context.Pool(processes=self.processes,
+                                                initializer=warm,
+                                                initargs=(self.types,))
+        return self._pool
+
+    def map(self, function, iterable):
+        """Run a function on each item in the workers, as Pool.map."""
+        return self._start().map(function, iterable)
+
+    def starmap(self, function, iterable):
+        """Run a function on each tuple of arguments in the workers, as Pool.starmap."""
+        return self._start().starmap(function, iterable)
+
+    def imap_unordered(self, function, iterable):
+        """Run a function on each item in the workers, yielding each result as it is ready."""
+        return self._start().imap_unordered(function, iterable)
+
+    def close(self):
+        """Wait for the tasks and stop the worker processes."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@contextlib.contextmanager
+def borrow(pool=None, processes=4, types=None):
+    """Use a pool, or a new one, closed on exit, when none is given.
+
+    Args:
+        pool (WorkerPool): Pool of the caller, kept open.
+        processes (int): Number of worker processes of a new pool.
+        types ([str]): Act types warmed in a new pool, all if None.
+
+    Yields:
+        The WorkerPool.
+
+    """
+    if pool is not None:
+        yield pool
+        return
+    pool = WorkerPool(processes=processes, types=types)
+    try:
+        yield pool
+    finally:
+        pool.close()
@@ -24,10 +24,33 @@ import fitz
 
 from dodfminer.extract.pure.utils.title_extractor import ExtractorTitleSubtitle
 from dodfminer.extract.pure.utils.box_extractor import get_doc_text_boxes
+from dodfminer.extract.pure.utils import page_parallel
+from dodfminer.extract.pure.utils import block_store
+from dodfminer.extract.pure.utils import layout
+from dodfminer.downloader.catalog import catalog_pdfs
 
 RESULTS_PATH = "results/"
 RESULTS_PATH_JSON = "results/json"
 RESULTS_PATH_TXT = "results/txt"
+RESULTS_PATH_BLOCKS = "results/blocks"
+
+
+class DODFText(str):
+    """Text of a DODF kept in memory, along with its source file.
+
+    Behaves as a string, and can be given to the act classes in place of
+    a .txt path, so no intermediate file is needed.
+
+    Args:
+        text: The DODF text.
+        file_name: Path of the file the text was extracted from.
+
+    """
+
+    def __new__(cls, text, file_name):
+        obj = super().__new__(cls, text)
+        obj.file_name = file_name
+        return obj
 
 
 class ContentExtractor:
@@ -45,7 +68,8 @@ class ContentExtractor:
 
     @classmethod
     # pylint: disable=too-many-arguments
-    def extract_text(cls, file, single=False, block=False, is_json=True, sep=' ', norm='NFKD'):
+    def extract_text(cls, file, single=False, block=False, is_json=True, sep=' ', norm='NFKD',
+                     processes=1):
         """Extract block of text from file
 
         Args:
@@ -55,6 +79,9 @@ class ContentExtractor:
             json: The list of text blocks are written as a json file.
             sep: The separator character between each block of text.
             norm: Type of normalization applied to the text.
+            processes: Number of processes used in the extraction. When
+                greater than one, the DODF is split in page ranges, each
+                one extracted by a separate process.
 
         Note:
             To learn more about the each type of normalization used in the
@@ -95,20 +122,18 @@ class ContentExtractor:
         """
         drawboxes_text = ''
         list_of_boxes = []
-        pymu_file = fitz.open(file)
 
-        for page_boxes in get_doc_text_boxes(pymu_file):
+        for page_boxes in cls._get_doc_boxes(file, processes):
             for text in page_boxes:
-                if int(text[1]) != 55 and int(text[1]) != 881:
-                    if block:
-                        norm_text = cls._normalize_text(text[4], norm)
-                        if is_json:
-                            list_of_boxes.append((text[0], text[1], text[2],
-                                                  text[3], norm_text))
-                        else:
-                            drawboxes_text += (norm_text + sep)
+                if block:
+                    norm_text = cls._normalize_text(text[4], norm)
+                    if is_json:
+                        list_of_boxes.append((text[0], text[1], text[2],
+                                              text[3], norm_text))
                     else:
-                        drawboxes_text += (text[4] + sep)
+                        drawboxes_text += (norm_text + sep)
+                else:
+                    drawboxes_text += (text[4] + sep)
 
         if block:
             if not single:
@@ -122,13 +147,73 @@ class ContentExtractor:
         return drawboxes_text if not single else cls._save_single_file(file, 'txt', drawboxes_text)
 
     @classmethod
-    def extract_structure(cls, file, single=False, norm='NFKD'): # pylint: disable=too-many-locals
+    def extract_plain_text(cls, file, sep=' ', norm='NFKD'):
+        """Extract the text of a DODF, in memory, for act extraction.
+
+        Returns the same text that `extract_to_txt` writes to disc, but
+        joining the blocks in a single pass and normalizing the text once,
+        without intermediate files.
+
+        Args:
+            file: The DODF to extract the text from.
+            sep: The separator character between each block of text.
+            norm: `Type of normalization <https://docs.python.org/3/library/unicodedata.html#unicodedata.normalize>`_ applied to the text.
+
+        Returns:
+            A :class:`DODFText` with the normalized text of the DODF.
+
+        """
+        texts = []
+        for page_boxes in cls._get_doc_boxes(file):
+            for box in page_boxes:
+                texts.append(box[4])
+                texts.append(sep)
+
+        return DODFText(cls._normalize_text(''.join(texts), norm), file)
+
+    @classmethod
+    def extract_blocks(cls, file, single=False, norm='NFKD', processes=1):
+        """Extract the text blocks of each page to a block store.
+
+        Same blocks as `extract_text` with `block=True`, but kept by page
+        and saved in the compact format of
+        :mod:`dodfminer.extract.pure.utils.block_store`.
+
+        Args:
+            file: The DODF to extract the blocks from.
+            single: Save the blocks in a .blocks file in the file directory.
+            norm: `Type of normalization <https://docs.python.org/3/library/unicodedata.html#unicodedata.normalize>`_ applied to the text.
+            processes: Number of processes used in the extraction.
+
+        Returns:
+            When `single=False`, a list with the blocks of each page.
+
+        """
+        pages = []
+        for page_boxes in cls._get_doc_boxes(file, processes):
+            pages.append([(text[0], text[1], text[2], text[3],
+                           cls._normalize_text(text[4], norm))
+                          for text in page_boxes])
+
+        if not single:
+            return pages
+
+        file_path, _, _ = file.rpartition('.pdf')
+        block_store.write_blocks(file_path + block_store.BLOCKS_EXTENSION, pages)
+        return None
+
+    @classmethod
+    def extract_structure(cls, file, single=False, norm='NFKD', processes=1): # pylint: disable=too-many-locals
         """Extract boxes of text with their respective titles.
 
         Args:
             file: The DODF file to extract titles from.
             single: Output content in a single file in the file directory.
             norm: `Type of normalization <https://docs.python.org/3/library/unicodedata.html#unicodedata.normalize>`_ applied to the text.
+            processes: Number of processes used in the extraction, each one
+                handling a range of pages. Blocks are reassembled in page
+                order before the titles are assigned, so titles continue
+                across page ranges.
 
         Returns:
             A dictionaty with the blocks organized by title.
@@ -152,14 +237,14 @@ class ContentExtractor:
         content_dict = {}
 
         try:
-            title_base = cls._extract_titles(file).json.keys()
+            title_base = cls._extract_titles(file, processes).json.keys()
             # Aqui eh realmente necessario pegar um eception generica
             # pylint: disable=broad-except
         except Exception as excpt:
             cls._log(excpt)
             return None
 
-        boxes = cls.extract_text(file, block=True, norm=norm)
+        boxes = cls.extract_text(file, block=True, norm=norm, processes=processes)
         first_title = False
         is_title = False
         actual_title = ''
@@ -191,13 +276,12 @@ class ContentExtractor:
                         is_title = False
 
             if first_title and not is_title and section and actual_title:
-                if int(box[1]) != 55 and int(box[1]) != 881:
-                    content_dict[section][actual_title].append(box[:5])
+                content_dict[section][actual_title].append(box[:5])
 
         return content_dict if not single else cls._save_single_file(file, 'json', json.dumps(content_dict))
 
     @classmethod
-    def extract_to_txt(cls, folder='./', norm='NFKD'):
+    def extract_to_txt(cls, folder='./', norm='NFKD', processes=1):
         """Extract information from DODF to a .txt file.
 
         For each PDF file in data/DODFs, the method extracts information from the
@@ -206,6 +290,7 @@ class ContentExtractor:
         Args:
             folder: The folder containing the PDFs to be extracted.
             norm: `Type of normalization <https://docs.python.org/3/library/unicodedata.html#unicodedata.normalize>`_ applied to the text.
+            processes: Number of processes used to extract each PDF.
 
         """
         pdfs_path_list = cls._get_pdfs_list(folder)
@@ -219,7 +304,7 @@ class ContentExtractor:
             pdf_name = os.path.splitext(os.path.basename(file))[0]
             if pdf_name not in txt_path_list:
                 cls._log(pdf_name)
-                text = cls.extract_text(file, norm=norm)
+                text = cls.extract_text(file, norm=norm, processes=processes)
                 t_path = cls._struct_subfolders(file, False, folder)
                 with open(t_path, "w", encoding='utf-8') as file:
                     file.write(text)
@@ -228,7 +313,7 @@ class ContentExtractor:
 
     @classmethod
     def extract_to_json(cls, folder='./',
-                        titles_with_boxes=False, norm='NFKD'):
+                        titles_with_boxes=False, norm='NFKD', processes=1):
         """Extract information from DODF to JSON.
 
         Args:
@@ -236,6 +321,7 @@ class ContentExtractor:
             titles_with_boxes: If True, the method builds a dict containing a list of tuples (similar to `extract_structure`).
             Otherwise, the method structures a list of tuples (similar to `extract_text`).
             norm: `Type of normalization <https://docs.python.org/3/library/unicodedata.html#unicodedata.normalize>`_ applied to the text.
+            processes: Number of processes used to extract each PDF.
 
         Returns:
             For each PDF file in data/DODFs, extract information from the
@@ -259,9 +345,11 @@ class ContentExtractor:
                     # Remove images that might still there from previous exec
                     cls._log(pdf_name)
                     if titles_with_boxes:
-                        content = cls.extract_structure(file, norm=norm)
+                        content = cls.extract_structure(file, norm=norm,
+                                                        processes=processes)
                     else:
-                        content = cls.extract_text(file, block=True, norm=norm)
+                        content = cls.extract_text(file, block=True, norm=norm,
+                                                   processes=processes)
                     j_path = cls._struct_subfolders(file, True, folder)
                     with open(j_path, "w", encoding="utf-8") as file:
                         json.dump(content, file,
@@ -269,6 +357,61 @@ class ContentExtractor:
             else:
                 cls._log("JSON already exists")
 
+    @classmethod
+    def extract_to_blocks(cls, folder='./', norm='NFKD', processes=1):
+        """Extract the text blocks from DODF to block store files.
+
+        Args:
+            folder: The folder containing the PDFs to be extracted.
+            norm: `Type of normalization <https://docs.python.org/3/library/unicodedata.html#unicodedata.normalize>`_ applied to the text.
+            processes: Number of processes used to extract each PDF.
+
+        Returns:
+            For each PDF file in data/DODFs, extract its text blocks and
+            output them to a .blocks file.
+
+        """
+        pdfs_path_list = cls._get_pdfs_list(folder)
+        blocks_path_list = cls._get_blocks_list(folder)
+
+        cls._create_single_folder(os.path.join(folder, RESULTS_PATH))
+        cls._create_single_folder(os.path.join(folder, RESULTS_PATH_BLOCKS))
+
+        for file in pdfs_path_list:
+            pdf_name = os.path.splitext(os.path.basename(file))[0]
+            if pdf_name not in blocks_path_list:
+                cls._log(pdf_name)
+                pages = cls.extract_blocks(file, norm=norm, processes=processes)
+                b_path = cls._struct_subfolders(file, False, folder, blocks_f=True)
+                block_store.write_blocks(b_path, pages)
+            else:
+                cls._log("Blocks already exists")
+
+    @classmethod
+    def _get_doc_boxes(cls, file, processes=1):
+        """Extract the text blocks of each page, without header and footer.
+
+        The header and footer bands come from the layout profile of the
+        DODF template, see :mod:`dodfminer.extract.pure.utils.layout`.
+
+        Args:
+            file: The DODF to extract the blocks from.
+            processes: Number of processes used in the extraction.
+
+        Returns:
+            List[List[tuple(float, float, float, float, str, int, int)]]
+
+        """
+        with fitz.open(file) as doc:
+            if processes > 1:
+                doc_boxes = page_parallel.get_doc_text_boxes(file, processes)
+            else:
+                doc_boxes = get_doc_text_boxes(doc)
+            profile = layout.get_profile(doc, doc_boxes)
+
+        return [[box for box in page_boxes if not profile.is_margin(box)]
+                for page_boxes in doc_boxes]
+
     @classmethod
     def _save_single_file(cls, file_path, file_type, content):
         file_path, _, _ = file_path.rpartition('.pdf')
@@ -294,11 +437,12 @@ class ContentExtractor:
         return normalized
 
     @classmethod
-    def _extract_titles(cls, file):
+    def _extract_titles(cls, file, processes=1):
         """Extract titles and subtitles from the DODF.
 
         Args:
             file: The DODF to extract the titles.
+            processes: Number of processes used in the extraction.
 
         Returns:
             An object of type ExtractorTitleSubtitle, in which have the
@@ -312,7 +456,7 @@ class ContentExtractor:
 
         """
         try:
-            title_database = ExtractorTitleSubtitle(file)
+            title_database = ExtractorTitleSubtitle(file, processes)
             cls._log(file)
         except Exception as exct:
             cls._log(f"Error in extracting files from {file}: {exct}")
@@ -330,7 +474,15 @@ class ContentExtractor:
         Returns:
             A list of DODFS' PDFs paths.
 
+        Note:
+            Download folders with a catalog are listed by
+            :func:`~dodfminer.downloader.catalog.catalog_pdfs`.
+
         """
+        cataloged = catalog_pdfs(folder)
+        if cataloged is not None:
+            return cataloged
+
         pdfs_path_list = []
         for dir_path, _, file_names in os.walk(os.path.expanduser(os.path.join(folder))):
             for file in file_names:
@@ -384,7 +536,25 @@ class ContentExtractor:
         return txt_path_list
 
     @classmethod
-    def _struct_subfolders(cls, path, json_f, folder):
+    def _get_blocks_list(cls, folder):
+        """Get list of exisiting .blocks files from the path.
+
+        Args:
+            folder: The folder containing the PDFs to be extracted.
+
+        Returns:
+            A list of all exisiting .blocks files.
+
+        """
+        blocks_path_list = []
+        for _, _, file_names in os.walk(os.path.expanduser(os.path.join(folder, RESULTS_PATH_BLOCKS))):
+            for file in file_names:
+                blocks_path_list.append(os.path.splitext(os.path.basename(file))[0])
+
+        return blocks_path_list
+
+    @classmethod
+    def _struct_subfolders(cls, path, json_f, folder, blocks_f=False):
         """Creates a directory for the JSON files.
 
         This method structures the folder tree for the allocation of
@@ -394,6 +564,7 @@ class ContentExtractor:
             path: The path to the extracted file.
             json_f (boolean): If True, the file will extracted to a JSON. Otherwise, it will be extrated to a .txt.
             folder: The folder containing the PDFs to be extracted.
+            blocks_f (boolean): If True, the file will be extracted to a block store, ignoring json_f.
 
         Raises:
             FileExistsError: The folder being created is already there.
@@ -404,6 +575,9 @@ class ContentExtractor:
         """
         type_f = '.json' if json_f else '.txt'
         res_path = RESULTS_PATH_JSON if json_f else RESULTS_PATH_TXT
+        if blocks_f:
+            type_f = block_store.BLOCKS_EXTENSION
+            res_path = RESULTS_PATH_BLOCKS
 
         path = path.replace(folder, "", 1)
         splited = path.split('/')
@@ -0,0 +1,251 @@
+"""Compact binary storage for extracted text blocks.
+
+Text blocks written as JSON lists ``[x0, y0, x1, y1, text]`` are slow to
+write and to parse, and every consumer has to load the whole file. The
+block store keeps the same information in a columnar layout that can be
+memory-mapped and read without copies:
+
+- a header with the number of pages, blocks and text bytes;
+- a page index (int64), where page ``i`` owns the blocks
+  ``page_index[i]:page_index[i + 1]``;
+- a text index (int64), where block ``j`` text is the UTF-8 slice
+  ``text_index[j]:text_index[j + 1]`` of the text buffer;
+- the coordinates of all blocks (float32, ``block_count x 4``);
+- the UTF-8 text buffer.
+
+Note:
+    Coordinates are stored as float32, so values read back are rounded
+    to single precision.
+
+Usage example::
+
+    from dodfminer.extract.pure.utils import block_store
+
+    block_store.write_blocks('dodf.blocks', pages)
+    with block_store.BlockStore('dodf.blocks') as store:
+        first_page = store.page(0)
+
+"""
+
+import json
+import mmap
+import struct
+
+import numpy as np
+
+BLOCKS_EXTENSION = '.blocks'
+"""str: Extension of block store files."""
+
+_MAGIC = b'DODFBLKS'
+_VERSION = 1
+_HEADER = struct.Struct('<8sIIQQ')
+
+
+def write_blocks(path, pages):
+    """Write text blocks to a block store file.
+
+    Args:
+        path: Path of the file to be written.
+        pages: List[List[tuple(float, float, float, float, str, ...)]], the
+            text blocks of each page. Values after the text are ignored.
+
+    """
+    page_index = np.zeros(len(pages) + 1, dtype='<i8')
+    coords = []
+    texts = []
+    for idx, page_blocks in enumerate(pages):
+        for block in page_blocks:
+            coords.append(block[:4])
+            texts.append(block[4].encode('utf-8'))
+        page_index[idx + 1] = len(texts)
+
+    text_index = np.zeros(len(texts) + 1, dtype='<i8')
+    np.cumsum([len(text) for text in texts], out=text_index[1:])
+    coords = np.asarray(coords, dtype='<f4').reshape(-1, 4)
+    text_buffer = b''.join(texts)
+
+    with open(path, 'wb') as file:
+        file.write(_HEADER.pack(_MAGIC, _VERSION, len(pages),
+                                len(texts), len(text_buffer)))
+        file.write(page_index.tobytes())
+        file.write(text_index.tobytes())
+        file.write(coords.tobytes())
+        file.write(text_buffer)
+
+
+class BlockStore:
+    """Read-only access to a block store file.
+
+    The file is memory-mapped and its arrays are views on the mapping, so
+    opening a store does not read the file, and only the blocks accessed
+    are decoded.
+
+    Args:
+        path: Path of the block store file.
+
+    Attributes:
+        page_index: int64 array with the first block of each page.
+        text_index: int64 array with the text offset of each block.
+        coords: float32 array (block_count x 4) with the block boxes.
+
+    Raises:
+        ValueError: The file is not a block store.
+
+    """
+
+    def __init__(self, path):
+        self._path = path
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, page_count, block_count, text_size = \
+            _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a block store file")
+
+        offset = _HEADER.size
+        self.page_index = np.frombuffer(self._mmap, dtype='<i8',
+                                        count=page_count + 1, offset=offset)
+        offset += self.page_index.nbytes
+        self.text_index = np.frombuffer(self._mmap, dtype='<i8',
+                                        count=block_count + 1, offset=offset)
+        offset += self.text_index.nbytes
+        self.coords = np.frombuffer(self._mmap, dtype='<f4',
+                                    count=block_count * 4,
+                                    offset=offset).reshape(-1, 4)
+        offset += self.coords.nbytes
+        self._text = memoryview(self._mmap)[offset:offset + text_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self):
+        return len(self.text_index) - 1
+
+    @property
+    def page_count(self):
+        """int: Number of pages in the store."""
+        return len(self.page_index) - 1
+
+    def text(self, idx):
+        """Text of a single block.
+
+        Args:
+            idx: Index of the block.
+
+        Returns:
+            The decoded text of the block.
+
+        """
+        start, end = self.text_index[idx], self.text_index[idx + 1]
+        return str(self._text[start:end], 'utf-8')
+
+    def texts(self, start=0, end=None):
+        """Texts of a range of blocks.
+
+        Args:
+            start: Index of the first block.
+            end: Index after the last block. Defaults to the last block.
+
+        Returns:
+            List of the decoded texts.
+
+        """
+        end = len(self) if end is None else end
+        offsets = self.text_index[start:end + 1].tolist()
+        raw = self._text[offsets[0]:offsets[-1]].tobytes()
+        base = offsets[0]
+        return [raw[begin - base:finish - base].decode('utf-8')
+                for begin, finish in zip(offsets, offsets[1:])]
+
+    def _blocks(self, start, end):
+        coords = self.coords[start:end].tolist()
+        return [(*box, text) for box, text in zip(coords, self.texts(start, end))]
+
+    def page(self, page_num):
+        """Text blocks of a single page.
+
+        Args:
+            page_num: Number of the page, starting at zero.
+
+        Returns:
+            List[tuple(float, float, float, float, str)]
+
+        """
+        start, end = self.page_index[page_num], self.page_index[page_num + 1]
+        return self._blocks(int(start), int(end))
+
+    def pages(self):
+        """Text blocks of all pages.
+
+        Returns:
+            List[List[tuple(float, float, float, float, str)]]
+
+        """
+        return [self.page(idx) for idx in range(self.page_count)]
+
+    def blocks(self):
+        """Text blocks of the whole document, as `extract_text` returns them.
+
+        Returns:
+            List[tuple(float, float, float, float, str)]
+
+        """
+        return self._blocks(0, len(self))
+
+    def close(self):
+        """Release the memory mapping."""
+        self.page_index = self.text_index = self.coords = None
+        self._text.release()
+        self._mmap.close()
+
+
+def read_text(path, sep=' '):
+    """Read the whole text of a block store.
+
+    Args:
+        path: Path of the block store file.
+        sep: The separator character between each block of text.
+
+    Returns:
+        A string with the text of every block followed by sep.
+
+    """
+    with BlockStore(path) as store:
+        return ''.join(text + sep for text in store.texts())
+
+
+def json_to_blocks(json_path, blocks_path):
+    """Convert a JSON of text blocks to a block store.
+
+    Args:
+        json_path: JSON file, as written by `ContentExtractor.extract_to_json`.
+        blocks_path: Path of the block store to be written.
+
+    Note:
+        The JSON has no page information, so all blocks are stored in
+        a single page.
+
+    """
+    with open(json_path, 'r', encoding='utf-8') as file:
+        blocks = json.load(file)
+    write_blocks(blocks_path, [blocks])
+
+
+def blocks_to_json(blocks_path, json_path):
+    """Convert a block store to a JSON of text blocks.
+
+    Args:
+        blocks_path: Path of the block store.
+        json_path: JSON file to be written, in the format of
+            `ContentExtractor.extract_to_json`.
+
+    """
+    with BlockStore(blocks_path) as store:
+        blocks = store.blocks()
+    with open(json_path, 'w', encoding='utf-8') as file:
+        json.dump(blocks, file, ensure_ascii=False)
@@ -27,16 +27,20 @@ def _extract_page_lines_content(page):
     return lis
 
 
-def get_doc_text_boxes(doc: fitz.Document):
+def get_doc_text_boxes(doc: fitz.Document, pages=None):
     """Returns list of list of extracted text blocks.
 
     Args:
         doc: an opened fitz document.
+        pages: optional iterable of page numbers to extract. Defaults to
+            all pages of the document.
 
     Returns:
         List[List[tuple(float, float, float, float, str, int, int)]]
 
     """
+    if pages is not None:
+        return [doc[idx].get_text('blocks', flags=0) for idx in pages]
 
     text_blocks = [ page.get_text('blocks', flags=0) for page in doc ]
     return text_blocks
@@ -108,9 +112,79 @@ def _get_doc_img(doc: fitz.Document):
     return [page.get_images(full=True) for page in doc]
 
 
+class DocImageBoxes:
+    """Lazy, page indexed access to the bounding boxes of images.
+
+    Bounding boxes of a page are only computed when the page is accessed,
+    and are cached afterwards. Pages without image XObjects are answered
+    from the document resources, without loading the page.
+
+    Usage example::
+
+        img_boxes = DocImageBoxes(doc)
+        page_boxes = img_boxes[3]
+
+    Args:
+        doc: an opened fitz document
+
+    """
+
+    def __init__(self, doc: fitz.Document):
+        self._doc = doc
+        self._pages = {}
+
+    def __len__(self):
+        return self._doc.page_count
+
+    def __getitem__(self, page_num):
+        if not -len(self) <= page_num < len(self):
+            raise IndexError("page number out of range")
+        page_num %= len(self)
+
+        if page_num not in self._pages:
+            self._pages[page_num] = self._page_img_boxes(page_num)
+        return self._pages[page_num]
+
+    def __iter__(self):
+        return (self[idx] for idx in range(len(self)))
+
+    def has_images(self, page_num):
+        """Whether a page has image XObjects.
+
+        Args:
+            page_num: Number of the page, starting at zero.
+
+        Returns:
+            True when the page resources list at least one image.
+
+        """
+        return bool(self._doc.get_page_images(page_num, full=True))
+
+    def _page_img_boxes(self, page_num):
+        """Compute the bounding boxes of the images of a page.
+
+        Args:
+            page_num: Number of the page, starting at zero.
+
+        Returns:
+            List[Rect(float, float, float, float)]
+
+        """
+        images = self._doc.get_page_images(page_num, full=True)
+        if not images:
+            return []
+
+        page = self._doc[page_num]
+        return [page.get_image_bbox(img[:9] + (0,)) for img in images]
+
+
 def get_doc_img_boxes(doc: fitz.Document):
     """Returns list of list of bouding boxes of extracted images.
 
+    Note:
+        To access only some pages, use :class:`DocImageBoxes`, which
+        computes the bounding boxes on demand.
+
     Args:
         doc: an opened fitz document
 
@@ -119,16 +193,4 @@ def get_doc_img_boxes(doc: fitz.Document):
             an image bounding box.
 
     """
-
-    img_ll = _get_doc_img(doc)
-    for idx, img_lis in enumerate(img_ll):
-        page = doc[idx]
-        img_list_altered = []
-
-        for img in img_lis:
-            img = img[:9] + (0,)
-            img_list_altered.append(img)
-
-        img_ll[idx] = [page.get_image_bbox(img) for img in img_list_altered]
-
-    return img_ll
+    return list(DocImageBoxes(doc))
@@ -0,0 +1,229 @@
+"""Learn the page layout of a DODF edition.
+
+The header and the footer of a DODF repeat on every page at the same
+height, but that height changes with the template of each year. Instead
+of assuming fixed coordinates, a :class:`LayoutProfile` is learned from
+the first pages of the document:
+
+- the header band is the top-most row of blocks repeated across pages;
+- the footer band is the bottom-most row of blocks repeated across pages;
+- the column split is the center of the gutter between the two columns,
+  when the pages agree on it.
+
+Profiles are cached by a fingerprint of the template (producer, creator
+and page size), so documents of the same template are learned once.
+Bands that can not be learned, e.g. on documents with a single page,
+fall back to the coordinates used by older versions of DODFMiner.
+
+Usage example::
+
+    from dodfminer.extract.pure.utils import layout
+
+    profile = layout.get_profile(doc)
+    boxes = [box for box in page_boxes if not profile.is_margin(box)]
+
+"""
+
+import statistics
+
+SAMPLE_PAGES = 6
+"""int: Number of pages used to learn a profile."""
+
+MIN_SAMPLE_PAGES = 3
+"""int: Smallest number of pages a profile must be learned from to be cached."""
+
+BAND_TOLERANCE = 1.0
+"""float: Distance, in points, a block may be from a learned band."""
+
+MARGIN_RATIO = 0.15
+"""float: Fraction of the page height where headers and footers are searched."""
+
+MIN_GUTTER = 5.0
+"""float: Smallest gap, in points, considered a gutter between columns."""
+
+_DEFAULT_HEADER = (55.0, 56.0)
+_DEFAULT_FOOTER = (881.0, 882.0)
+
+_PROFILES = {}
+
+
+class LayoutProfile:
+    """Page regions of a DODF template.
+
+    Bands are half-open ranges ``[start, stop)`` of the top (y0) of the
+    blocks, so testing a block is a couple of comparisons.
+
+    Args:
+        header: tuple(float, float) with the header band.
+        footer: tuple(float, float) with the footer band.
+        column_x: x-coordinate splitting the two columns, or None to use
+            the middle of the page.
+
+    """
+
+    __slots__ = ('header', 'footer', 'column_x')
+
+    def __init__(self, header=_DEFAULT_HEADER, footer=_DEFAULT_FOOTER,
+                 column_x=None):
+        self.header = header
+        self.footer = footer
+        self.column_x = column_x
+
+    def __repr__(self):
+        return (f"LayoutProfile(header={self.header}, footer={self.footer}, "
+                f"column_x={self.column_x})")
+
+    def __eq__(self, other):
+        return (isinstance(other, LayoutProfile)
+                and (self.header, self.footer, self.column_x)
+                == (other.header, other.footer, other.column_x))
+
+    def is_margin(self, box):
+        """Whether a block belongs to the header or the footer.
+
+        Args:
+            box: tuple(float, float, float, float, str, ...) text block.
+
+        Returns:
+            True when the top of the block is inside a margin band.
+
+        """
+        y_0 = box[1]
+        return (self.header[0] <= y_0 < self.header[1]
+                or self.footer[0] <= y_0 < self.footer[1])
+
+    def column_split(self, width):
+        """x-coordinate splitting the columns of a page.
+
+        Args:
+            width: width of the page.
+
+        Returns:
+            The learned split, or the middle of the page.
+
+        """
+        return width / 2 if self.column_x is None else self.column_x
+
+
+def _repeated_band(rows, min_pages):
+    """Find the y0 shared by the outermost blocks of several pages.
+
+    Args:
+        rows: List[float] with the y0 of the outermost block of each page.
+        min_pages: Number of pages the band must appear in.
+
+    Returns:
+        tuple(float, float) with the band, or None.
+
+    """
+    for y_0 in rows:
+        close = [other for other in rows if abs(other - y_0) <= BAND_TOLERANCE]
+        if len(close) >= min_pages:
+            return (min(close) - BAND_TOLERANCE, max(close) + BAND_TOLERANCE)
+    return None
+
+
+def _page_gutter(boxes, width):
+    """Center of the widest gap between blocks around the page middle.
+
+    Args:
+        boxes: text blocks of a page, without its margins.
+        width: width of the page.
+
+    Returns:
+        The x-coordinate of the gutter center, or None.
+
+    """
+    low, high = 0.3 * width, 0.7 * width
+    spans = sorted((box[0], box[2]) for box in boxes
+                   if box[2] - box[0] < 0.6 * width and box[2] > low
+                   and box[0] < high)
+
+    best, best_size = None, MIN_GUTTER
+    position = low
+    for x_0, x_1 in spans + [(high, high)]:
+        if x_0 - position > best_size:
+            best, best_size = (position + x_0) / 2, x_0 - position
+        position = max(position, x_1)
+    return best
+
+
+def learn_profile(doc_boxes, width, height):
+    """Learn the layout profile from the text blocks of the first pages.
+
+    Args:
+        doc_boxes: List[List[tuple]] with the text blocks of each page.
+        width: width of the pages.
+        height: height of the pages.
+
+    Returns:
+        A :class:`LayoutProfile`.
+
+    """
+    sample = [boxes for boxes in doc_boxes[:SAMPLE_PAGES] if boxes]
+    min_pages = max(2, (len(sample) + 1) // 2)
+
+    tops = [min(box[1] for box in boxes) for boxes in sample]
+    bottoms = [max(box[1] for box in boxes) for boxes in sample]
+    header = _repeated_band(
+        sorted(y_0 for y_0 in tops if y_0 < MARGIN_RATIO * height), min_pages)
+    footer = _repeated_band(
+        sorted((y_0 for y_0 in bottoms if y_0 > (1 - MARGIN_RATIO) * height),
+               reverse=True), min_pages)
+
+    profile = LayoutProfile(header or _DEFAULT_HEADER,
+                            footer or _DEFAULT_FOOTER)
+    gutters = [_page_gutter([box for box in boxes
+                             if not profile.is_margin(box)], width)
+               for boxes in sample]
+    gutters = [gutter for gutter in gutters if gutter is not None]
+    if gutters:
+        median = statistics.median(gutters)
+        agreeing = [gutter for gutter in gutters
+                    if abs(gutter - median) <= MIN_GUTTER]
+        if len(agreeing) >= min_pages:
+            profile.column_x = median
+    return profile
+
+
+def fingerprint(doc):
+    """Fingerprint of the template of a document.
+
+    Args:
+        doc: an opened fitz document.
+
+    Returns:
+        A hashable tuple identifying the template.
+
+    """
+    rect = doc[0].rect
+    return (doc.metadata.get('creator'), doc.metadata.get('producer'),
+            round(rect.width), round(rect.height))
+
+
+def get_profile(doc, doc_boxes=None):
+    """Get the layout profile of a document, learning it when needed.
+
+    Args:
+        doc: an opened fitz document.
+        doc_boxes: text blocks of each page, when already extracted.
+
+    Returns:
+        A :class:`LayoutProfile`.
+
+    """
+    if doc.page_count == 0:
+        return LayoutProfile()
+
+    key = fingerprint(doc)
+    if key in _PROFILES:
+        return _PROFILES[key]
+
+    if doc_boxes is None:
+        doc_boxes = [doc[idx].get_text('blocks', flags=0)
+                     for idx in range(min(SAMPLE_PAGES, doc.page_count))]
+    rect = doc[0].rect
+    profile = learn_profile(doc_boxes, rect.width, rect.height)
+    if min(SAMPLE_PAGES, doc.page_count) >= MIN_SAMPLE_PAGES:
+        _PROFILES[key] = profile
+    return profile
@@ -0,0 +1,122 @@
+"""Split a single DODF into page ranges processed by separate workers.
+
+Large supplements can have hundreds of pages, and extracting them on a
+single core makes them the slowest item of any batch. The functions in
+this module split the document into contiguous page ranges, let each
+worker open the PDF independently and extract its range, and reassemble
+the per-page results in page order, so the output is identical to the
+sequential extraction.
+
+Usage example::
+
+    from dodfminer.extract.pure.utils import page_parallel
+
+    boxes = page_parallel.get_doc_text_boxes(path, processes=4)
+
+"""
+
+import multiprocessing
+
+import fitz
+
+from dodfminer.extract.pure.utils import box_extractor
+
+CHUNKS_PER_PROCESS = 4
+"""int: Page ranges created per worker, so uneven pages balance out."""
+
+MIN_PAGES_PER_CHUNK = 8
+"""int: Smallest page range worth sending to a worker."""
+
+
+def split_page_ranges(page_count, processes):
+    """Split the pages of a document into contiguous ranges.
+
+    Args:
+        page_count: Number of pages in the document.
+        processes: Number of workers that will consume the ranges.
+
+    Returns:
+        List[tuple(int, int)] with the (start, stop) of each range, in
+        page order. Together the ranges cover every page exactly once.
+
+    """
+    if page_count <= 0:
+        return []
+
+    chunks = max(1, processes) * CHUNKS_PER_PROCESS
+    chunks = min(chunks, max(1, page_count // MIN_PAGES_PER_CHUNK))
+    size, extra = divmod(page_count, chunks)
+
+    ranges = []
+    start = 0
+    for idx in range(chunks):
+        stop = start + size + (1 if idx < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _text_boxes_range(args):
+    """Extract the text blocks of a page range.
+
+    Note:
+        Runs inside a worker process, which opens its own document.
+
+    Args:
+        args: tuple(str, int, int) with the path and the page range.
+
+    Returns:
+        List[List[tuple]] with the text blocks of each page in the range.
+
+    """
+    path, start, stop = args
+    with fitz.open(path) as doc:
+        return box_extractor.get_doc_text_boxes(doc, pages=range(start, stop))
+
+
+def map_page_ranges(func, path, processes):
+    """Run func over the page ranges of path and reassemble the pages.
+
+    Args:
+        func: Top-level worker function receiving a (path, start, stop)
+            tuple and returning a list with one element per page.
+        path: Path of the PDF file.
+        processes: Number of worker processes.
+
+    Returns:
+        A list with one element per page, in page order.
+
+    """
+    with fitz.open(path) as doc:
+        page_count = doc.page_count
+
+    args = [(path, start, stop)
+            for start, stop in split_page_ranges(page_count, processes)]
+    if processes <= 1 or len(args) <= 1:
+        results = [func(arg) for arg in args]
+    else:
+        with multiprocessing.Pool(processes=min(processes, len(args))) as pool:
+            # map keeps the input order, so the reassembly is deterministic
+            results = pool.map(func, args)
+
+    pages = []
+    for page_range in results:
+        pages.extend(page_range)
+    return pages
+
+
+def get_doc_text_boxes(path, processes=1):
+    """Returns list of list of extracted text blocks, using page ranges.
+
+    Same output as `box_extractor.get_doc_text_boxes`.
+
+    Args:
+        path: Path of the PDF file.
+        processes: Number of worker processes.
+
+    Returns:
+        List[List[tuple(float, float, float, float, str, int, int)]]
+
+    """
+    return map_page_ranges(_text_boxes_range, path, processes)
+
@@ -16,6 +16,8 @@ import operator
 import fitz
 
 from dodfminer.extract.pure.utils import title_filter
+from dodfminer.extract.pure.utils import page_parallel
+from dodfminer.extract.pure.utils import layout
 
 Box = namedtuple("Box", "x0 y0 x1 y1")
 BBox = namedtuple("BBox", "bbox")
@@ -50,7 +52,7 @@ def load_blocks_list(path):
     return [p.get_textpage().extractDICT()['blocks'] for p in doc]
 
 
-def group_by_column(elements, width):
+def group_by_column(elements, width, column_x=None):
     """Groups elements by its culumns.
     The sorting assumes they are on the same page
     and on a 2-column layout.
@@ -60,13 +62,16 @@ def group_by_column(elements, width):
     Args:
         elements: Iterable[TextTypeBboxPageTuple] sorted by its page
                   number to be grouped.
+        width: the page width.
+        column_x: x-coordinate splitting the columns, as learned by
+            `layout.get_profile`. Defaults to the middle of the page.
 
     Returns:
         A dict with spans of each page, being keys the page numbers.
 
     """
     left_right = [[], []]
-    mid_width = width / 2
+    mid_width = width / 2 if column_x is None else column_x
     for i in elements:
         if i.bbox.x0 <= mid_width:
             left_right[0].append(i)
@@ -96,13 +101,15 @@ def group_by_page(elements):
     return page_elements
 
 
-def sort_by_column(elements, width):
+def sort_by_column(elements, width, column_x=None):
     """Sorts list elements by columns.
 
     Args:
         elements: Iterable[TextTypeBboxPageTuple].
         width: the page width (the context in which all list elements
             were originally).
+        column_x: x-coordinate splitting the columns. Defaults to the
+            middle of the page.
 
     Returns:
         List[TextTypeBboxPageTuple] containing the list elements
@@ -114,7 +121,7 @@ def sort_by_column(elements, width):
         reading order is expected to be kept.
 
     """
-    left_right = group_by_column(elements, width)
+    left_right = group_by_column(elements, width, column_x)
 
     # Sort by height
     ordenado = (sorted(i, key=lambda x: x.bbox.y0) for i in left_right)
@@ -176,7 +183,26 @@ def _extract_bold_upper_pdf(doc):
     return [_extract_bold_upper_page(page) for page in doc]
 
 
-def sort_2column(elements, width_lis):
+def _bold_upper_range(args):
+    """Extracts bold content from a page range of a DODF pdf.
+
+    Note:
+        Worker for `page_parallel.map_page_ranges`, it opens
+        its own document.
+
+    Args:
+        args: tuple(str, int, int) with the pdf path and the page range.
+
+    Returns:
+        a list of list of bold span text, one for each page in the range
+
+    """
+    path, start, stop = args
+    with fitz.open(path) as doc:
+        return [_extract_bold_upper_page(doc[idx]) for idx in range(start, stop)]
+
+
+def sort_2column(elements, width_lis, column_x=None):
     """Sorts TextTypeBboxPageTuple iterable.
 
     Sorts sequence of TextTypeBboxPageTuple objects, assuming a full 2-columns
@@ -184,20 +210,23 @@ def sort_2column(elements, width_lis):
 
     Args:
         elements: Iterable[TextTypeBboxPageTuple]
+        width_lis: the width of each page.
+        column_x: x-coordinate splitting the columns. Defaults to the
+            middle of each page.
     Returns:
         dictionary mapping page number to its elements sorted by column
         (assumig there are always 2 columns per page)
     """
     by_page = group_by_page(elements)
-    ordered_by_page = {idx: sort_by_column(elements, width=width_lis[idx]) for idx, elements in
-                       sorted(by_page.items())}
+    ordered_by_page = {idx: sort_by_column(elements, width=width_lis[idx], column_x=column_x)
+                       for idx, elements in sorted(by_page.items())}
     return ordered_by_page
 
 
 # TODO: deal with `subtitles` using homogeneous reasoning
 # (pretty much what was done on `titles`, so that the
 # multiline are correctly assembled)
-def _get_titles_subtitles(elements, width_lis):
+def _get_titles_subtitles(elements, width_lis, column_x=None):
     """Extracts titles and subtitles from list. WARNING: Based on font size and heuristic.
 
     Args:
@@ -206,6 +235,9 @@ def _get_titles_subtitles(elements, width_lis):
             text -> str
             bbox -> Box
             page -> int
+        width_lis: the width of each page.
+        column_x: x-coordinate splitting the columns. Defaults to the
+            middle of each page.
 
     Returns:
         TitlesSubtitles[List[TextTypeBboxPageTuple], List[TextTypeBboxPageTuple]].
@@ -237,7 +269,8 @@ def _get_titles_subtitles(elements, width_lis):
                 # Titles must be also in the same column
 
                 column_grouped = group_by_column((BBox(previous_element['bbox']), BBox(current_element['bbox'])),
-                                                 width=width_lis[current_element['page']])
+                                                 width=width_lis[current_element['page']],
+                                                 column_x=column_x)
                 cond3 = not (column_grouped[0] and column_grouped[1])
                 if cond1 and cond2 and cond3:
                     titles[-1][0].append(current_element['text'])
@@ -286,7 +319,7 @@ def _get_titles_subtitles(elements, width_lis):
     return TitlesSubtitles(titles, sub_titles)
 
 
-def _get_titles_subtitles_smart(doc, width_lis):
+def _get_titles_subtitles_smart(doc, width_lis, bold_pages=None, column_x=None):
     """Extracts titles and subtitles. Makes use of heuristics.
 
     Wraps _get_titles_subtitles, removing most of impurity
@@ -294,12 +327,18 @@ def _get_titles_subtitles_smart(doc, width_lis):
 
     Args:
         doc: DODF pdf file returned by `fitz.open`
+        bold_pages: bold spans of each page, already extracted. When
+            None, they are extracted from doc.
+        column_x: x-coordinate splitting the columns. Defaults to the
+            middle of each page.
 
     Returns:
         TitlesSubtitles(List[TextTypeBboxPageTuple],
                         List[TextTypeBboxPageTuple]).
     """
-    bold_spans = reduce(operator.add, _extract_bold_upper_pdf(doc))
+    if bold_pages is None:
+        bold_pages = _extract_bold_upper_pdf(doc)
+    bold_spans = reduce(operator.add, bold_pages)
     filtered1 = filter(title_filter.BoldUpperCase.dict_text, bold_spans)
     filtered2 = filter(lambda s: not re.search(
         _TRASH_COMPILED, s['text']), filtered1)
@@ -311,15 +350,17 @@ def _get_titles_subtitles_smart(doc, width_lis):
     ordered1 = sorted(filtered3,
                       key=lambda x: (-x['page'], x['size']),
                       reverse=True)
-    return _get_titles_subtitles(ordered1, width_lis)
+    return _get_titles_subtitles(ordered1, width_lis, column_x)
 
 
-def extract_titles_subtitles(path):
+def extract_titles_subtitles(path, processes=1):
     """Extracts titles and subtitles from DODF pdf.
 
     Args:
         path: str indicating the path for the pdf to have its
             content extracted.
+        processes: number of processes used to extract the bold spans,
+            each one handling a range of pages.
 
     Returns:
         List[TextTypeBboxPageTuple] containing all titles ans subtitles.
@@ -327,10 +368,18 @@ def extract_titles_subtitles(path):
     """
     doc = fitz.open(path)
     width_lis = [p.MediaBox[2] for p in doc]
-
-    titles_subtitles = _get_titles_subtitles_smart(doc, width_lis=width_lis)
+    column_x = layout.get_profile(doc).column_x
+
+    bold_pages = None
+    if processes > 1:
+        bold_pages = page_parallel.map_page_ranges(_bold_upper_range,
+                                                   path, processes)
+    titles_subtitles = _get_titles_subtitles_smart(doc, width_lis=width_lis,
+                                                   bold_pages=bold_pages,
+                                                   column_x=column_x)
     by_page = sort_2column(
-        reduce(operator.add, titles_subtitles), width_lis=width_lis)
+        reduce(operator.add, titles_subtitles), width_lis=width_lis,
+        column_x=column_x)
     return reduce(operator.add, by_page.values())
 
 
@@ -355,17 +404,19 @@ class ExtractorTitleSubtitle:
 
     _TITLE_MULTILINE_THRESHOLD = 10
 
-    def __init__(self, path):
+    def __init__(self, path, processes=1):
         """.
 
         Args:
             path: str indicating the path for the pdf to have its
                 content extracted
+            processes: number of processes used in the extraction
         """
         self._titles_subtitles = TitlesSubtitles([], [])
         self._titles = []
         self._subtitles = []
         self._path = path
+        self._processes = processes
         self._cached = False
         self._json = {}
         self._hierarchy = []
@@ -440,7 +491,8 @@ class ExtractorTitleSubtitle:
             - _titles
             - _subtitles
         """
-        self._titles_subtitles = tuple(extract_titles_subtitles(self._path))
+        self._titles_subtitles = tuple(
+            extract_titles_subtitles(self._path, self._processes))
         self._titles = tuple(filter(lambda x: x.type == _TYPE_TITLE,
                                     self._titles_subtitles))
         self._subtitles = tuple(filter(lambda x: x.type == _TYPE_SUBTITLE,
@@ -12,10 +12,9 @@ Usage example::
 
 
 from dodfminer.cli import CLI
-from dodfminer.downloader.core import Downloader
-from dodfminer.extract.pure.core import ContentExtractor
-from dodfminer.extract.polished.helper import extract_multiple_acts, extract_multiple_acts_parallel, \
-    extract_multiple_acts_with_committee, xml_multiple
+
+# The subcommands import their modules when they run, so parsing the
+# arguments, or printing the help, does not load the extraction stack.
 
 
 class Miner():
@@ -40,30 +39,103 @@ class Miner():
 
     def download(self):
         """Download PDFs with parameters from CLI."""
-        downloader = Downloader(save_path=self.args.save_path)
+        from dodfminer.downloader.core import Downloader
+        from dodfminer.downloader.retry import RetryPolicy
+
+        downloader = Downloader(save_path=self.args.save_path,
+                                max_workers=self.args.workers,
+                                max_per_host=self.args.max_per_host,
+                                retry=RetryPolicy(attempts=self.args.retries),
+                                rate_limit=self.args.rate_limit,
+                                latency_target=self.args.latency_target)
         if(self.args.file_type == 'pdf'):
             downloader.pull(self.args.start_date, self.args.end_date)
         else:
             downloader._prog_bar.disable = True
-            downloader.pull_json(self.args.url)
-
+            downloader.pull_json(self.args.url, compress=self.args.compress)
+
+
+    def sync(self):
+        """Download and extract PDFs at the same time, with parameters from CLI."""
+        from dodfminer.downloader.core import Downloader
+        from dodfminer.downloader.retry import RetryPolicy
+        from dodfminer.sync import SyncPipeline
+
+        downloader = Downloader(save_path=self.args.save_path,
+                                max_workers=self.args.workers,
+                                max_per_host=self.args.max_per_host,
+                                retry=RetryPolicy(attempts=self.args.retries),
+                                rate_limit=self.args.rate_limit,
+                                latency_target=self.args.latency_target)
+        pipeline = SyncPipeline(downloader, self.args.act, self.args.backend,
+                                workers=self.args.extract_workers,
+                                queue_size=self.args.queue_size,
+                                processes=self.args.processes)
+        pipeline.run(self.args.start_date, self.args.end_date,
+                     out_path=downloader.get_download_path())
+        for stage in ('download', 'extract'):
+            stats = pipeline.stats()[stage]
+            self._log(f"{stage}: {stats['items']} PDFs, "
+                      f"{stats['items_per_second']:.2f} PDFs/s, "
+                      f"{stats['bytes_per_second'] / 1e6:.2f} MB/s, "
+                      f"{stats['errors']} errors")
+
+    def prefetch(self):
+        """Download the NLTK resources of the extraction, with parameters from CLI."""
+        from dodfminer.extract.polished import resources
+
+        data_path = resources.prefetch(self.args.data_path)
+        self._log(f"NLTK resources saved to {data_path}, "
+                  f"set {resources.DATA_PATH_ENV}={data_path} to use them")
+
+    def convert(self):
+        """Convert the CRF models to native CRFsuite files, with parameters from CLI."""
+        from dodfminer.extract.polished.backend import model_store
+
+        path = self.args.models_path or model_store.MODELS_PATH
+        written = model_store.convert(path)
+        self._log(f"{len(written)} CRF models converted in {path}")
+
+    def serve(self):
+        """Serve the extraction on a local port or Unix socket, with parameters from CLI."""
+        from dodfminer.service import ExtractionService
+
+        service = ExtractionService(types=self.args.act, backend=self.args.backend,
+                                    host=self.args.host, port=self.args.port,
+                                    unix_socket=self.args.unix_socket,
+                                    max_batch=self.args.max_batch,
+                                    max_wait=self.args.max_wait / 1000)
+        self._log(f"Serving on {service.address}")
+        service.serve_forever()
 
     def extract_content(self):
         """Extract Content from PDFs."""
+        from dodfminer.extract.pure.core import ContentExtractor
+        from dodfminer.extract.polished.helper import extract_multiple_acts, extract_multiple_acts_parallel, \
+            extract_multiple_acts_with_committee, extract_multiple_acts_in_memory, xml_multiple
+
+        processes = self.args.number_of_processes or 1
         if self.args.single_file is None:
             if self.args.type_of_extr is not None:
                 if self.args.type_of_extr == 'pure-text':
                     ContentExtractor.extract_to_txt(
-                        folder=self.args.input_folder)
+                        folder=self.args.input_folder, processes=processes)
                 elif self.args.type_of_extr == 'with-titles':
                     ContentExtractor.extract_to_json(folder=self.args.input_folder,
-                                                     titles_with_boxes=True)
+                                                     titles_with_boxes=True,
+                                                     processes=processes)
                 elif self.args.type_of_extr == 'blocks':
                     ContentExtractor.extract_to_json(
-                        folder=self.args.input_folder)
+                        folder=self.args.input_folder, processes=processes)
+                elif self.args.type_of_extr == 'compact-blocks':
+                    ContentExtractor.extract_to_blocks(
+                        folder=self.args.input_folder, processes=processes)
             elif self.args.act != 'all':
                 if self.args.committee:
-                    extract_multiple_acts_with_committee(self.args.input_folder, self.args.act, self.args.backend)
+                    extract_multiple_acts_with_committee(self.args.input_folder, self.args.act, self.args.backend,
+                                                         processes=self.args.number_of_processes or 4)
+                elif self.args.in_memory:
+                    extract_multiple_acts_in_memory(self.args.input_folder, self.args.act, self.args.backend)
                 elif self.args.number_of_processes is not None:
                     extract_multiple_acts_parallel(self.args.input_folder, self.args.act, self.args.backend, self.args.number_of_processes)
                 else:
@@ -76,19 +148,31 @@ class Miner():
             self._extract_single_file()
 
     def _extract_single_file(self):
+        from dodfminer.extract.pure.core import ContentExtractor
+        from dodfminer.extract.polished.helper import extract_multiple_acts, extract_multiple_acts_parallel, \
+            extract_multiple_acts_with_committee, extract_multiple_acts_in_memory, xml_multiple
+
+        processes = self.args.number_of_processes or 1
         if self.args.type_of_extr is not None:
             if self.args.type_of_extr == 'pure-text':
                 ContentExtractor.extract_text(self.args.single_file,
-                                              single=True)
+                                              single=True, processes=processes)
             elif self.args.type_of_extr == 'with-titles':
                 ContentExtractor.extract_structure(self.args.single_file,
-                                                   single=True)
+                                                   single=True, processes=processes)
             elif self.args.type_of_extr == 'blocks':
                 ContentExtractor.extract_text(
-                    self.args.single_file, single=True, block=True)
+                    self.args.single_file, single=True, block=True,
+                    processes=processes)
+            elif self.args.type_of_extr == 'compact-blocks':
+                ContentExtractor.extract_blocks(
+                    self.args.single_file, single=True, processes=processes)
         elif self.args.act != 'all':
             if self.args.committee:
-                extract_multiple_acts_with_committee(self.args.single_file, self.args.act, self.args.backend)
+                extract_multiple_acts_with_committee(self.args.single_file, self.args.act, self.args.backend,
+                                                     processes=self.args.number_of_processes or 4)
+            elif self.args.in_memory:
+                extract_multiple_acts_in_memory(self.args.single_file, self.args.act, self.args.backend)
             elif self.args.number_of_processes is not None:
                 extract_multiple_acts_parallel(self.args.single_file, self.args.act, self.args.backend, self.args.number_of_processes)
             else:
@@ -109,6 +193,14 @@ def run():
         miner.download()
     elif miner.args.subparser_name == 'extract':
         miner.extract_content()
+    elif miner.args.subparser_name == 'sync':
+        miner.sync()
+    elif miner.args.subparser_name == 'prefetch':
+        miner.prefetch()
+    elif miner.args.subparser_name == 'convert':
+        miner.convert()
+    elif miner.args.subparser_name == 'serve':
+        miner.serve()
     else:
         miner.cli.parser.print_help()
 
@@ -0,0 +1,463 @@
+"""Local extraction service, with warm models and micro-batching.
+
+Every ``dodfminer extract`` run starts an interpreter, imports the
+extraction stack and loads the models before reading a document. The
+service does that once and keeps serving: it listens on a local TCP
+port, or on a Unix socket, and answers each document posted to it with
+its acts as JSON. Nothing is downloaded, so it runs offline.
+
+Requests::
+
+    GET  /health
+    POST /extract?types=nomeacao,exoneracao&name=dodf.pdf
+
+The body of an extraction is the document, a PDF (``application/pdf``),
+a DODF JSON (``application/json``) or a DODF text (``text/plain``). The
+response maps each act type to its acts, one record per act.
+
+The documents are read by the request threads. Their extraction is
+micro-batched: a single extraction thread takes the documents waiting,
+up to ``max_batch`` of them and ``max_wait`` seconds after the first,
+and each act type segments all of them and, with the ner backend,
+predicts all their acts in a single call of its CRF model.
+
+Usage example::
+
+    service = ExtractionService(types=['nomeacao'], port=8000)
+    service.serve_forever()
+
+    client = ServiceClient(('127.0.0.1', 8000))
+    acts = client.extract(open('dodf.pdf', 'rb').read(), 'application/pdf')
+
+"""
+
+import http.client
+import json
+import os
+import queue
+import shutil
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlencode, urlparse, parse_qs
+
+from dodfminer.extract.polished.core import _acts_ids
+from dodfminer.extract.polished.engine import ExtractionEngine
+from dodfminer.extract.pure.core import ContentExtractor, DODFText
+
+_DONE = None
+
+CONTENT_TYPES = ('application/pdf', 'application/json', 'text/plain')
+"""tuple: Content types of the documents accepted."""
+
+
+def records(data_frame):
+    """Records of the acts of a dataframe, as JSON values.
+
+    Args:
+        data_frame (:obj:`DataFrame`): The acts of a type.
+
+    Returns:
+        A list with a dict for each act.
+
+    """
+    return json.loads(data_frame.to_json(orient='records', force_ascii=False))
+
+
+class Batcher:
+    """Extract the documents submitted concurrently in micro-batches.
+
+    Args:
+        engine (:obj:`ExtractionEngine`): Engine extracting the documents.
+        max_batch (int): Maximum number of documents in a batch.
+        max_wait (float): Seconds a batch waits for more documents,
+            after its first one.
+
+    Attributes:
+        requests: Number of documents extracted.
+        batches: Number of batches extracted.
+
+    """
+
+    def __init__(self, engine, max_batch=16, max_wait=0.005):
+        self.engine = engine
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.requests = 0
+        self.batches = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, document, types):
+        """Queue a document to be extracted.
+
+        Args:
+            document: The DODF, as a DODFText or a file path.
+            types ([str]): Types of the act.
+
+        Returns:
+            A Future of the dict with the dataframe of each act type.
+
+        """
+        future = Future()
+        self._queue.put((document, list(types), future))
+        return future
+
+    def _next_batch(self):
+        item = self._queue.get()
+        if item is _DONE:
+            return None
+        batch = [item]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _DONE:
+                # Stops after this batch
+                self._queue.put(_DONE)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._extract(batch)
+
+    def _extract_type(self, act_type, items):
+        """Extract an act type from the documents of a batch asking for it.
+
+        The documents are extracted together. When that fails, each one is
+        extracted again on its own, so only the failing ones get the error.
+
+        """
+        documents = [document for document, _, _ in items]
+        try:
+            return [(result[act_type], None)
+                    for result in self.engine.extract_batch(documents, [act_type])]
+        except Exception:  # pylint: disable=broad-except
+            # Extracted again one at a time, below
+            pass
+        results = []
+        for document, _, _ in items:
+            try:
+                results.append((self.engine.extract(document, [act_type])[act_type], None))
+            except Exception as error:  # pylint: disable=broad-except
+                results.append((None, error))
+        return results
+
+    def _extract(self, batch):
+        results = [{} for _ in batch]
+        errors = [None] * len(batch)
+        act_types = list(dict.fromkeys(t for _, types, _ in batch for t in types))
+        for act_type in act_types:
+            indexes = [i for i, (_, types, _) in enumerate(batch)
+                       if act_type in types and errors[i] is None]
+            extracted = self._extract_type(act_type, [batch[i] for i in indexes])
+            for i, (data_frame, error) in zip(indexes, extracted):
+                if error is None:
+                    results[i][act_type] = data_frame
+                else:
+                    errors[i] = error
+        for result, error, (_, _, future) in zip(results, errors, batch):
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+        self.requests += len(batch)
+        self.batches += 1
+
+    def close(self):
+        """Extract the documents queued and stop."""
+        self._queue.put(_DONE)
+        self._thread.join()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """HTTP requests of the service."""
+
+    server_version = 'DODFMiner'
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    def address_string(self):
+        # Unix socket clients have no address
+        return str(self.client_address[0]) if self.client_address else 'unix'
+
+    def _reply(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer the health check."""
+        if urlparse(self.path).path != '/health':
+            self._reply(404, {'error': f"unknown path {self.path}"})
+            return
+        self._reply(200, self.server.service.health())
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Extract the acts of the document in the body."""
+        url = urlparse(self.path)
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if url.path != '/extract':
+            self._reply(404, {'error': f"unknown path {url.path}"})
+            return
+        query = parse_qs(url.query)
+        content_type = self.headers.get('Content-Type', 'text/plain').split(';')[0].strip()
+        types = [t for value in query.get('types', []) for t in value.split(',') if t]
+        name = query.get('name', ['document'])[0]
+        try:
+            result = self.server.service.extract(body, content_type, types, name)
+        except ValueError as error:
+            self._reply(400, {'error': str(error)})
+        except Exception as error:  # pylint: disable=broad-except
+            self._reply(500, {'error': f"{type(error).__name__}: {error}"})
+        else:
+            self._reply(200, result)
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP server on a Unix socket."""
+
+    daemon_threads = True
+
+
+class ExtractionService:
+    """Local HTTP service extracting the acts of the documents posted.
+
+    The act classes and the CRF models are loaded by the extraction
+    engine of the service, when it is created, and each request only
+    extracts its document, in a batch with the documents posted at the
+    same time.
+
+    Args:
+        types ([str]): Act types extracted by default, all when empty.
+        backend (str): what backend will be used to extract Acts {regex, ner}
+        host (str): Address the service listens on.
+        port (int): TCP port the service listens on, 0 for any free one.
+        unix_socket (str): Path of a Unix socket to listen on, instead
+            of the TCP port.
+        max_batch (int): Maximum number of documents in a batch.
+        max_wait (float): Seconds a batch waits for more documents.
+
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, types=None, backend='regex', host='127.0.0.1', port=8000,
+                 unix_socket=None, max_batch=16, max_wait=0.005):
+        self.engine = ExtractionEngine(types, backend)
+        self.types = self.engine.types
+        self.backend = backend
+        self.unix_socket = unix_socket
+        self._tmp = tempfile.mkdtemp(prefix='dodfminer-serve-')
+        self._batcher = Batcher(self.engine, max_batch, max_wait)
+        if unix_socket is not None:
+            if os.path.exists(unix_socket):
+                os.remove(unix_socket)
+            self._server = _UnixHTTPServer(unix_socket, _Handler)
+        else:
+            self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.service = self
+        self._thread = None
+
+    @property
+    def address(self):
+        """The (host, port) of the service, or the path of its Unix socket."""
+        if self.unix_socket is not None:
+            return self.unix_socket
+        return self._server.server_address[:2]
+
+    @classmethod
+    def _check_type(cls, act_type):
+        if act_type not in _acts_ids:
+            raise ValueError(f"unknown act type {act_type}")
+
+    def health(self):
+        """State of the service.
+
+        Returns:
+            A dict with the backend, the default act types, and the
+            number of documents and batches extracted.
+
+        """
+        return {'status': 'ok', 'backend': self.backend, 'types': self.types,
+                'requests': self._batcher.requests, 'batches': self._batcher.batches}
+
+    def _read(self, body, content_type, name):
+        """Read a posted document.
+
+        Returns:
+            A tuple with the document, as a DODFText or a file path, and
+            the temporary folder to remove after its extraction, if any.
+
+        """
+        if content_type not in CONTENT_TYPES:
+            raise ValueError(f"unsupported content type {content_type}, "
+                             f"use one of {', '.join(CONTENT_TYPES)}")
+        if content_type == 'text/plain':
+            return DODFText(body.decode('utf-8'), name), None
+        # Saved with its own name, which the acts take the DODF source from
+        extension = '.pdf' if content_type == 'application/pdf' else '.json'
+        folder = tempfile.mkdtemp(dir=self._tmp)
+        file_name = os.path.basename(name) or 'document'
+        if not file_name.endswith(extension):
+            file_name += extension
+        path = os.path.join(folder, file_name)
+        with open(path, 'wb') as file:
+            file.write(body)
+        if extension == '.json':
+            return path, folder
+        try:
+            return DODFText(str(ContentExtractor.extract_plain_text(path)), name), None
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+
+    def extract(self, body, content_type='text/plain', types=None, name='document'):
+        """Extract the acts of a document.
+
+        Args:
+            body (bytes): The document.
+            content_type (str): One of the CONTENT_TYPES.
+            types ([str]): Types of the act, the service ones when empty.
+            name (str): Name of the document file.
+
+        Returns:
+            A dict with the document name and the records of the acts
+            of each type.
+
+        Raises:
+            ValueError: An unknown act type or content type.
+
+        """
+        types = types or self.types
+        for act_type in types:
+            self._check_type(act_type)
+        document, temporary = self._read(body, content_type, name)
+        try:
+            data_frames = self._batcher.submit(document, types).result()
+        finally:
+            if temporary is not None:
+                shutil.rmtree(temporary, ignore_errors=True)
+        return {'name': name,
+                'acts': {act_type: records(data_frame)
+                         for act_type, data_frame in data_frames.items()}}
+
+    def serve_forever(self):
+        """Serve the requests until interrupted."""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def start(self):
+        """Serve the requests in a background thread.
+
+        Returns:
+            The service.
+
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        """Stop serving and remove the temporary files."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        self._batcher.close()
+        self.engine.close()
+        if self.unix_socket is not None and os.path.exists(self.unix_socket):
+            os.remove(self.unix_socket)
+        shutil.rmtree(self._tmp, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix socket."""
+
+    def __init__(self, path, timeout=None):
+        super().__init__('localhost', timeout=timeout)
+        self._path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+class ServiceClient:
+    """Client of a local extraction service.
+
+    Args:
+        address: The (host, port) of the service, or the path of its
+            Unix socket.
+        timeout (float): Seconds to wait for an answer.
+
+    """
+
+    def __init__(self, address, timeout=300):
+        self.address = address
+        self.timeout = timeout
+
+    def _connection(self):
+        if isinstance(self.address, str):
+            return _UnixHTTPConnection(self.address, timeout=self.timeout)
+        host, port = self.address
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _request(self, method, path, body=None, headers=None):
+        connection = self._connection()
+        try:
+            connection.request(method, path, body=body, headers=headers or {})
+            response = connection.getresponse()
+            result = json.loads(response.read().decode('utf-8'))
+        finally:
+            connection.close()
+        if response.status != 200:
+            raise RuntimeError(f"{response.status}: {result.get('error')}")
+        return result
+
+    def health(self):
+        """State of the service, see :meth:`ExtractionService.health`."""
+        return self._request('GET', '/health')
+
+    def extract(self, body, content_type='text/plain', types=None, name='document'):
+        """Extract the acts of a document, see :meth:`ExtractionService.extract`.
+
+        Raises:
+            RuntimeError: The service did not extract the document.
+
+        """
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        query = {'name': name}
+        if types:
+            query['types'] = ','.join(types)
+        return self._request('POST', '/extract?' + urlencode(query), body=body,
+                             headers={'Content-Type': content_type})
@@ -0,0 +1,269 @@
+"""Download and extract DODFs in a single, overlapped, pipeline.
+
+Running ``dodfminer downloader`` and then ``dodfminer extract`` waits for
+every PDF to be downloaded before the first one is extracted. The sync
+pipeline overlaps both stages: the :class:`~dodfminer.downloader.core.Downloader`
+produces each PDF into a bounded queue as soon as it is on disc, and a
+pool of extraction workers consumes the queue concurrently.
+
+When the extraction is slower than the download, the queue fills up and
+the download threads wait for room in it, so no more than
+``queue_size`` PDFs are ever waiting to be extracted.
+
+Usage example::
+
+    pipeline = SyncPipeline(Downloader('./'), types=['nomeacao'])
+    data_frames = pipeline.run('05/2021', '06/2021')
+    print(pipeline.stats())
+
+"""
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from dodfminer.extract.polished.core import _acts_ids
+from dodfminer.extract.polished.helper import extract_single
+from dodfminer.extract.polished.workers import warm
+from dodfminer.extract.pure.core import ContentExtractor
+
+_DONE = None
+
+
+class StageCounter:
+    """Throughput counter of a pipeline stage.
+
+    Attributes:
+        items: Number of items processed.
+        size: Number of bytes processed.
+        errors: Number of items that failed.
+        busy: Seconds spent processing, summed over the workers.
+        waiting: Seconds spent waiting for the next stage, summed over
+            the workers.
+
+    """
+
+    def __init__(self):
+        self.items = 0
+        self.size = 0
+        self.errors = 0
+        self.busy = 0.0
+        self.waiting = 0.0
+        self._start = None
+        self._end = None
+        self._lock = threading.Lock()
+
+    def add(self, size=0, busy=0.0, waiting=0.0, error=False):
+        """Account a processed item.
+
+        Args:
+            size (int): Bytes of the item.
+            busy (float): Seconds spent processing the item.
+            waiting (float): Seconds spent waiting to hand the item over.
+            error (bool): Whether the item failed.
+
+        """
+        now = time.perf_counter()
+        with self._lock:
+            if self._start is None:
+                self._start = now - busy
+            self._end = now
+            self.items += 1
+            self.size += size
+            self.busy += busy
+            self.waiting += waiting
+            self.errors += int(error)
+
+    def summary(self):
+        """Throughput of the stage.
+
+        Returns:
+            A dict with the counters, the elapsed seconds between the first
+            and the last item, and the items and bytes per second.
+
+        """
+        with self._lock:
+            elapsed = (self._end - self._start) if self.items else 0.0
+            return {'items': self.items, 'bytes': self.size,
+                    'errors': self.errors, 'elapsed': elapsed,
+                    'busy': self.busy, 'waiting': self.waiting,
+                    'items_per_second': self.items / elapsed if elapsed else 0.0,
+                    'bytes_per_second': self.size / elapsed if elapsed else 0.0}
+
+
+def extract_pdf_acts(path, types, backend):
+    """Extract acts of several types from a single PDF.
+
+    The PDF text is extracted once, in memory, and shared by every act
+    type.
+
+    Args:
+        path (str): The PDF path.
+        types ([str]): Types of the act.
+        backend (str): what backend will be used to extract Acts {regex, ner}
+
+    Returns:
+        A dict with the dataframe of each act type.
+
+    """
+    text = ContentExtractor.extract_plain_text(path)
+    return {act_type: extract_single(text, act_type, backend)[0]
+            for act_type in types}
+
+
+class SyncPipeline:
+    """Producer/consumer pipeline from the DODFs website to act CSVs.
+
+    Args:
+        downloader (:obj:`Downloader`): Downloader producing the PDFs.
+        types ([str]): Types of the act, all of them when empty.
+        backend (str): what backend will be used to extract Acts {regex, ner}
+        workers (int): Number of PDFs extracted at the same time.
+        queue_size (int): Maximum number of PDFs waiting for extraction.
+        processes (bool): Extract in worker processes instead of threads,
+            using more than one CPU. With the fork start method the act
+            classes and models are loaded once, in this process, and
+            shared by the workers forked from it. Otherwise each worker
+            loads them when it starts.
+
+    Attributes:
+        download: :obj:`StageCounter` of the PDFs handed to extraction.
+        extract: :obj:`StageCounter` of the PDFs extracted.
+        max_queued: Largest number of PDFs waiting in the queue.
+
+    """
+
+    def __init__(self, downloader, types=None, backend='regex', workers=2,
+                 queue_size=8, processes=False):
+        self._downloader = downloader
+        self._types = list(types or _acts_ids.keys())
+        self._backend = backend
+        self._workers = max(1, workers)
+        self._queue = queue.Queue(maxsize=max(1, queue_size))
+        self._processes = processes
+        self._executor = None
+        self._results = {}
+        self._results_lock = threading.Lock()
+        self.download = StageCounter()
+        self.extract = StageCounter()
+        self.max_queued = 0
+
+    def _produce(self, pdf_path):
+        """Put a PDF in the queue, waiting while it is full."""
+        start = time.perf_counter()
+        self._queue.put(pdf_path)
+        waiting = time.perf_counter() - start
+        self.max_queued = max(self.max_queued, self._queue.qsize())
+        self.download.add(os.path.getsize(pdf_path), waiting=waiting)
+
+    def _extract(self, pdf_path):
+        if self._executor is None:
+            return extract_pdf_acts(pdf_path, self._types, self._backend)
+        future = self._executor.submit(extract_pdf_acts, pdf_path,
+                                       self._types, self._backend)
+        return future.result()
+
+    def _consume(self):
+        """Extract PDFs from the queue until the end marker is found."""
+        while True:
+            start = time.perf_counter()
+            pdf_path = self._queue.get()
+            waiting = time.perf_counter() - start
+            if pdf_path is _DONE:
+                return
+
+            start = time.perf_counter()
+            try:
+                result = self._extract(pdf_path)
+            except Exception as error:  # pylint: disable=broad-except
+                self._log(f"Failed to extract {pdf_path}: {error}")
+                self.extract.add(busy=time.perf_counter() - start,
+                                 waiting=waiting, error=True)
+                continue
+
+            with self._results_lock:
+                self._results[pdf_path] = result
+            self.extract.add(os.path.getsize(pdf_path),
+                             busy=time.perf_counter() - start, waiting=waiting)
+
+    def _data_frames(self):
+        """Join the results of each PDF, in the order of their paths."""
+        data_frames = {}
+        for act_type in self._types:
+            frames = [self._results[path][act_type]
+                      for path in sorted(self._results)
+                      if not self._results[path][act_type].empty]
+            data_frames[act_type] = (pd.concat(frames, ignore_index=True)
+                                     if frames else pd.DataFrame())
+        return data_frames
+
+    def run(self, start_date, end_date, out_path=None):
+        """Download and extract the DODFs of a period.
+
+        Every PDF of the period is extracted, including the ones already
+        downloaded by previous runs.
+
+        Args:
+            start_date (str): The start date in format mm/yyyy.
+            end_date (str): The end date in format mm/yyyy.
+            out_path (str): Folder where a CSV for each act type is saved.
+                Nothing is saved when None.
+
+        Returns:
+            A dict with the dataframe of each act type.
+
+        """
+        self._results = {}
+        if self._processes:
+            context = multiprocessing.get_context()
+            if context.get_start_method() == 'fork':
+                warm(self._types)
+                self._executor = ProcessPoolExecutor(max_workers=self._workers,
+                                                     mp_context=context)
+            else:
+                self._executor = ProcessPoolExecutor(max_workers=self._workers,
+                                                     mp_context=context,
+                                                     initializer=warm,
+                                                     initargs=(self._types,))
+        consumers = [threading.Thread(target=self._consume, daemon=True)
+                     for _ in range(self._workers)]
+        for consumer in consumers:
+            consumer.start()
+
+        try:
+            self._downloader.pull(start_date, end_date, on_pdf=self._produce)
+        finally:
+            for _ in consumers:
+                self._queue.put(_DONE)
+            for consumer in consumers:
+                consumer.join()
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+        data_frames = self._data_frames()
+        if out_path is not None:
+            for act_type, data_frame in data_frames.items():
+                data_frame.to_csv(os.path.join(out_path, act_type + '.csv'))
+        return data_frames
+
+    def stats(self):
+        """Throughput counters of each stage.
+
+        Returns:
+            A dict with the summary of the download and extract stages,
+            and the largest queue length.
+
+        """
+        return {'download': self.download.summary(),
+                'extract': self.extract.summary(),
+                'max_queued': self.max_queued}
+
+    @classmethod
+    def _log(cls, msg):
+        print(f"[SYNC] {msg}")
@@ -37,6 +37,8 @@ setuptools.setup(
     python_requires='>=3.6',
     package_data={'dodfminer': [
         'extract/polished/acts/models/*.pkl', 
-        'extract/polished/acts/seg_models/*.pkl']},
+        'extract/polished/acts/seg_models/*.pkl',
+        'extract/polished/acts/models/*.crfsuite',
+        'extract/polished/acts/seg_models/*.crfsuite']},
     include_package_data = True,
 )
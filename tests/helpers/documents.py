@@ -0,0 +1,18 @@
+"""Documents extracted by the extraction engine and service tests."""
+
+import os
+from pathlib import Path
+
+from dodfminer.extract.polished.helper import extract_single
+
+TESTS = Path(os.path.dirname(os.path.dirname(__file__)))
+TEXT = TESTS/'support'/'valid.txt'
+JSON = TESTS/'JSON'/'dodf.json'
+PDF = TESTS/'support'/'polished'/'DODF 001 01-01-2019 EDICAO ESPECIAL.pdf'
+TYPES = ['nomeacao', 'exoneracao']
+
+
+def expected_acts(document, types=TYPES):
+    """Dataframes of each act type of a document, extracted one type at a time."""
+    return {act_type: extract_single(document, act_type, 'regex')[0]
+            for act_type in types}
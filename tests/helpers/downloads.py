@@ -0,0 +1,21 @@
+"""PDF bodies and a fake clock shared by the downloader tests."""
+
+
+def pdf_bytes(name):
+    """Body of a small PDF whose content depends on `name`."""
+    return b'%PDF-1.4\n' + name.encode() * 100 + b'\n%%EOF\n'
+
+
+class FakeClock:
+    """Clock advanced only by its own `sleep`, which records each delay."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
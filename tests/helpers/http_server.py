@@ -0,0 +1,129 @@
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class LocalServer:
+    """Local HTTP server serving in-memory files, for downloader tests.
+
+    Counts the requests received and the largest number of requests
+    being served at the same time. Every file is sent with an ETag, and
+    Range requests are answered with partial content, unless their
+    If-Range is not the ETag of the file. `truncate` maps a path to the
+    number of bytes sent before the connection is dropped, once.
+
+    `faults` maps a path to the faults injected in its next requests, one
+    per request: an HTTP status code, a tuple (status, retry_after), or
+    'drop' to close the connection without answering.
+    """
+
+    def __init__(self, files, delay=0.0, truncate=None, faults=None):
+        self.files = files
+        self.delay = delay
+        self.truncate = dict(truncate or {})
+        self.faults = {path: list(items) for path, items in (faults or {}).items()}
+        self.requests = []
+        self.headers = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f'http://{host}:{port}'
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _send(self, status, body=b'', headers=None):
+                self.send_response(status)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _fault(self):
+                with server._lock:
+                    faults = server.faults.get(self.path)
+                    fault = faults.pop(0) if faults else None
+                if fault is None:
+                    return False
+                if fault == 'drop':
+                    self.close_connection = True
+                    return True
+                status, retry_after = fault if isinstance(fault, tuple) else (fault, None)
+                headers = {'Retry-After': str(retry_after)} if retry_after else {}
+                self._send(status, headers=headers)
+                return True
+
+            def _serve(self):
+                if self._fault():
+                    return
+                body = server.files.get(self.path)
+                if body is None:
+                    self._send(404)
+                    return
+
+                etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+                start = 0
+                range_header = self.headers.get('Range')
+                if self.headers.get('If-Range', etag) != etag:
+                    range_header = None
+                if range_header:
+                    start = int(range_header[len('bytes='):].split('-')[0])
+                    if start >= len(body):
+                        self._send(416, headers={
+                            'Content-Range': f'bytes */{len(body)}'})
+                        return
+
+                status = 206 if range_header else 200
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/pdf')
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(len(body) - start))
+                if range_header:
+                    self.send_header('Content-Range',
+                                     f'bytes {start}-{len(body) - 1}/{len(body)}')
+                self.end_headers()
+
+                with server._lock:
+                    cut = server.truncate.pop(self.path, None)
+                if cut is not None:
+                    self.wfile.write(body[start:start + cut])
+                    self.close_connection = True
+                    return
+                self.wfile.write(body[start:])
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                with server._lock:
+                    server.requests.append(self.path)
+                    server.headers.append(dict(self.headers))
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                try:
+                    threading.Event().wait(server.delay)
+                    self._serve()
+                finally:
+                    with server._lock:
+                        server.active -= 1
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_):
+        self._server.shutdown()
+        self._server.server_close()
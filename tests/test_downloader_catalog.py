@@ -0,0 +1,96 @@
+import hashlib
+from dodfminer.downloader.catalog import Catalog, CATALOG_FILE
+from dodfminer.downloader.catalog import catalog_pdfs, parse_edition
+from dodfminer.downloader.core import Downloader
+from dodfminer.extract.polished.helper import get_files_path
+from dodfminer.extract.pure.core import ContentExtractor
+from tests.helpers.downloads import pdf_bytes
+from tests.helpers.http_server import LocalServer
+
+
+def test_parse_edition():
+    assert parse_edition('DODF 022 31-01-2017') == ('2017-01-31', 22, 'NORMAL')
+    assert parse_edition('DODF 003 30-01-2017 EDICAO EXTRA') == \
+        ('2017-01-30', 3, 'EDICAO EXTRA')
+    assert parse_edition('relatorio') == (None, None, None)
+
+
+def test_catalog_queries(tmp_path):
+    first = tmp_path/'2021'/'DODF 001 03-05-2021.pdf'
+    second = tmp_path/'2021'/'DODF 002 04-06-2021 EDICAO EXTRA.pdf'
+    first.parent.mkdir()
+    first.write_bytes(pdf_bytes('first'))
+    second.write_bytes(pdf_bytes('second'))
+
+    with Catalog(str(tmp_path/CATALOG_FILE)) as catalog:
+        catalog.add(str(first), 'http://host/1')
+        catalog.add(str(second), 'http://host/2')
+
+        entry = catalog.get(str(second))
+        assert entry['date'] == '2021-06-04'
+        assert entry['number'] == 2
+        assert entry['edition'] == 'EDICAO EXTRA'
+        assert entry['size'] == len(pdf_bytes('second'))
+        assert entry['sha256'] == hashlib.sha256(pdf_bytes('second')).hexdigest()
+
+        assert catalog.paths(start='2021-06-01') == [str(second)]
+        assert catalog.find_hash(entry['sha256']) == [str(second)]
+        assert catalog.has(str(first))
+
+        first.write_bytes(b'changed')
+        assert not catalog.has(str(first))
+        assert catalog.paths() == [str(first), str(second)]
+
+    assert catalog_pdfs(str(tmp_path)) == [str(first), str(second)]
+    assert get_files_path(str(tmp_path), 'pdf') == [str(first), str(second)]
+    assert ContentExtractor._get_pdfs_list(str(tmp_path)) == [str(first), str(second)]
+    assert catalog_pdfs(str(tmp_path/'2021')) is None
+
+
+def test_new_catalog_backfills_pdfs(tmp_path):
+    earlier = tmp_path/'2021'/'DODF 001 03-05-2021.pdf'
+    earlier.parent.mkdir()
+    earlier.write_bytes(pdf_bytes('earlier'))
+    with Catalog(str(tmp_path/CATALOG_FILE)) as catalog:
+        assert catalog.get(str(earlier))['date'] == '2021-05-03'
+        assert catalog.get(str(earlier))['url'] is None
+
+    assert catalog_pdfs(str(tmp_path)) == [str(earlier)]
+
+
+def test_catalog_rescan_records_uncataloged_pdfs(tmp_path):
+    Catalog(str(tmp_path/CATALOG_FILE)).close()
+    cataloged = tmp_path/'a'/'x.pdf'
+    uncataloged = tmp_path/'b'/'y.pdf'
+    for path in (cataloged, uncataloged):
+        path.parent.mkdir()
+        path.write_bytes(pdf_bytes(path.name))
+    with Catalog(str(tmp_path/CATALOG_FILE)) as catalog:
+        catalog.add(str(cataloged))
+
+    assert catalog_pdfs(str(tmp_path)) == [str(cataloged)]
+    expected = [str(cataloged), str(uncataloged)]
+    assert catalog_pdfs(str(tmp_path), rescan=True) == expected
+    assert get_files_path(str(tmp_path), 'pdf') == expected
+    assert ContentExtractor._get_pdfs_list(str(tmp_path)) == expected
+    with Catalog(str(tmp_path/CATALOG_FILE)) as catalog:
+        assert catalog.rescan() == []
+
+
+def test_downloader_records_catalog(tmp_path):
+    files = {'/dodf.pdf': pdf_bytes('dodf')}
+    with LocalServer(files) as server:
+        links = {'DODF 001 01-01-2021': [f'{server.url}/dodf.pdf']}
+        downloader = Downloader(save_path=str(tmp_path))
+        month_path = tmp_path/'dodfs'/'2021'/'01_Janeiro'
+        month_path.mkdir(parents=True)
+        downloader._get_dodfs(links, str(month_path))
+        downloader._get_dodfs(links, str(month_path))
+
+    assert len(server.requests) == 1
+    pdf = str(month_path/'DODF 001 01-01-2021.pdf')
+    with Catalog(str(tmp_path/'dodfs'/CATALOG_FILE)) as catalog:
+        entry = catalog.get(pdf)
+    assert entry['url'] == f'{server.url}/dodf.pdf'
+    assert entry['date'] == '2021-01-01'
+    assert entry['path'] == pdf
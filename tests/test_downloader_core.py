@@ -1,8 +1,14 @@
+import gzip
+import os
 import shutil
 import pytest
 import requests
 from dodfminer.downloader.core import Downloader
 from dodfminer.downloader.helper import LISTAR_URL
+from tests.helpers.downloads import pdf_bytes
+from tests.helpers.http_server import LocalServer
+
+JSON_PATH = os.path.dirname(__file__) + "/JSON/dodf.json"
 
 
 def test_download_date_fail():
@@ -118,3 +124,139 @@ def test_downloader_2(requests_mock):
         'https://dodf.df.gov.br/index/visualizar-arquivo/?pasta=2021%7C05_Maio%7CDODF%20022%2031-01-2017%7C&arquivo=UNIT', json={})
     downloader = Downloader()
     downloader.pull(start_date="05-2021", end_date="05-2021")
+
+
+def test_downloader_concurrent_local_server(tmp_path):
+    files = {f'/dodf{idx}.pdf': pdf_bytes(str(idx)) for idx in range(6)}
+    with LocalServer(files, delay=0.1) as server:
+        links = {
+            'DODF 001 01-01-2021': [f'{server.url}/dodf0.pdf'],
+            'DODF 002 01-01-2021 EDICAO EXTRA': [
+                f'{server.url}/dodf{idx}.pdf' for idx in range(1, 6)],
+        }
+        downloader = Downloader(save_path=str(tmp_path), max_workers=4,
+                                max_per_host=2)
+        month_path = tmp_path/'dodfs'/'2021'/'01_Janeiro'
+        month_path.mkdir(parents=True)
+        downloader._get_dodfs(links, str(month_path))
+
+    assert len(server.requests) == 6
+    assert server.max_active == 2
+    assert (month_path/'DODF 001 01-01-2021.pdf').read_bytes() == files['/dodf0.pdf']
+    extra_path = month_path/'DODF 002 01-01-2021 EDICAO EXTRA'
+    for idx in range(1, 6):
+        pdf = extra_path/f'DODF 002 01-01-2021 EDICAO EXTRA {idx}.pdf'
+        assert pdf.read_bytes() == files[f'/dodf{idx}.pdf']
+
+
+def test_download_pdf_resumes_partial_file(tmp_path):
+    body = pdf_bytes('resumable') * 200
+    with LocalServer({'/dodf.pdf': body}, truncate={'/dodf.pdf': 150000}) as server:
+        downloader = Downloader(save_path=str(tmp_path))
+        path = str(tmp_path/'dodf')
+
+        downloader._download_pdf(f'{server.url}/dodf.pdf', path)
+        assert not (tmp_path/'dodf.pdf').exists()
+        partial_size = (tmp_path/'dodf.pdf.part').stat().st_size
+        assert 0 < partial_size < len(body)
+
+        downloader._download_pdf(f'{server.url}/dodf.pdf', path)
+
+    assert server.headers[1]['Range'] == f'bytes={partial_size}-'
+    assert (tmp_path/'dodf.pdf').read_bytes() == body
+    assert not (tmp_path/'dodf.pdf.part').exists()
+
+
+def test_download_pdf_restarts_when_pdf_changed(tmp_path):
+    old_body = pdf_bytes('old') * 600
+    new_body = pdf_bytes('new') * 700
+    files = {'/dodf.pdf': old_body}
+    with LocalServer(files, truncate={'/dodf.pdf': 150000}) as server:
+        downloader = Downloader(save_path=str(tmp_path))
+        path = str(tmp_path/'dodf')
+
+        downloader._download_pdf(f'{server.url}/dodf.pdf', path)
+        assert (tmp_path/'dodf.pdf.part').exists()
+        files['/dodf.pdf'] = new_body
+        downloader._download_pdf(f'{server.url}/dodf.pdf', path)
+
+    # The resume was answered with the whole new pdf
+    assert len(server.requests) == 2
+    assert 'Range' in server.headers[1] and 'If-Range' in server.headers[1]
+    assert (tmp_path/'dodf.pdf').read_bytes() == new_body
+    assert list(tmp_path.glob('dodf.pdf.*')) == []
+
+
+def test_download_pdf_restarts_on_wrong_range(tmp_path, requests_mock):
+    body = pdf_bytes('ranged') * 10
+    (tmp_path/'dodf.pdf.part').write_bytes(body[:100])
+
+    def respond(request, context):
+        if 'Range' in request.headers:
+            # Ignores the offset asked, sending the file from its start
+            context.status_code = 206
+            context.headers['Content-Range'] = f'bytes 0-{len(body) - 1}/{len(body)}'
+        return body
+
+    requests_mock.get('http://host/dodf.pdf', content=respond)
+    downloader = Downloader(save_path=str(tmp_path))
+    downloader._download_pdf('http://host/dodf.pdf', str(tmp_path/'dodf'))
+
+    assert requests_mock.call_count == 2
+    assert (tmp_path/'dodf.pdf').read_bytes() == body
+
+
+def test_download_pdf_rejects_invalid_pdf(tmp_path):
+    with LocalServer({'/dodf.pdf': b'<html>not found</html>'}) as server:
+        downloader = Downloader(save_path=str(tmp_path))
+        downloader._download_pdf(f'{server.url}/dodf.pdf', str(tmp_path/'dodf'))
+
+    assert list(tmp_path.glob('dodf.pdf*')) == []
+
+
+def test_file_exist_ignores_truncated_pdf(tmp_path):
+    downloader = Downloader(save_path=str(tmp_path))
+    pdf = tmp_path/'dodf.pdf'
+
+    pdf.write_bytes(pdf_bytes('truncated')[:-10])
+    assert not downloader._file_exist(str(pdf))
+
+    pdf.write_bytes(pdf_bytes('complete'))
+    assert downloader._file_exist(str(pdf))
+
+
+def test_pull_json_conditional_request(tmp_path, requests_mock):
+    url = 'https://www.dodf.df.gov.br/index/jornal-json'
+    with open(JSON_PATH, 'rb') as file:
+        body = file.read()
+
+    def respond(request, context):
+        if request.headers.get('If-None-Match') == '"v1"':
+            context.status_code = 304
+            return b''
+        context.headers['ETag'] = '"v1"'
+        return body
+
+    requests_mock.get(url, content=respond)
+    downloader = Downloader(save_path=str(tmp_path))
+    json_path = downloader.pull_json(url)
+
+    assert json_path == str(tmp_path/'dodfs'/'DODF 004 06-01-2022 INTEGRA.json')
+    assert (tmp_path/'dodfs'/'DODF 004 06-01-2022 INTEGRA.json').read_bytes() == body
+
+    assert downloader.pull_json(url) == json_path
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.headers['If-None-Match'] == '"v1"'
+
+
+def test_pull_json_gzip_on_disc(tmp_path, requests_mock):
+    url = 'https://www.dodf.df.gov.br/index/jornal-json'
+    with open(JSON_PATH, 'rb') as file:
+        body = file.read()
+    requests_mock.get(url, content=body)
+
+    json_path = Downloader(save_path=str(tmp_path)).pull_json(url, compress='gzip')
+
+    assert json_path.endswith('INTEGRA.json.gz')
+    with gzip.open(json_path, 'rb') as file:
+        assert file.read() == body
@@ -1,5 +1,6 @@
 import pytest
 from dodfminer.downloader.helper import req1, req2, req3, get_downloads, check_date, LISTAR_URL
+from dodfminer.downloader import helper
 
 
 def test_req1():
@@ -87,3 +88,14 @@ def test_check_date(requests_mock):
 def test_check_date_2():
     with pytest.raises(ValueError):
         assert check_date('2017', 'Janeiro')
+
+
+def test_get_session_grows_pool_in_place():
+    session = helper.get_session(2)
+    small = session.get_adapter('https://')
+    grown = helper.get_session(helper._session_pool_size + 4)
+
+    assert grown is session
+    assert grown.get_adapter('https://') is not small
+    assert grown.get_adapter('https://')._pool_maxsize == helper._session_pool_size
+    assert len(small.poolmanager.pools) == 0
@@ -0,0 +1,56 @@
+from dodfminer.downloader.helper import LISTAR_URL, get_downloads
+from dodfminer.downloader.listing import ListingCrawler
+
+
+def _mock_listings(requests_mock):
+    requests_mock.get(f'{LISTAR_URL}dir=2021/05_Maio', json={
+        "data": {
+            "20210531100": "DODF 100 31-05-2021",
+            "20210530103": "DODF 003 30-05-2021 EDICAO EXTRA",
+        }
+    })
+    requests_mock.get(f'{LISTAR_URL}dir=2021/05_Maio/DODF%20100%2031-05-2021', json={
+        "data": {"1": "2021/05_Maio/DODF 100 31-05-2021/DODF 100 31-05-2021 INTEGRA.pdf"}
+    })
+    requests_mock.get(f'{LISTAR_URL}dir=2021/05_Maio/DODF%20003%2030-05-2021%20EDICAO%20EXTRA', json={
+        "data": {"1": "2021/05_Maio/DODF 003/DODF 003 30-05-2021 1.pdf",
+                 "2": "2021/05_Maio/DODF 003/DODF 003 30-05-2021 2.pdf"}
+    })
+    requests_mock.get(f'{LISTAR_URL}dir=2021/06_Junho', json={"data": {}})
+
+
+def test_crawl_same_links_as_get_downloads(requests_mock):
+    _mock_listings(requests_mock)
+    crawler = ListingCrawler()
+
+    links = crawler.crawl([('2021', '05_Maio'), ('2021', '06_Junho')])
+
+    assert links['2021/06_Junho'] == {}
+    expected = get_downloads('2021', '05_Maio')
+    assert links['2021/05_Maio'] == {key: list(value) for key, value in expected.items()}
+    # month listing requested once, plus one request per edition
+    assert crawler.requests_made == 4
+
+
+def test_crawl_uses_cache(requests_mock, tmp_path):
+    _mock_listings(requests_mock)
+    cache_path = str(tmp_path/'listing.json')
+    links = ListingCrawler(cache_path).crawl([('2021', '05_Maio'), ('2021', '06_Junho')])
+
+    crawler = ListingCrawler(cache_path)
+    assert crawler.crawl([('2021', '05_Maio')]) == {'2021/05_Maio': links['2021/05_Maio']}
+    assert crawler.requests_made == 0
+
+    # months without DODFs are not cached
+    crawler.crawl([('2021', '06_Junho')])
+    assert crawler.requests_made == 1
+
+
+def test_crawl_revalidates_expired_entries(requests_mock, tmp_path):
+    _mock_listings(requests_mock)
+    cache_path = str(tmp_path/'listing.json')
+    ListingCrawler(cache_path).crawl([('2021', '05_Maio')])
+
+    crawler = ListingCrawler(cache_path, ttl=0, closed_ttl=0)
+    crawler.crawl([('2021', '05_Maio')])
+    assert crawler.requests_made == 3
@@ -0,0 +1,57 @@
+import json
+from dodfminer.downloader.core import Downloader, PULL_SUMMARY
+from dodfminer.downloader.metrics import DownloadMetrics
+from tests.helpers.downloads import FakeClock, pdf_bytes
+from tests.helpers.http_server import LocalServer
+
+
+def test_download_metrics_summary():
+    clock = FakeClock()
+    metrics = DownloadMetrics(clock=clock)
+    for latency in (0.05, 0.3, 0.3, 12.0):
+        metrics.add_bytes(1000)
+        metrics.file_done(latency)
+    metrics.skipped(500)
+    metrics.failed()
+    metrics.retried()
+    clock.now = 2.0
+
+    summary = metrics.summary()
+    assert summary['files'] == 4
+    assert summary['bytes'] == 4000
+    assert summary['skipped_files'] == 1
+    assert summary['skipped_bytes'] == 500
+    assert summary['failures'] == 1
+    assert summary['retries'] == 1
+    assert summary['files_per_second'] == 2.0
+    assert summary['bytes_per_second'] == 2000.0
+    assert summary['latency']['p50'] == 0.3
+    assert summary['latency']['max'] == 12.0
+    histogram = summary['latency']['histogram']
+    assert histogram['0.1'] == 1
+    assert histogram['0.5'] == 2
+    assert histogram['30.0'] == 1
+    assert sum(histogram.values()) == 4
+
+
+def test_pull_reports_progress_and_summary(tmp_path):
+    files = {f'/{idx}.pdf': pdf_bytes(str(idx)) for idx in range(3)}
+    with LocalServer(files) as server:
+        links = {f'DODF 00{idx} 0{idx + 1}-01-2021': [f'{server.url}/{idx}.pdf']
+                 for idx in range(3)}
+        downloader = Downloader(save_path=str(tmp_path))
+        downloader._crawler.crawl = lambda months: {
+            f'{year}/{month}': links for year, month in months}
+        month_path = tmp_path/'dodfs'/'2021'/'01_Janeiro'
+        month_path.mkdir(parents=True)
+        (month_path/'DODF 000 01-01-2021.pdf').write_bytes(files['/0.pdf'])
+
+        summary = downloader.pull('01/2021', '01/2021')
+
+    assert downloader._prog_bar.n == 3
+    assert summary['files'] == 2
+    assert summary['skipped_files'] == 1
+    assert summary['skipped_bytes'] == len(files['/0.pdf'])
+    assert summary['bytes'] == len(files['/1.pdf']) + len(files['/2.pdf'])
+    with open(tmp_path/'dodfs'/PULL_SUMMARY, encoding='utf-8') as file:
+        assert json.load(file)['files'] == 2
@@ -0,0 +1,116 @@
+import random
+import pytest
+import requests
+from dodfminer.downloader.core import Downloader
+from dodfminer.downloader.retry import AdaptiveLimiter, RetryPolicy, TokenBucket
+from tests.helpers.downloads import FakeClock, pdf_bytes
+from tests.helpers.http_server import LocalServer
+
+
+def _expected_backoff(seed, attempts, base_delay=0.5, max_delay=30.0):
+    rng = random.Random(seed)
+    return [rng.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+            for attempt in range(attempts)]
+
+
+def test_retry_policy_backoff_is_deterministic():
+    clock = FakeClock()
+    policy = RetryPolicy(attempts=4, rng=random.Random(7), sleep=clock.sleep)
+    failures = [requests.exceptions.ConnectionError()] * 3
+
+    def flaky():
+        if failures:
+            raise failures.pop()
+        return 'ok'
+
+    assert policy.call(flaky) == 'ok'
+    assert clock.sleeps == _expected_backoff(7, 3)
+    assert policy.retries == 3
+
+
+def test_retry_policy_gives_up():
+    clock = FakeClock()
+    policy = RetryPolicy(attempts=2, sleep=clock.sleep)
+
+    def broken():
+        raise requests.exceptions.Timeout()
+
+    with pytest.raises(requests.exceptions.Timeout):
+        policy.call(broken)
+    assert len(clock.sleeps) == 1
+
+    def invalid():
+        raise requests.exceptions.InvalidURL()
+
+    with pytest.raises(requests.exceptions.InvalidURL):
+        policy.call(invalid)
+    assert len(clock.sleeps) == 1
+
+
+def test_token_bucket_limits_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=1, clock=clock, sleep=clock.sleep)
+    for _ in range(5):
+        bucket.acquire()
+    assert clock.now == pytest.approx(2.0)
+
+
+def test_adaptive_limiter_aimd():
+    limiter = AdaptiveLimiter(8, latency_target=1.0)
+    limiter.feedback(False)
+    assert limiter.limit == 4
+    limiter.feedback(True, latency=2.0)
+    assert limiter.limit == 2
+    limiter.feedback(False)
+    limiter.feedback(False)
+    assert limiter.limit == 1
+
+    for _ in range(100):
+        limiter.feedback(True, latency=0.1)
+    assert limiter.limit == 8
+
+
+def test_downloader_retries_faults(tmp_path):
+    body = pdf_bytes('faulty') * 500
+    clock = FakeClock()
+    faults = {'/dodf.pdf': [503, 'drop', (429, 3)]}
+    with LocalServer({'/dodf.pdf': body}, faults=faults,
+                     truncate={'/dodf.pdf': 150000}) as server:
+        retry = RetryPolicy(rng=random.Random(3), sleep=clock.sleep)
+        downloader = Downloader(save_path=str(tmp_path), retry=retry)
+        downloader._download_job((f'{server.url}/dodf.pdf',
+                                  str(tmp_path/'dodf'), None))
+
+    assert (tmp_path/'dodf.pdf').read_bytes() == body
+    assert len(server.requests) == 5
+    assert 'Range' in server.headers[-1]
+    backoff = _expected_backoff(3, 4)
+    assert clock.sleeps == [backoff[0], backoff[1], max(backoff[2], 3), backoff[3]]
+    assert downloader._host_slot(f'{server.url}/dodf.pdf').limit < 4
+
+
+def test_downloader_does_not_retry_missing_file(tmp_path):
+    clock = FakeClock()
+    with LocalServer({}) as server:
+        downloader = Downloader(save_path=str(tmp_path),
+                                retry=RetryPolicy(sleep=clock.sleep))
+        downloader._download_job((f'{server.url}/dodf.pdf',
+                                  str(tmp_path/'dodf'), None))
+
+    assert len(server.requests) == 1
+    assert clock.sleeps == []
+    assert not (tmp_path/'dodf.pdf').exists()
+
+
+def test_downloader_slow_host_shrinks_limit(tmp_path):
+    files = {f'/{name}.pdf': pdf_bytes(name) for name in ('first', 'second')}
+    with LocalServer(files, delay=0.3) as server:
+        downloader = Downloader(save_path=str(tmp_path), max_per_host=4,
+                                latency_target=0.1)
+        for name in ('first', 'second'):
+            downloader._download_job((f'{server.url}/{name}.pdf',
+                                      str(tmp_path/name), None))
+
+    assert (tmp_path/'second.pdf').read_bytes() == files['/second.pdf']
+    assert downloader._host_slot(f'{server.url}/first.pdf').limit == 1
+    assert len(server.requests) == 2
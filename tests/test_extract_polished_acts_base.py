@@ -6,6 +6,8 @@ import pytest
 import numpy as np
 import pandas as pd
 from dodfminer.extract.polished.acts.base import Atos
+from dodfminer.extract.polished.acts.nomeacao import NomeacaoComissionados
+from dodfminer.extract.pure.utils import block_store
 
 rule_dict = {
     "numeros": r"([0-9]+)",
@@ -61,6 +63,20 @@ def test_act_base_read_json(*_):
     atos = Atos(""+os.path.dirname(__file__) + 'dodf.json')
     assert isinstance(atos._text, str)
 
+@patch.object(Atos, '_act_name', return_value="Aposentadoria")
+@patch.object(Atos, '_props_names', return_value=props)
+@patch.object(Atos, '_rule_for_inst', return_value=RULE_PROP)
+@patch.object(Atos, '_prop_rules', return_value=rule_dict)
+def test_act_base_read_blocks(_, __, ___, ____, tmp_path):
+    file = os.path.join(tmp_path, "DODF 001 02-01-2019.blocks")
+    block_store.write_blocks(file, [[(0.0, 0.0, 1.0, 1.0, "SECAO II")],
+                                    [(0.0, 0.0, 1.0, 1.0, "PODER EXECUTIVO")]])
+    atos = Atos(file, 'regex')
+    assert atos._text == "SECAO II PODER EXECUTIVO "
+    assert atos._file_name == file
+    assert atos._standard_props()['DODF_Fonte_Arquivo'] == "DODF 001 02-01-2019.pdf"
+
+
 @patch.object(Atos, '_act_name', return_value="Aposentadoria")
 @patch.object(Atos, '_props_names', return_value=props)
 @patch.object(Atos, '_rule_for_inst', return_value=RULE_PROP)
@@ -202,3 +218,16 @@ def test_act_base_props_error(act_base_regex):
     act_base_regex._raw_acts = act
     with pytest.raises(Exception):
         act_base_regex._extract_props()
+
+
+def test_act_base_extract_texts():
+    valid_2 = ""+os.path.dirname(__file__)+"/support/valid_2.txt"
+    segmented = NomeacaoComissionados(valid_2, 'regex')
+    routed = NomeacaoComissionados('', 'regex')
+
+    data_frame = routed.extract_texts(segmented.acts_str)
+
+    assert routed.acts_str == segmented.acts_str
+    columns = [col for col in data_frame.columns if col != 'DODF_Fonte_Arquivo']
+    assert len(data_frame) == 77
+    assert data_frame[columns].equals(segmented.data_frame[columns])
@@ -0,0 +1,76 @@
+import json
+import os
+from pandas.testing import assert_frame_equal
+from dodfminer.extract.polished.core import _acts_ids
+from dodfminer.extract.polished.acts import section3
+from dodfminer.extract.polished.acts.base_contratos import AtosContrato
+
+JSON_PATH = os.path.dirname(__file__) + "/JSON/dodf.json"
+SECTION_3 = ['contrato_convenio', 'aditamento', 'licitacao', 'suspensao',
+             'anulacao_revogacao', 'contrato', 'convenio']
+
+
+def _load():
+    with open(JSON_PATH, 'r') as file:
+        return json.load(file)
+
+
+def test_contract_classes_are_registered():
+    registered = section3.registered()
+    for act_type in SECTION_3:
+        assert _acts_ids[act_type] in registered
+        assert issubclass(_acts_ids[act_type], AtosContrato)
+
+
+def test_router_matches_each_class_alone():
+    data = _load()
+    classes = [_acts_ids[act_type] for act_type in SECTION_3]
+    routed = section3.Section3Router(classes).route(data)
+
+    counts = {}
+    for act_type, act_class in zip(SECTION_3, classes):
+        alone = section3.Section3Router([act_class]).route(data)[act_class]
+        assert_frame_equal(routed[act_class], alone)
+        counts[act_type] = len(alone)
+
+    assert counts == {'contrato_convenio': 15, 'aditamento': 11,
+                      'licitacao': 2, 'suspensao': 0,
+                      'anulacao_revogacao': 0, 'contrato': 14, 'convenio': 1}
+    texts = routed[_acts_ids['licitacao']]['texto']
+    assert all('<' not in text for text in texts)
+
+
+def test_router_without_section_3():
+    data = _load()
+    del data['json']['INFO']['Seção III']
+    routed = section3.Section3Router([_acts_ids['licitacao']]).route(data)
+    assert routed[_acts_ids['licitacao']] is None
+
+
+def test_route_file_parses_once(monkeypatch):
+    section3.clear_cache()
+    data = _load()
+    loads = []
+    original = json.load
+    monkeypatch.setattr(section3.json, 'load',
+                        lambda file: loads.append(file) or original(file))
+
+    for act_type in SECTION_3:
+        act_class = _acts_ids[act_type]
+        acts = section3.route_file(JSON_PATH)[act_class]
+        assert_frame_equal(acts, section3.Section3Router([act_class]).route(data)[act_class])
+
+    assert len(loads) == 1
+    section3.clear_cache()
+
+
+def test_route_file_returns_copies():
+    section3.clear_cache()
+    act_class = _acts_ids['contrato']
+    acts = section3.route_file(JSON_PATH)[act_class]
+    expected = acts.copy()
+    acts['texto'] = ''
+    acts.drop(acts.index[:2], inplace=True)
+
+    assert_frame_equal(section3.route_file(JSON_PATH)[act_class], expected)
+    section3.clear_cache()
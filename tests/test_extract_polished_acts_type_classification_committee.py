@@ -0,0 +1,34 @@
+import numpy as np
+from dodfminer.extract.polished.acts.type_classification.committee import majority_vote
+
+
+def _row_vote(results, labels):
+    new_types = []
+    for i, _ in enumerate(results):
+        results_dict = dict(zip(*np.unique(results[i], return_counts=True)))
+        res_max = max(results_dict, key=results_dict.get)
+        if results_dict[res_max] >= 0.5 and res_max != labels[i]:
+            new_types.append(res_max)
+        else:
+            new_types.append(labels[i])
+    return new_types
+
+
+def test_majority_vote():
+    results = np.array([['nomeacao', 'nomeacao', 'exoneracao'],
+                        ['abono', 'cessoes', 'reversoes'],
+                        ['cessoes', 'abono', 'abono']])
+    assert majority_vote(results, ['exoneracao', 'cessoes', 'abono']) == [
+        'nomeacao', 'abono', 'abono']
+
+
+def test_majority_vote_matches_row_vote():
+    rng = np.random.default_rng(5)
+    classes = np.array(['abono', 'aposentadoria', 'cessoes', 'nomeacao'])
+    results = classes[rng.integers(0, len(classes), size=(500, 3))]
+    labels = list(classes[rng.integers(0, len(classes), size=500)])
+    assert majority_vote(results, labels) == _row_vote(results, labels)
+
+
+def test_majority_vote_without_acts():
+    assert majority_vote(np.array([]), []) == []
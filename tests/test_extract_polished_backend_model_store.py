@@ -0,0 +1,88 @@
+# pylint: disable=protected-access
+
+import os
+import pickle
+import shutil
+import threading
+from unittest.mock import patch
+
+import joblib
+import pytest
+from dodfminer.extract.polished.backend import model_store
+from dodfminer.extract.polished.backend.ner import ActNER
+
+TEXT_PATH = os.path.dirname(__file__) + "/support/valid.txt"
+
+
+@pytest.fixture(name='models_path')
+def fixture_models_path(tmp_path):
+    for pickled in model_store.model_files():
+        folder = tmp_path/os.path.basename(os.path.dirname(pickled))
+        folder.mkdir(exist_ok=True)
+        shutil.copy(pickled, folder)
+    model_store.clear()
+    yield str(tmp_path)
+    model_store.clear()
+
+
+@pytest.fixture(name='sequences')
+@patch.object(ActNER, '_load_model', return_value=None)
+def fixture_sequences(_):
+    act = ActNER()
+    with open(TEXT_PATH, 'r') as file:
+        text = act._preprocess(file.read())
+    chunks = [text[start:start + 3000] for start in range(0, 30000, 3000)]
+    return [act._get_features(act._split_sentence(chunk)) for chunk in chunks]
+
+
+def test_native_predictions_are_identical(models_path, sequences):
+    written = model_store.convert(models_path)
+    files = model_store.model_files(models_path)
+    assert len(written) == len(files) == len(model_store.model_files())
+
+    for pickled in files:
+        crf = joblib.load(pickled)
+        model = model_store.load(pickled)
+        assert model.path == model_store.native_path(pickled)
+        assert model.classes_ == crf.classes_
+        assert model.predict(sequences) == crf.predict(sequences)
+
+
+def test_load_once_per_process(models_path):
+    pickled = model_store.model_files(models_path)[0]
+    model = model_store.load(pickled)
+    assert model_store.load(pickled) is model
+    # Not converted: the model is opened from the unpickled CRF
+    assert model.path != model_store.native_path(pickled)
+    assert pickle.loads(pickle.dumps(model)) is model
+
+    model_store.clear()
+    assert model_store.load(pickled) is not model
+    assert model_store.preload(models_path) == len(model_store.model_files(models_path))
+    # The model and the segmentation model with that name
+    assert model_store.preload(models_path, names=[os.path.basename(pickled)]) == 2
+
+
+def test_stale_native_file_is_ignored(models_path):
+    pickled = model_store.model_files(models_path)[0]
+    model_store.convert(models_path)
+    native = model_store.native_path(pickled)
+    mtime = os.path.getmtime(pickled)
+    os.utime(native, (mtime - 10, mtime - 10))
+
+    assert model_store.load(pickled).path != native
+
+
+def test_marginals_share_the_tagger_lock(models_path, sequences):
+    pickled = model_store.model_files(models_path)[0]
+    crf = joblib.load(pickled)
+    model = model_store.load(pickled)
+    assert model.predict_marginals(sequences[:2]) == crf.predict_marginals(sequences[:2])
+
+    with model._lock:
+        worker = threading.Thread(target=model.predict_marginals_single, args=(sequences[0],))
+        worker.start()
+        worker.join(0.2)
+        # Waits for the prediction holding the tagger
+        assert worker.is_alive()
+    worker.join()
@@ -43,6 +43,20 @@ def test_act_regex_regex_props(act_regex):
     assert act == {"tipo_ato": "Teste", "numeros": "1232",
                    "capitalizado": "Renato", "nao_encontra": np.nan}
 
+
+def test_act_regex_regex_props_spans(act_regex):
+    act_regex._name = "Teste"
+    text = "Preambulo. MENSAGEM: O Renato testa esse codigo 1232 vezes por dia."
+    start = text.index("MENSAGEM")
+    act_regex._regex_props(text[start:], start)
+    act_regex._regex_props(text[start:])
+
+    spans, unlocated = act_regex._prop_spans
+    assert {key: text[begin:end] for key, (begin, end) in spans.items()} == \
+        {"numeros": "1232", "capitalizado": "Renato"}
+    assert unlocated == {}
+
+
 def test_act_regex_find_prop_value(act_regex):
     res = act_regex._find_prop_value("(de)", "String de teste")
     assert res == ('de',)
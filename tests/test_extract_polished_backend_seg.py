@@ -82,6 +82,16 @@ def test_act_seg_regex_instances(act_seg_regex):
     assert act == [' O Renato testa esse codigo 1232 vezes por dia',
                    ' O Joao testa esse codigo 2 vezes por dia', ' O Lucas testa esse codigo 0 vezes por dia']
 
+def test_act_seg_regex_instances_spans(act_seg_regex):
+    act_seg_regex._text = "abc MENSAGEM: O Joao testa. xyz MENSAGEM: O Lucas testa. fim"
+    acts = act_seg_regex._seg_function()
+
+    assert len(act_seg_regex._inst_spans) == len(acts) == 2
+    for (start, body, end), act, act_str in zip(act_seg_regex._inst_spans, acts,
+                                                act_seg_regex._acts_str):
+        assert act_seg_regex._text[start:end] == act_str
+        assert act_seg_regex._text[body:end] == act
+
 def test_act_seg_crf_instances(act_seg_ner):
     act_seg_ner._text = ": CONCEDER, aposentadoria voluntaria integral, ao servidor ELIAS SANTOS MONTEIRO, matrícula nº 24.679-4, no cargo de " + \
         "Analista em Políticas Públicas e Gestão Governamental, Classe Especial, Padrão V, do Quadro de Pessoal do Distrito Federal, nos termos " + \
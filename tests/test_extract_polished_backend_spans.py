@@ -0,0 +1,130 @@
+import random
+import pandas as pd
+from sklearn.base import BaseEstimator
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import FunctionTransformer
+from dodfminer.extract.polished.backend.pipeline import feature_extractor
+from dodfminer.extract.polished.backend.spans import (token_spans, entity_spans,
+                                                      joined_entity_spans, add_highlights)
+from dodfminer.extract.polished.acts.licitacao import Licitacao
+
+
+def test_token_spans():
+    text = 'O  contrato "nº 12/2021", de  R$ 10,00.'
+    tokens = ['O', 'contrato', '``', 'nº', '12/2021', "''", ',', 'de', 'R', '$', '10,00', '.']
+    spans = token_spans(tokens, text)
+    assert [text[start:end] for start, end in spans] == [
+        'O', 'contrato', '"', 'nº', '12/2021', '"', ',', 'de', 'R', '$', '10,00', '.']
+
+
+def test_token_spans_missing_token():
+    text = 'Valor: dez reais'
+    assert token_spans(['Valor', 'DEZ', ':', 'reais'], text) == [
+        (0, 5), (5, 5), (5, 6), (11, 16)]
+
+
+class UpperTagger(BaseEstimator):
+    """Tag the runs of upper case words as entities."""
+
+    def fit(self, X, y=None):
+        return self
+
+    def predict(self, X):
+        tags = []
+        for sentence in X:
+            sent_tags = []
+            for features in sentence:
+                if not features['all_capital']:
+                    sent_tags.append('O')
+                elif sent_tags and sent_tags[-1] != 'O':
+                    sent_tags.append('I-orgao')
+                else:
+                    sent_tags.append('B-orgao')
+            tags.append(sent_tags)
+        return tags
+
+
+def test_contract_tokens_reused():
+    calls = []
+
+    def split(texts):
+        calls.append(list(texts))
+        return [text.split() for text in texts]
+
+    pipeline = Pipeline([('pre-processing', FunctionTransformer(split)),
+                         ('feat', feature_extractor()),
+                         ('crf', UpperTagger())])
+    acts = pd.DataFrame({'numero_dodf': ['1'], 'titulo': ['AVISO DE LICITAÇÃO'],
+                         'texto': ['AVISO DE LICITAÇÃO - A  SECRETARIA DE SAÚDE torna público ...']})
+    act = Licitacao('dodf.json', pipeline=pipeline, acts=acts)
+    act.highlight_dataframe()
+
+    # One call checks the pre-processing, the other tokenizes every act
+    assert len(calls) == 2
+    text = acts['texto'][0]
+    assert act.data_frame['text'][0] == text
+    first, second = act.data_frame['orgao'][0]
+    assert text[first['start']:first['end']] == 'AVISO DE LICITAÇÃO'
+    assert text[second['start']:second['end']] == 'A  SECRETARIA DE SAÚDE'
+    assert second['name'] == 'A SECRETARIA DE SAÚDE'
+
+
+def test_feature_extractor_accepts_tokens():
+    extractor = feature_extractor()
+    tokens = ['AVISO', 'de', 'licitação']
+    assert extractor.transform([tokens]) == [extractor.get_features(tokens)]
+
+
+def _quadratic_highlight(IOB, text_split):
+    """The highlight previously built by rejoining the tokens at each tag."""
+    ent_dict = {'text': ""}
+    aux_text_token = []
+    aux_text_string = ""
+    i = 0
+    while i < len(IOB):
+        if "B-" in IOB[i]:
+            entity_name = IOB[i].replace("B-", "")
+            aux_text_string = " ".join(aux_text_token).strip()
+            aux_text_token.append(text_split[i])
+            current_ent = {"name": [text_split[i]], "start": len(aux_text_string) + 1,
+                           "end": None, "type": entity_name}
+            i += 1
+            while (i < len(IOB)) and ("I-" in IOB[i]):
+                current_ent["name"].append(text_split[i])
+                aux_text_token.append(text_split[i])
+                i += 1
+            aux_text_string = " ".join(aux_text_token)
+            current_ent["end"] = len(aux_text_string)
+            current_ent["name"] = " ".join(current_ent["name"]).strip()
+            if entity_name in ent_dict:
+                ent_dict[entity_name] = [ent_dict[entity_name], current_ent]
+            else:
+                ent_dict[entity_name] = current_ent
+        elif IOB[i] == 'O':
+            aux_text_token.append(text_split[i])
+            aux_text_string = " ".join(aux_text_token).strip()
+        i += 1
+    ent_dict['text'] = aux_text_string
+    return ent_dict
+
+
+def test_joined_entity_spans_match_quadratic_highlight():
+    rng = random.Random(13)
+    tags = ['O', 'O', 'B-cargo', 'I-cargo', 'B-nome', 'I-nome', 'I-cargo']
+    words = ['Nomear', 'JOSÉ', 'da', 'Silva', ',', '12/2021', '', ' ', ' x ']
+    for _ in range(2000):
+        size = rng.randint(0, 12)
+        IOB = [rng.choice(tags) for _ in range(size)]
+        text_split = [rng.choice(words) for _ in range(size)]
+
+        ent_dict = {'text': ""}
+        entities, ent_dict['text'] = joined_entity_spans(IOB, text_split)
+        assert add_highlights(ent_dict, entities) == _quadratic_highlight(IOB, text_split)
+
+
+def test_entity_spans():
+    text = 'Nomear JOSÉ DA SILVA, para o cargo de Assessor.'
+    tokens = ['Nomear', 'JOSÉ', 'DA', 'SILVA', ',', 'para', 'o', 'cargo', 'de', 'Assessor', '.']
+    tags = ['O', 'B-nome', 'I-nome', 'I-nome', 'O', 'O', 'O', 'O', 'O', 'B-cargo', 'O']
+    assert entity_spans(tags, tokens, token_spans(tokens, text)) == [
+        ('nome', 7, 20, 'JOSÉ DA SILVA'), ('cargo', 38, 46, 'Assessor')]
@@ -1,4 +1,6 @@
 import os
+import subprocess
+import sys
 
 from dodfminer.extract.polished.core import ActsExtractor, _acts_ids
 
@@ -187,3 +189,16 @@ def test_polished_get_xml():
     xml = ActsExtractor.get_xml(""+os.path.dirname(__file__) +
                                 "/support/DODF 001 01-01-2019 EDICAO ESPECIAL.pdf", "regex", 0)
     assert isinstance(xml, XMLFy)
+
+
+def test_polished_core_acts_are_imported_lazily():
+    code = ("import sys\n"
+            "from dodfminer.extract.polished.core import _acts_ids\n"
+            "prefix = 'dodfminer.extract.polished.acts.'\n"
+            "assert not [name for name in sys.modules if name.startswith(prefix)]\n"
+            "assert _acts_ids['abono'].__name__ == 'AbonoPermanencia'\n"
+            "assert prefix + 'abono' in sys.modules\n"
+            "assert prefix + 'licitacao' not in sys.modules\n"
+            "assert _acts_ids['abono'] is _acts_ids['abono']\n"
+            "assert len(_acts_ids) == 21 and 'convenio' in _acts_ids\n")
+    subprocess.run([sys.executable, '-c', code], capture_output=True, check=True)
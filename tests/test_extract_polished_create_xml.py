@@ -0,0 +1,56 @@
+# pylint: disable=protected-access
+
+import os
+
+from dodfminer.extract.polished.acts.nomeacao import NomeacaoComissionados
+from dodfminer.extract.polished.core import _acts_ids
+from dodfminer.extract.polished.create_xml import XMLFy
+from dodfminer.extract.pure.core import DODFText
+
+PDF_PATH = os.path.dirname(__file__) + "/support/DODF 001 01-01-2019 EDICAO ESPECIAL.pdf"
+
+
+def test_xml_annotations_point_at_passages():
+    xml = XMLFy(PDF_PATH, _acts_ids, 1)
+
+    ids = []
+    for passage in xml.xml.iter('passage'):
+        offset = int(passage.find('offset').text)
+        text = passage.find('text').text
+        for annotation in passage.iter('annotation'):
+            location = annotation.find('location')
+            start = int(location.get('offset')) - offset
+            end = start + int(location.get('length'))
+            assert text[start:end] == annotation.find('text').text
+            ids.append(int(annotation.get('id')))
+    assert len(ids) == 88
+    assert ids == list(range(1, len(ids) + 1))
+
+
+def test_xml_extracts_each_act_type_once():
+    documents = []
+
+    class Counted(NomeacaoComissionados):
+        def __init__(self, file_name, backend='regex', pipeline=None):
+            documents.append(file_name)
+            super().__init__(file_name, backend, pipeline)
+
+    xml = XMLFy(PDF_PATH, {'nomeacao': Counted}, 1)
+
+    assert len(documents) == 1
+    assert isinstance(documents[0], DODFText)
+    assert len(list(xml.xml.iter('annotation'))) > 0
+
+
+def test_xml_locate_skips_proprieties_across_passages():
+    document = "NOMEAR JOAO DA SILVA, para exercer o Cargo em Comissao, Simbolo DFA-14, de Assessor.\n"
+    act = NomeacaoComissionados(DODFText(document, None), 'regex')
+    xml = XMLFy.__new__(XMLFy)
+
+    name = act._acts[0]['nome']
+    whole, = xml._locate(document, [0], {'nomeacao': act})
+    assert ('nome', name, document.index(name)) in whole
+
+    split = document.index('DA SILVA')
+    first, second = xml._locate(document, [0, split], {'nomeacao': act})
+    assert 'nome' not in [prop_type for prop_type, _, _ in first + second]
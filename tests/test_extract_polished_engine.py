@@ -0,0 +1,88 @@
+import shutil
+
+import pytest
+from pandas.testing import assert_frame_equal
+from dodfminer.extract.polished.backend import model_store
+from dodfminer.extract.polished.engine import ExtractionEngine
+from dodfminer.extract.polished.helper import extract_single
+from dodfminer.extract.pure.core import ContentExtractor, DODFText
+from tests.helpers.documents import JSON, PDF, TEXT, TYPES, expected_acts
+
+
+def _assert_extracted(data_frames, document, types=TYPES):
+    expected = expected_acts(document, types)
+    assert list(data_frames) == list(expected)
+    for act_type, data_frame in expected.items():
+        assert_frame_equal(data_frames[act_type], data_frame)
+
+
+def test_engine_extracts_documents():
+    engine = ExtractionEngine(types=TYPES)
+    text = DODFText(TEXT.read_text(), str(TEXT))
+
+    _assert_extracted(engine.extract(str(TEXT)), text)
+    _assert_extracted(engine.extract(text), text)
+    _assert_extracted(engine.extract(str(JSON)), str(JSON))
+    _assert_extracted(engine.extract(str(TEXT), types=['nomeacao']), text, ['nomeacao'])
+    engine.close()
+
+
+def test_engine_extract_batch_predicts_once(monkeypatch):
+    calls = []
+    predict = model_store.NativeCRF.predict
+
+    def counted(model, sequences):
+        calls.append(len(sequences))
+        return predict(model, sequences)
+
+    monkeypatch.setattr(model_store.NativeCRF, 'predict', counted)
+    documents = [DODFText(TEXT.read_text(), str(TEXT)), str(JSON), str(TEXT)]
+    engine = ExtractionEngine(types=['nomeacao'], backend='ner')
+    results = engine.extract_batch(documents)
+
+    # The acts of all the documents, in a single call of the model
+    assert len(calls) == 1
+    assert calls[0] == sum(len(result['nomeacao']) for result in results)
+    for document, result in zip(documents, results):
+        expected, _ = extract_single(engine.read(document), 'nomeacao', 'ner')
+        assert_frame_equal(result['nomeacao'], expected)
+
+
+def test_engine_rejects_unknown_types():
+    with pytest.raises(ValueError, match='unknown act type'):
+        ExtractionEngine(types=['nomeacao', 'unknown'])
+    engine = ExtractionEngine(types=['nomeacao'])
+    with pytest.raises(ValueError, match='unknown act type'):
+        engine.extract(str(TEXT), types=['unknown'])
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_engine_extract_many_streams_results(processes):
+    paths = [str(TEXT), str(JSON), str(TEXT)]
+    with ExtractionEngine(types=TYPES, processes=processes) as engine:
+        results = engine.extract_many(iter(paths))
+        assert not isinstance(results, list)
+        results = list(results)
+        # The pool is kept between calls
+        assert len(list(engine.extract_many(paths[:1]))) == 1
+
+    assert sorted(path for path, _ in results) == sorted(paths)
+    for path, data_frames in results:
+        expected = engine.extract(path)
+        for act_type in TYPES:
+            assert_frame_equal(data_frames[act_type], expected[act_type])
+
+
+def test_engine_caches_pdf_texts(tmp_path, monkeypatch):
+    pdf = tmp_path/PDF.name
+    shutil.copy(PDF, pdf)
+    engine = ExtractionEngine(types=['nomeacao'], cache_dir=str(tmp_path/'cache'))
+    first = engine.extract(str(pdf))
+
+    def _no_extraction(path):
+        raise AssertionError(f"{path} extracted again")
+    monkeypatch.setattr(ContentExtractor, 'extract_plain_text', _no_extraction)
+
+    assert len(list((tmp_path/'cache').iterdir())) == 1
+    assert_frame_equal(engine.extract(str(pdf))['nomeacao'], first['nomeacao'])
+    assert len(first['nomeacao']) > 0
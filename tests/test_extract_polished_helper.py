@@ -1,4 +1,5 @@
 import os
+import shutil
 import pytest
 
 import pandas as pd
@@ -7,8 +8,11 @@ from pandas.core.frame import DataFrame
 from tests.helpers.decorators import clean_extra_files
 
 from dodfminer.extract.pure.core import ContentExtractor
+from dodfminer.extract.polished import helper
+from dodfminer.extract.polished.workers import WorkerPool
 from dodfminer.extract.polished.helper import xml_multiple, get_files_path, build_act_txt, extract_single, extract_multiple, \
-    extract_multiple_acts, extract_multiple_acts_with_committee, committee_classification, extract_multiple_acts_parallel
+    extract_multiple_acts, extract_multiple_acts_with_committee, committee_classification, extract_multiple_acts_parallel, \
+    extract_multiple_acts_in_memory
 
 
 FOLDER_PATH = f"{os.path.dirname(__file__)}/support/polished"
@@ -89,6 +93,39 @@ def test_helper_extract_multiple_acts_parallel(folder_path, file_path):
     assert len(multiple_files_df) > len(single_file_df)
 
 
+@clean_extra_files(FOLDER_PATH)
+def test_helper_extract_multiple_acts_parallel_with_pool(folder_path, file_path):
+    extract_multiple_acts(folder_path, ["nomeacao"], "regex")
+    sequential_df = pd.read_csv(f"{folder_path}/nomeacao.csv")
+
+    with WorkerPool(processes=2, types=["nomeacao"]) as pool:
+        extract_multiple_acts_parallel(folder_path, ["nomeacao"], "regex", pool=pool)
+        multiple_files_df = pd.read_csv(f"{folder_path}/nomeacao.csv")
+        extract_multiple_acts_parallel(
+            file_path(extension="pdf"), ["nomeacao"], "regex", pool=pool)
+        assert pool.started
+    single_file_df = pd.read_csv(f"{folder_path}/nomeacao.csv")
+
+    assert not pool.started
+    pd.testing.assert_frame_equal(multiple_files_df, sequential_df)
+    assert 0 < len(single_file_df) < len(multiple_files_df)
+
+
+@clean_extra_files(FOLDER_PATH)
+def test_helper_extract_multiple_acts_in_memory(folder_path, file_path):
+    extract_multiple_acts(file_path(extension="pdf"), ["nomeacao"], "regex")
+    txt_df = pd.read_csv(f"{folder_path}/nomeacao.csv")
+    os.remove(file_path(extension="txt"))
+
+    extract_multiple_acts_in_memory(
+        file_path(extension="pdf"), ["nomeacao"], "regex")
+    in_memory_df = pd.read_csv(f"{folder_path}/nomeacao.csv")
+
+    assert not os.path.isfile(file_path(extension="txt"))
+    assert len(in_memory_df) > 0
+    pd.testing.assert_frame_equal(in_memory_df, txt_df)
+
+
 @clean_extra_files(FOLDER_PATH)
 def test_helper_extract_multiple_acts_with_committee(folder_path, file_path):
     extract_multiple_acts_with_committee(folder_path, ["nomeacao"], "regex")
@@ -116,6 +153,76 @@ def test_helper_committee_classification(folder_path, file_path):
     assert len(output_df) == len(dataframe)
 
 
+class RelabelCommittee:
+    """Committee moving the first two nomeacao acts to exoneracao."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def transform(self, var_x, var_y):
+        labels = list(var_y)
+        moved = [i for i, label in enumerate(labels) if label == 'nomeacao'][:2]
+        for i in moved:
+            labels[i] = 'exoneracao'
+        return labels
+
+
+def test_helper_committee_routes_acts_without_segmenting_again(tmp_path, monkeypatch):
+    dodf = str(tmp_path/'DODF 001 01-01-2019.txt')
+    shutil.copy(f"{os.path.dirname(__file__)}/support/valid_2.txt", dodf)
+    nomeacao, _ = extract_single(dodf, 'nomeacao', 'regex')
+    exoneracao, _ = extract_single(dodf, 'exoneracao', 'regex')
+
+    calls = []
+    original = helper.extract_single
+    monkeypatch.setattr(helper, 'Committee', RelabelCommittee)
+    monkeypatch.setattr(helper, 'extract_single',
+                        lambda *args, **kwargs: calls.append(args) or original(*args, **kwargs))
+    extract_multiple_acts_with_committee(dodf, ['nomeacao', 'exoneracao'], 'regex')
+
+    assert len(calls) == 2
+    nomeacao_df = pd.read_csv(tmp_path/'nomeacao.csv', index_col=0)
+    exoneracao_df = pd.read_csv(tmp_path/'exoneracao.csv', index_col=0)
+    assert len(nomeacao_df) == len(nomeacao) - 2
+    assert list(nomeacao_df['text']) == list(nomeacao['text'][2:])
+    assert len(exoneracao_df) == len(exoneracao) + 2
+    assert list(exoneracao_df['text'][-2:]) == list(nomeacao['text'][:2])
+    assert exoneracao_df['Tipo do Ato'].notna().all()
+
+
+class KeepCommittee:
+    """Committee keeping the type of every act."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def transform(self, var_x, var_y):
+        return list(var_y)
+
+
+def test_helper_committee_first_pass_in_worker_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(helper, 'Committee', KeepCommittee)
+    results = {}
+    for processes in (1, 2):
+        folder = tmp_path/str(processes)
+        folder.mkdir()
+        for name in ('valid.txt', 'valid_2.txt'):
+            shutil.copy(f"{os.path.dirname(__file__)}/support/{name}",
+                        folder/f"DODF {name[:-4]} 01-01-2019.txt")
+        with WorkerPool(processes=2) as pool:
+            extract_multiple_acts_with_committee(str(folder), ['nomeacao', 'exoneracao'],
+                                                 'regex', processes,
+                                                 pool if processes > 1 else None)
+            assert pool.started == (processes > 1)
+        results[processes] = [pd.read_csv(folder/f"{act_type}.csv", index_col=0)
+                              for act_type in ('nomeacao', 'exoneracao')]
+
+    assert len(results[2][0]) > 0
+    for serial, parallel in zip(results[1], results[2]):
+        pd.testing.assert_frame_equal(serial.drop(columns='DODF_Fonte_Arquivo', errors='ignore'),
+                                      parallel.drop(columns='DODF_Fonte_Arquivo', errors='ignore'))
+
+
 @clean_extra_files(FOLDER_PATH)
 def test_helper_build_act_txt():
     directory = ""+os.path.dirname(__file__)+"/support/"
@@ -0,0 +1,59 @@
+import nltk
+import pytest
+from dodfminer.extract.polished import resources
+
+
+@pytest.fixture(autouse=True)
+def restore_nltk_path(monkeypatch):
+    monkeypatch.setattr(nltk.data, 'path', list(nltk.data.path))
+    monkeypatch.delenv(resources.DATA_PATH_ENV, raising=False)
+    monkeypatch.setattr(nltk, 'download', _no_network)
+    resources.configure()
+    yield
+    resources.configure()
+
+
+def _no_network(*args, **kwargs):
+    raise AssertionError('nltk.download called')
+
+
+def test_require_resolves_once_from_data_path(tmp_path, monkeypatch, capsys):
+    (tmp_path/'stemmers'/'rslp').mkdir(parents=True)
+    monkeypatch.setenv(resources.DATA_PATH_ENV, str(tmp_path))
+    resources.configure()
+
+    finds = []
+    original = nltk.data.find
+    monkeypatch.setattr(nltk.data, 'find',
+                        lambda name, *args: finds.append(name) or original(name, *args))
+    for _ in range(3):
+        assert resources.require('rslp')
+
+    assert nltk.data.path[0] == str(tmp_path)
+    assert finds == ['stemmers/rslp']
+    assert capsys.readouterr().out == ''
+
+
+def test_require_missing_resource(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(nltk.data, 'path', [str(tmp_path)])
+    resources.configure()
+
+    assert not resources.require('stopwords')
+    assert not resources.require('stopwords')
+    assert capsys.readouterr().out.count("'stopwords' not found") == 1
+
+
+def test_prefetch(tmp_path, monkeypatch):
+    downloads = []
+
+    def download(name, download_dir, **kwargs):
+        downloads.append(name)
+        # The punkt tokenizers are in a PY3 folder
+        (tmp_path/'data'/resources.RESOURCES[name]/'PY3').mkdir(parents=True)
+
+    monkeypatch.setattr(nltk, 'download', download)
+    data_path = resources.prefetch(str(tmp_path/'data'))
+
+    assert downloads == ['punkt', 'rslp', 'stopwords']
+    assert data_path == str(tmp_path/'data')
+    assert resources.require('punkt', 'rslp', 'stopwords')
@@ -0,0 +1,73 @@
+import os
+
+import pytest
+from dodfminer.extract.polished import workers
+from dodfminer.extract.polished.backend import model_store
+
+
+@pytest.fixture(autouse=True)
+def clear_models():
+    model_store.clear()
+    yield
+    model_store.clear()
+
+
+def _loaded(_):
+    return os.getpid(), len(model_store._MODELS)
+
+
+def test_pool_is_started_once_and_reused():
+    with workers.WorkerPool(processes=2, start_method='fork') as pool:
+        assert not pool.started
+        pool.map(_loaded, range(8))
+        started = pool._pool
+        pids = {process.pid for process in started._pool}
+        pool.map(_loaded, range(8))
+        assert pool.started
+        # The same pool, with the same worker processes, for both calls
+        assert pool._pool is started
+        assert {process.pid for process in pool._pool._pool} == pids
+
+    assert not pool.started
+
+
+def test_fork_shares_models_loaded_in_parent():
+    models = len(model_store.model_files())
+    with workers.WorkerPool(processes=2, start_method='fork') as pool:
+        loaded = pool.map(_loaded, range(4))
+        # Loaded once, by the parent, before forking
+        assert len(model_store._MODELS) == models
+
+    assert all(count == models for _, count in loaded)
+
+
+def test_spawn_warms_each_worker():
+    with workers.WorkerPool(processes=1, types=['abono'], start_method='spawn') as pool:
+        loaded = pool.map(_loaded, range(2))
+
+    assert not model_store._MODELS
+    # The abono model and segmentation model
+    assert all(count == 2 for _, count in loaded)
+
+
+def test_warm_loads_only_models_of_types():
+    workers.warm(['nomeacao', 'licitacao', 'retificacoes'])
+
+    assert sorted(os.path.relpath(path, model_store.MODELS_PATH)
+                  for path in model_store._MODELS) == [
+        'models/comissionados_nome.pkl', 'models/modelo_licitacao.pkl',
+        'seg_models/comissionados_nome.pkl']
+
+
+def test_borrow_keeps_given_pool_open():
+    pool = workers.WorkerPool(processes=1, start_method='fork')
+    with workers.borrow(pool) as borrowed:
+        assert borrowed is pool
+        borrowed.map(_loaded, range(2))
+    assert pool.started
+    pool.close()
+
+    with workers.borrow(processes=1) as owned:
+        owned.map(_loaded, range(2))
+        assert owned.started
+    assert not owned.started
@@ -4,6 +4,7 @@ import shutil
 
 from glob import glob
 from dodfminer.extract.pure.core import ContentExtractor
+from dodfminer.extract.pure.utils import block_store
 
 EXPECTED_EXTRACTED_TEXT = "BRASILIA - DF, QUINTA-FEIRA, 2 DE JANEIRO DE 2020"
 DODF_FILE_PATH = file = "" + \
@@ -149,3 +150,41 @@ def test_pure_struct_subfolders_in_current_folder():
 
     txt_path = ContentExtractor._struct_subfolders(path, False, folder)
     assert txt_path == "./results/txt/DODF 011 16-01-2019.txt"
+
+
+def test_pure_extract_text_page_ranges():
+    pdf_file = os.path.dirname(__file__) + "/support/03-12-2018.pdf"
+
+    sequential = ContentExtractor.extract_text(pdf_file, block=True)
+    parallel = ContentExtractor.extract_text(pdf_file, block=True, processes=3)
+
+    assert parallel == sequential
+
+
+def test_pure_extract_plain_text():
+    text = ContentExtractor.extract_plain_text(DODF_FILE_PATH)
+
+    assert text == ContentExtractor.extract_text(DODF_FILE_PATH)
+    assert text.file_name == DODF_FILE_PATH
+
+
+def test_pure_extract_blocks_single():
+    blocks_file_path = DODF_FILE_PATH.replace(".pdf", ".blocks")
+
+    ContentExtractor.extract_blocks(DODF_FILE_PATH, single=True)
+
+    assert os.path.isfile(blocks_file_path)
+    with block_store.BlockStore(blocks_file_path) as store:
+        assert len(store.blocks()) == len(
+            ContentExtractor.extract_text(DODF_FILE_PATH, block=True))
+
+    os.remove(blocks_file_path)
+
+
+def test_pure_extract_to_blocks():
+    folder = ""+os.path.dirname(__file__)+"/support/dodf_pdfs"
+    res_folder = folder + '/results/blocks/2020/01_Janeiro/'
+    ContentExtractor.extract_to_blocks(folder)
+    assert os.path.isdir(res_folder)
+    assert len(glob(res_folder+'*.blocks')) > 1
+    shutil.rmtree(folder + '/results/')
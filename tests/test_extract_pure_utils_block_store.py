@@ -0,0 +1,63 @@
+import os
+import json
+import pytest
+
+from dodfminer.extract.pure.utils import block_store
+
+PAGES = [
+    [(10.5, 55.25, 300.0, 80.0, "SECAO I"),
+     (10.5, 90.0, 300.0, 120.0, "NOMEAR JOSE ANTONIO, Tecnico")],
+    [],
+    [(320.0, 100.0, 600.0, 140.0, "Órgão: Secretaria de Educação")],
+]
+
+
+@pytest.fixture(name='store_path')
+def fixture_store_path(tmp_path):
+    path = os.path.join(tmp_path, 'dodf' + block_store.BLOCKS_EXTENSION)
+    block_store.write_blocks(path, PAGES)
+    return path
+
+
+def test_block_store_pages(store_path):
+    with block_store.BlockStore(store_path) as store:
+        assert store.page_count == 3
+        assert len(store) == 3
+        assert store.page(0) == PAGES[0]
+        assert store.page(1) == []
+        assert store.page(2) == PAGES[2]
+        assert store.text(2) == "Órgão: Secretaria de Educação"
+
+
+def test_block_store_blocks(store_path):
+    with block_store.BlockStore(store_path) as store:
+        assert store.blocks() == [block for page in PAGES for block in page]
+        assert store.coords.dtype.name == 'float32'
+        assert store.coords.shape == (3, 4)
+
+
+def test_block_store_read_text(store_path):
+    assert block_store.read_text(store_path) == \
+        "SECAO I NOMEAR JOSE ANTONIO, Tecnico Órgão: Secretaria de Educação "
+
+
+def test_block_store_invalid_file(tmp_path):
+    path = os.path.join(tmp_path, 'invalid.blocks')
+    with open(path, 'wb') as file:
+        file.write(b'\0' * 64)
+    with pytest.raises(ValueError):
+        block_store.BlockStore(path)
+
+
+def test_block_store_json_round_trip(store_path, tmp_path):
+    json_path = os.path.join(tmp_path, 'dodf.json')
+    blocks_path = os.path.join(tmp_path, 'converted.blocks')
+
+    block_store.blocks_to_json(store_path, json_path)
+    block_store.json_to_blocks(json_path, blocks_path)
+
+    with open(json_path, encoding='utf-8') as file:
+        assert len(json.load(file)) == 3
+    with block_store.BlockStore(blocks_path) as store:
+        assert store.page_count == 1
+        assert store.blocks() == [block for page in PAGES for block in page]
@@ -87,3 +87,22 @@ def test_get_doc_img_boxes(pdf_fitz):
             len(tuplefy(ground_truth))
             == len(tuplefy(box_extractor.get_doc_img_boxes(pdf_fitz)))
         )
+
+
+def test_doc_image_boxes_lazy(pdf_fitz):
+    img_boxes = box_extractor.DocImageBoxes(pdf_fitz)
+
+    assert len(img_boxes) == len(pdf_fitz)
+    assert img_boxes[0] == [pdf_fitz[0].get_image_bbox(img[:9] + (0,))
+                            for img in pdf_fitz[0].get_images(full=True)]
+    assert img_boxes[0] is img_boxes[0]
+    assert img_boxes[-1] is img_boxes[len(pdf_fitz) - 1]
+
+
+def test_doc_image_boxes_page_without_images(pdf_fitz):
+    img_boxes = box_extractor.DocImageBoxes(pdf_fitz)
+
+    assert not img_boxes.has_images(7)
+    assert img_boxes[7] == []
+    with pytest.raises(IndexError):
+        img_boxes[len(pdf_fitz)]
@@ -0,0 +1,56 @@
+import os
+from pathlib import Path
+import fitz
+
+from dodfminer.extract.pure.utils import layout
+
+SUPPORT_PATH = Path(os.path.dirname(__file__))/'support'
+
+WIDTH, HEIGHT = 600.0, 800.0
+
+
+def _page(number):
+    return [
+        (40.0, 38.4, 560.0, 53.1, f"PAGINA {number}\nDiario Oficial"),
+        (40.0, 60.0 + number, 290.0, 400.0, "left column"),
+        (310.0, 54.0, 560.0, 700.0, "right column"),
+        (190.0, 774.8, 400.0, 783.9, "Documento assinado digitalmente"),
+    ]
+
+
+def test_learn_profile_bands_and_column():
+    profile = layout.learn_profile([_page(idx) for idx in range(5)],
+                                   WIDTH, HEIGHT)
+
+    assert profile.is_margin(_page(9)[0])
+    assert profile.is_margin(_page(9)[3])
+    assert not profile.is_margin(_page(9)[1])
+    assert not profile.is_margin(_page(9)[2])
+    assert profile.column_split(WIDTH) == 300.0
+
+
+def test_learn_profile_single_page_falls_back():
+    profile = layout.learn_profile([_page(1)], WIDTH, HEIGHT)
+
+    assert profile == layout.LayoutProfile(column_x=None)
+    assert profile.is_margin((0, 55.5, 10, 60, "header"))
+    assert profile.is_margin((0, 881.3, 10, 890, "footer"))
+    assert not profile.is_margin((0, 56.0, 10, 60, "text"))
+    assert profile.column_split(WIDTH) == WIDTH / 2
+
+
+def test_get_profile_cached_by_fingerprint():
+    layout._PROFILES.clear()
+    path = (SUPPORT_PATH/'03-04-2020_marked.pdf').as_posix()
+    copy_path = (SUPPORT_PATH/'03-04-2020_marked (copy 1).pdf').as_posix()
+
+    with fitz.open(path) as doc:
+        profile = layout.get_profile(doc)
+        boxes = doc[2].get_text('blocks', flags=0)
+    with fitz.open(copy_path) as doc:
+        assert layout.get_profile(doc) is profile
+
+    kept = [box[4] for box in boxes if not profile.is_margin(box)]
+    assert not any(text.startswith('PÁGINA 3') for text in kept)
+    assert not any(text.startswith('Documento assinado') for text in kept)
+    assert 'CONSELHO FISCAL\n' in kept
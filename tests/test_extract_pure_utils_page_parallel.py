@@ -0,0 +1,30 @@
+import os
+from pathlib import Path
+import pytest
+import fitz
+
+from dodfminer.extract.pure.utils import box_extractor
+from dodfminer.extract.pure.utils import page_parallel
+
+PDF_PATH = Path(os.path.dirname(__file__))/'support'/'03-12-2018.pdf'
+
+
+@pytest.mark.parametrize("page_count,processes", [
+    (1, 1), (7, 4), (99, 1), (99, 4), (500, 8),
+])
+def test_split_page_ranges_covers_all_pages(page_count, processes):
+    ranges = page_parallel.split_page_ranges(page_count, processes)
+
+    pages = [page for start, stop in ranges for page in range(start, stop)]
+    assert pages == list(range(page_count))
+
+
+def test_split_page_ranges_empty():
+    assert page_parallel.split_page_ranges(0, 4) == []
+
+
+def test_get_doc_text_boxes_same_as_sequential():
+    with fitz.open(PDF_PATH.as_posix()) as doc:
+        sequential = box_extractor.get_doc_text_boxes(doc)
+
+    assert page_parallel.get_doc_text_boxes(PDF_PATH.as_posix(), 3) == sequential
@@ -186,6 +186,14 @@ def test_group_by_column(elements_and_width, elements_expected):
     assert stuplefy(grouped) == stuplefy(elements_expected)
 
 
+def test_group_by_column_learned_split(elements_and_width):
+    elements, width = elements_and_width
+    left, right = title_extractor.group_by_column(elements, width, column_x=250)
+
+    assert [i.bbox.x0 for i in left] == [100, 200]
+    assert len(right) == len(elements) - 2
+
+
 @pytest.fixture(name='elements_page')
 def fixture_elements_page():
     return [
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+
+HEAVY = ('pandas', 'numpy', 'sklearn', 'nltk', 'fitz', 'lxml', 'sklearn_crfsuite')
+
+
+def _imported(code):
+    """Top-level modules imported, and the total time in us, running the code."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, check=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_run_does_not_import_the_extraction_stack():
+    modules = _imported('import dodfminer.run')
+    assert not [name for name in HEAVY if name in modules]
+    assert modules['dodfminer.run'] < 500000
+
+
+def test_cli_help_does_not_import_the_extraction_stack():
+    code = ("import sys\n"
+            "from dodfminer.run import Miner\n"
+            "sys.argv = ['dodfminer', 'extract', '--help']\n"
+            "try:\n"
+            "    Miner()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "assert not [name for name in %r if name in sys.modules]\n" % (HEAVY,))
+    subprocess.run([sys.executable, '-c', code], capture_output=True, check=True)
+
+
+def test_package_entry_points_are_lazy():
+    import dodfminer
+    from dodfminer.extract.polished.core import ActsExtractor
+
+    assert dodfminer.ActsExtractor is ActsExtractor
+    assert 'ContentExtractor' in dir(dodfminer)
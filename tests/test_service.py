@@ -0,0 +1,96 @@
+import threading
+from pathlib import Path
+
+import pytest
+from dodfminer.extract.pure.core import ContentExtractor, DODFText
+from dodfminer.service import ExtractionService, ServiceClient, records
+from tests.helpers.documents import JSON, PDF, TEXT, TYPES, expected_acts
+
+
+@pytest.fixture(name='service')
+def fixture_service():
+    with ExtractionService(types=TYPES, port=0, max_wait=0.2).start() as service:
+        yield service
+
+
+def _expected(document, types=TYPES):
+    return {act_type: records(data_frame)
+            for act_type, data_frame in expected_acts(document, types).items()}
+
+
+def test_service_extracts_text(service):
+    client = ServiceClient(service.address)
+    result = client.extract(TEXT.read_text(), 'text/plain', name='valid.txt')
+
+    assert result['name'] == 'valid.txt'
+    assert result['acts'] == _expected(DODFText(TEXT.read_text(), 'valid.txt'))
+    assert len(result['acts']['nomeacao']) > 0
+
+
+def test_service_extracts_json_and_pdf(service):
+    client = ServiceClient(service.address)
+    result = client.extract(JSON.read_bytes(), 'application/json', types=['exoneracao'],
+                            name='dodf.json')
+    assert result['acts'] == _expected(str(JSON), ['exoneracao'])
+
+    result = client.extract(PDF.read_bytes(), 'application/pdf', types=['nomeacao'],
+                            name=PDF.name)
+    assert result['acts'] == _expected(ContentExtractor.extract_plain_text(str(PDF)), ['nomeacao'])
+
+
+def test_service_batches_concurrent_requests(service):
+    client = ServiceClient(service.address)
+    text = TEXT.read_text()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.extract(text)))
+               for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    health = client.health()
+    assert len(results) == 6
+    assert all(result == results[0] for result in results)
+    assert health['requests'] == 6
+    assert health['batches'] < 6
+
+
+def test_service_fails_only_bad_documents_of_batch(service):
+    client = ServiceClient(service.address)
+    results, errors = [], []
+
+    def extract(body):
+        try:
+            results.append(client.extract(body, 'application/json', types=['exoneracao'],
+                                          name='dodf.json'))
+        except RuntimeError as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=extract, args=(body,))
+               for body in (JSON.read_bytes(), b'{not json', JSON.read_bytes())]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 1
+    assert [result['acts'] for result in results] == [_expected(str(JSON), ['exoneracao'])] * 2
+
+
+def test_service_rejects_bad_requests(service):
+    client = ServiceClient(service.address)
+    with pytest.raises(RuntimeError, match='400'):
+        client.extract('text', types=['unknown'])
+    with pytest.raises(RuntimeError, match='400'):
+        client.extract('text', content_type='image/png')
+
+
+def test_service_on_unix_socket(tmp_path):
+    path = str(tmp_path/'dodfminer.sock')
+    with ExtractionService(types=['nomeacao'], unix_socket=path).start() as service:
+        client = ServiceClient(service.address)
+        assert client.health()['types'] == ['nomeacao']
+        result = client.extract(TEXT.read_text())
+    assert result['acts'] == _expected(DODFText(TEXT.read_text(), 'document'), ['nomeacao'])
+    assert not Path(path).exists()
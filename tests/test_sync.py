@@ -0,0 +1,73 @@
+import os
+import time
+from pathlib import Path
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from dodfminer.downloader.core import Downloader
+from dodfminer.extract.polished.backend import model_store
+from dodfminer.sync import SyncPipeline, extract_pdf_acts
+from tests.helpers.http_server import LocalServer
+
+SUPPORT = Path(os.path.dirname(__file__))/'support'/'polished'
+NAMES = ['DODF 001 01-01-2019 EDICAO ESPECIAL', 'DODF 001 02-01-2019']
+
+
+def _serve_links(downloader, server, names):
+    links = {name: [f'{server.url}/{idx}.pdf'] for idx, name in enumerate(names)}
+    downloader._crawler.crawl = lambda months: {
+        f'{year}/{month}': links for year, month in months}
+
+
+def test_sync_pipeline_extracts_downloaded_pdfs(tmp_path):
+    files = {f'/{idx}.pdf': (SUPPORT/f'{name}.pdf').read_bytes()
+             for idx, name in enumerate(NAMES)}
+    with LocalServer(files) as server:
+        downloader = Downloader(save_path=str(tmp_path))
+        _serve_links(downloader, server, NAMES)
+        pipeline = SyncPipeline(downloader, ['nomeacao'], workers=2)
+        data_frames = pipeline.run('01/2019', '01/2019', out_path=str(tmp_path))
+
+    expected = [extract_pdf_acts(str(SUPPORT/f'{name}.pdf'), ['nomeacao'],
+                                 'regex')['nomeacao'] for name in NAMES]
+    expected = pd.concat([frame for frame in expected if not frame.empty],
+                         ignore_index=True)
+    assert_frame_equal(data_frames['nomeacao'], expected)
+    assert (tmp_path/'nomeacao.csv').exists()
+
+    stats = pipeline.stats()
+    assert stats['download']['items'] == 2
+    assert stats['extract']['items'] == 2
+    assert stats['extract']['bytes'] == sum(len(body) for body in files.values())
+
+
+def test_sync_pipeline_processes_share_parent_models(tmp_path):
+    model_store.clear()
+    files = {'/0.pdf': (SUPPORT/f'{NAMES[0]}.pdf').read_bytes()}
+    with LocalServer(files) as server:
+        downloader = Downloader(save_path=str(tmp_path))
+        _serve_links(downloader, server, NAMES[:1])
+        pipeline = SyncPipeline(downloader, ['nomeacao'], workers=1, processes=True)
+        data_frames = pipeline.run('01/2019', '01/2019')
+
+    # The nomeacao models, loaded by this process before the workers were forked
+    assert len(model_store._MODELS) == 2
+    model_store.clear()
+    expected = extract_pdf_acts(str(SUPPORT/f'{NAMES[0]}.pdf'), ['nomeacao'], 'regex')
+    assert_frame_equal(data_frames['nomeacao'], expected['nomeacao'])
+
+
+def test_sync_pipeline_backpressure(tmp_path):
+    names = [f'DODF 00{idx} 0{idx}-01-2019' for idx in range(1, 7)]
+    files = {f'/{idx}.pdf': b'%PDF-1.4\n%%EOF\n' for idx in range(len(names))}
+    with LocalServer(files) as server:
+        downloader = Downloader(save_path=str(tmp_path), max_workers=4)
+        _serve_links(downloader, server, names)
+        pipeline = SyncPipeline(downloader, ['nomeacao'], workers=1,
+                                queue_size=1)
+        pipeline._extract = lambda path: time.sleep(0.05) or {'nomeacao': pd.DataFrame()}
+        pipeline.run('01/2019', '01/2019')
+
+    stats = pipeline.stats()
+    assert pipeline.max_queued <= 1
+    assert stats['extract']['items'] == len(names)
+    assert stats['download']['waiting'] > 0